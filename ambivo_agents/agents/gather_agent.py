@@ -1,7 +1,16 @@
 # ambivo_agents/agents/gather_agent.py
+import asyncio
+import hashlib
 import json
 import logging
+import re
+import sqlite3
+import time
 import uuid
+import weakref
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -29,6 +38,77 @@ try:
 except ImportError:
     REQUESTS_AVAILABLE = False
 
+# Punctuation/symbols stripped when matching natural-language replies against the cache
+_NON_WORD_RE = re.compile(r"[^\w\s]+")
+
+# Replies that open with an unambiguous yes/no cue are classified without the LLM
+_YES_CUE_RE = re.compile(
+    r"^\W*(?:yes|yeah|yep|yup|absolutely|definitely|certainly|sure|of course|correct|indeed)\b",
+    re.IGNORECASE,
+)
+_NO_CUE_RE = re.compile(
+    r"^\W*(?:no(?!\s+idea)|nope|nah|never|not really|not at all|negative)\b", re.IGNORECASE
+)
+# Leading "no"/"never" idioms that usually introduce agreement ("No problem, we do")
+_NO_IDIOM_RE = re.compile(
+    r"^\W*(?:no\s+(?:problem|doubt|worries|worry|issue|question|kidding)|never\s+(?:had|an?\s+issue|a\s+problem))\b",
+    re.IGNORECASE,
+)
+# Affirmative words anywhere in the reply; a reply mixing them with a no cue goes to the LLM
+_YES_WORD_RE = re.compile(
+    r"\b(?:yes|yeah|yep|yup|absolutely|definitely|certainly|of course|we do|i do)\b",
+    re.IGNORECASE,
+)
+_NEGATION_RE = re.compile(r"\b(?:not|no|never)\b|n't\b", re.IGNORECASE)
+# Exclusions make literal option mentions unreliable ("all except Azure")
+_OPTION_VETO_RE = re.compile(
+    r"\b(?:not|no|never|except|without|but|instead|other than)\b|n't\b", re.IGNORECASE
+)
+
+# Control words and strict yes/no replies, matched against the stripped, lower-cased reply
+_FINISH_COMMANDS = frozenset({"finish", "submit", "done"})
+_ABORT_COMMANDS = frozenset({"cancel", "abort", "stop"})
+_YES_REPLIES = frozenset({"yes", "y", "true"})
+_NO_REPLIES = frozenset({"no", "n", "false"})
+
+
+def _choices_key(q: Dict[str, Any]) -> Tuple[Tuple[Any, Any], ...]:
+    """Hashable (value, label) pairs for a question's options."""
+    return tuple((c.get("value"), c.get("label")) for c in q.get("answer_option_dict_list") or [])
+
+
+@lru_cache(maxsize=256)
+def _choice_lookup(choices: Tuple[Tuple[Any, Any], ...]) -> Dict[str, Any]:
+    """Lower-cased value/label -> option value; a value wins over an equal label."""
+    lookup = {str(label).lower(): value for value, label in choices}
+    lookup.update({str(value).lower(): value for value, _ in choices})
+    return lookup
+
+
+@lru_cache(maxsize=256)
+def _folded_choices(choices: Tuple[Tuple[Any, Any], ...]) -> Tuple[Tuple[Tuple[str, ...], Any], ...]:
+    """Space-padded folded label/value forms per option, for whole-word reply matching.
+
+    Single-character and purely numeric names are left out: "a" or "3" turn up in
+    unrelated replies ("I want a refund"), so those options are left to the LLM.
+    """
+    folded = []
+    for value, label in choices:
+        names = (" ".join(_NON_WORD_RE.sub(" ", str(n or "").lower()).split()) for n in (label, value))
+        folded.append(
+            (tuple(f" {n} " for n in names if len(n) > 1 and not n.replace(" ", "").isdigit()), value)
+        )
+    return tuple(folded)
+
+
+def _for_choices(builder, q: Dict[str, Any]):
+    """Apply a cached per-options builder, bypassing the cache for unhashable option values."""
+    key = _choices_key(q)
+    try:
+        return builder(key)
+    except TypeError:
+        return builder.__wrapped__(key)
+
 
 class GatherAgent(BaseAgent):
     """
@@ -57,12 +137,17 @@ class GatherAgent(BaseAgent):
         submission_method: "POST"
         submission_headers: {"Authorization": "Bearer ..."}
         memory_ttl_seconds: 3600
+        nl_answer_cache_size: 512   # reuse natural-language extractions (0 disables)
+        nl_answer_cache_path: null  # e.g. ~/.ambivo/cache/gather_answers.sqlite to reuse across runs
+        background_submission: false  # queue submissions; the reply reports "queued"
 
     State is stored in memory per session and reset after memory_ttl_seconds (default 1h).
 
     How to provide the questionnaire:
       - Paste JSON or YAML in the chat
       - Or send a file path/URL; the agent will read and parse it using BaseAgent utilities.
+      - Or, from code, pass an already-parsed dict/list to ``await agent.load_questionnaire(...)``;
+        the next message then gets the first question.
 
     Expected questionnaire schema (minimal):
       {
@@ -83,6 +168,23 @@ class GatherAgent(BaseAgent):
       }
     """
 
+    # Static system messages for the LLM helpers. Per-turn data (question, reply,
+    # gathered answers) only ever goes in the user prompt, so these prefixes stay
+    # byte-identical and hit the providers' prompt caches on every turn.
+    EXTRACTION_SYSTEM_MESSAGE = (
+        "You are a precise data extraction assistant. Extract structured answers from natural "
+        "language. Respond only with JSON."
+    )
+    VALIDATION_SYSTEM_MESSAGE = (
+        "You are a strict validator for a form-filling assistant. Determine if the user's answer fully satisfies the"
+        " question and its requirements. Respond ONLY in JSON with keys: sufficient (boolean) and feedback (string)."
+        " If insufficient, feedback must clearly state what is missing in 1-2 short sentences."
+    )
+
+    # Bounds for the negative cache of unmappable natural-language replies
+    NL_FAILURE_CACHE_SIZE = 128
+    NL_FAILURE_TTL_SECONDS = 300
+
     DEFAULT_SYSTEM_MESSAGE = (
         "You are GatherAgent, a conversational form assistant. "
         "Your job is to ask the user the next question from a provided questionnaire, "
@@ -135,6 +237,24 @@ class GatherAgent(BaseAgent):
         self.enable_natural_language_parsing: bool = bool(
             cfg.get("enable_natural_language_parsing", False)
         )
+        # Optionally hand submissions to a background worker so replies don't wait on HTTP
+        self.background_submission: bool = bool(cfg.get("background_submission", False))
+        self._submission_queue: Optional[asyncio.Queue] = None
+        self._submission_worker_task: Optional[asyncio.Task] = None
+        # Pooled aiohttp session per event loop, reused for every submission on that
+        # loop: {"session": ClientSession, "closer": shutdown hook}; see _get_http_session
+        self._http_sessions: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+        # LRU of successful natural-language extractions; paraphrased retries reuse them
+        self.nl_answer_cache_size: int = int(cfg.get("nl_answer_cache_size", 512))
+        self._nl_answer_cache: "OrderedDict[Tuple, Any]" = OrderedDict()
+        # Optional sqlite file backing the answer cache across runs (opened lazily)
+        self.nl_answer_cache_path: Optional[str] = cfg.get("nl_answer_cache_path")
+        self._nl_answer_store: Optional[sqlite3.Connection] = None
+        # Replies the LLM answered but could not map: reply key -> (failed_at, error);
+        # retyping one within the TTL fails again without another call
+        self._nl_failure_cache: "OrderedDict[Tuple, Tuple[float, Optional[str]]]" = OrderedDict()
+        # Optional pre-rendered prompts keyed by question_id (for static questionnaires)
+        self.prompt_cache: Dict[str, str] = dict(cfg.get("prompt_cache") or {})
 
     # -------- State Management --------
     def _state_key(self, session_id: str) -> str:
@@ -231,6 +351,26 @@ class GatherAgent(BaseAgent):
         norm = [GatherAgent._normalize_question(q) for q in questions]
         return {"questions": norm}
 
+    async def load_questionnaire(self, questionnaire: Any) -> Dict[str, Any]:
+        """Start a gather session from an already-parsed questionnaire.
+
+        Skips the JSON round-trip of pasting the questionnaire into the chat.
+        Any previous session state is replaced; the next message is answered
+        with the first question.
+
+        Args:
+            questionnaire: Dict with a 'questions' list, or a list of questions.
+
+        Returns:
+            The normalized questionnaire.
+
+        Raises:
+            ValueError: If the questionnaire shape is not recognized.
+        """
+        normalized = self._normalize_questionnaire(questionnaire)
+        await self._save_state({"questionnaire": normalized, "answers": {}, "asked": []})
+        return normalized
+
     async def _try_parse_questionnaire_from_message(
         self, user_text: str
     ) -> Optional[Dict[str, Any]]:
@@ -381,6 +521,17 @@ class GatherAgent(BaseAgent):
 
     def _format_question_prompt(self, q: Dict[str, Any]) -> str:
         """Format a question dict into a user-facing prompt string with choices if applicable."""
+        cached = self.prompt_cache.get(str(q.get("question_id")))
+        if cached is not None:
+            return cached
+        return self.render_question_prompt(q)
+
+    @staticmethod
+    def render_question_prompt(q: Dict[str, Any]) -> str:
+        """Render the prompt for a question without consulting the prompt cache.
+
+        Useful for pre-building a ``gather.prompt_cache`` from a static questionnaire.
+        """
         qtext = q.get("text", "")
         qtype = (q.get("type") or "free-text").lower()
         choices = q.get("answer_option_dict_list") or []
@@ -395,14 +546,299 @@ class GatherAgent(BaseAgent):
         else:
             return qtext
 
+    @staticmethod
+    def _nl_answer_cache_key(q: Dict[str, Any], user_text: str) -> Tuple:
+        """Key an extraction on the question's shape and the case/punctuation-folded reply."""
+        choices = q.get("answer_option_dict_list") or []
+        folded = " ".join(_NON_WORD_RE.sub(" ", user_text.lower()).split())
+        return (
+            (q.get("type") or "free-text").lower(),
+            q.get("text", ""),
+            tuple(str(c.get("value")) for c in choices),
+            folded,
+        )
+
+    @staticmethod
+    def _fast_yes_no(user_text: str) -> Optional[str]:
+        """Classify replies like "Absolutely!" or "Nope" locally; None means ask the LLM.
+
+        A leading yes cue is ignored when the reply also contains a negation
+        ("Sure, but not yet"), and a leading no cue when it is an idiom or the
+        reply also affirms ("No problem, we do"), so only clear-cut answers skip
+        the LLM.
+        """
+        if _NO_CUE_RE.match(user_text):
+            if _NO_IDIOM_RE.match(user_text) or _YES_WORD_RE.search(user_text):
+                return None
+            return "No"
+        if _YES_CUE_RE.match(user_text) and not _NEGATION_RE.search(user_text):
+            return "Yes"
+        return None
+
+    @staticmethod
+    def _fast_option_match(q: Dict[str, Any], user_text: str) -> Any:
+        """Map replies that literally name options ("email please") without the LLM.
+
+        An option matches when its folded label or value appears as whole words in
+        the folded reply. Single-select needs exactly one match; multi-select takes
+        every match in option order. Returns None (ask the LLM) otherwise, or when
+        the reply contains an exclusion such as "except" or "not".
+        """
+        if _OPTION_VETO_RE.search(user_text):
+            return None
+        reply = f" {' '.join(_NON_WORD_RE.sub(' ', user_text.lower()).split())} "
+        matched = [
+            value
+            for names, value in _for_choices(_folded_choices, q)
+            if any(name in reply for name in names)
+        ]
+        if not matched:
+            return None
+        if (q.get("type") or "").lower() == "single-select":
+            return matched[0] if len(matched) == 1 else None
+        return matched
+
+    def prime_nl_answer_cache(self, q: Dict[str, Any], answers: Dict[str, Any]) -> int:
+        """Preload known reply -> answer mappings for a question in one pass.
+
+        Args:
+            q: The question the replies belong to.
+            answers: Mapping of natural-language reply to its structured answer.
+
+        Returns:
+            Number of cache entries written.
+        """
+        if self.nl_answer_cache_size <= 0:
+            return 0
+        entries = {
+            self._nl_answer_cache_key(q, text): list(ans) if isinstance(ans, list) else ans
+            for text, ans in answers.items()
+            if ans is not None
+        }
+        self._nl_answer_cache.update(entries)
+        while len(self._nl_answer_cache) > self.nl_answer_cache_size:
+            self._nl_answer_cache.popitem(last=False)
+        return len(entries)
+
+    def _answer_store(self) -> Optional[sqlite3.Connection]:
+        """Open the on-disk answer cache on first use; None when not configured or unusable."""
+        if self._nl_answer_store is None and self.nl_answer_cache_path:
+            try:
+                path = Path(self.nl_answer_cache_path).expanduser()
+                path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(str(path), isolation_level=None)
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS nl_answers (key TEXT PRIMARY KEY, answer TEXT NOT NULL)"
+                )
+                self._nl_answer_store = conn
+            except Exception as e:
+                self.logger.warning(f"Persistent answer cache disabled: {e}")
+                self.nl_answer_cache_path = None
+        return self._nl_answer_store
+
+    @staticmethod
+    def _stored_answer_key(key: Tuple) -> str:
+        """Content hash of an answer cache key, used as the on-disk row key."""
+        return hashlib.blake2b(json.dumps(key).encode(), digest_size=16).hexdigest()
+
+    def _lookup_answer_locally(self, q: Dict[str, Any], user_text: str) -> Any:
+        """Resolve a reply from the rule-based matchers or the answer cache; None if unknown."""
+        qtype = (q.get("type") or "free-text").lower()
+        if qtype == "yes-no":
+            fast = self._fast_yes_no(user_text)
+            if fast is not None:
+                return fast
+        elif qtype in ("single-select", "multi-select"):
+            fast = self._fast_option_match(q, user_text)
+            if fast is not None:
+                return fast
+        if self.nl_answer_cache_size <= 0:
+            return None
+        key = self._nl_answer_cache_key(q, user_text)
+        cached = self._nl_answer_cache.get(key)
+        if cached is None:
+            store = self._answer_store()
+            if store is None:
+                return None
+            row = store.execute(
+                "SELECT answer FROM nl_answers WHERE key = ?", (self._stored_answer_key(key),)
+            ).fetchone()
+            if row is None:
+                return None
+            cached = json.loads(row[0])
+            self._nl_answer_cache[key] = cached
+            if len(self._nl_answer_cache) > self.nl_answer_cache_size:
+                self._nl_answer_cache.popitem(last=False)
+        self._nl_answer_cache.move_to_end(key)
+        return list(cached) if isinstance(cached, list) else cached
+
+    def _remember_answer(self, q: Dict[str, Any], user_text: str, answer: Any) -> None:
+        """Cache a successful extraction, evicting the least recently used entry."""
+        if self.nl_answer_cache_size <= 0 or answer is None:
+            return
+        key = self._nl_answer_cache_key(q, user_text)
+        self._nl_answer_cache[key] = list(answer) if isinstance(answer, list) else answer
+        if len(self._nl_answer_cache) > self.nl_answer_cache_size:
+            self._nl_answer_cache.popitem(last=False)
+        store = self._answer_store()
+        if store is not None:
+            try:
+                store.execute(
+                    "INSERT OR REPLACE INTO nl_answers (key, answer) VALUES (?, ?)",
+                    (self._stored_answer_key(key), json.dumps(answer)),
+                )
+            except Exception as e:
+                self.logger.debug(f"Failed to persist extracted answer: {e}")
+
     async def _extract_answer_with_llm(
         self, q: Dict[str, Any], user_text: str
+    ) -> Tuple[bool, Any, str]:
+        """Extract a structured answer, reusing earlier extractions of the same reply.
+
+        Successful extractions are cached. A reply the LLM answered but that maps
+        to no valid answer is not re-asked for NL_FAILURE_TTL_SECONDS; LLM errors
+        are never cached, so a failed or flaky call is retried on the next attempt.
+        """
+        qtype = (q.get("type") or "free-text").lower()
+        if qtype != "free-text":
+            local = self._lookup_answer_locally(q, user_text)
+            if local is not None:
+                return True, local, ""
+        if qtype == "free-text" or not self.llm_service:
+            return await self._query_llm_for_answer(q, user_text)
+
+        key = self._nl_answer_cache_key(q, user_text)
+        failure = self._nl_failure_cache.get(key)
+        if failure is not None:
+            failed_at, error = failure
+            if time.monotonic() - failed_at < self.NL_FAILURE_TTL_SECONDS:
+                return False, None, error
+            del self._nl_failure_cache[key]
+
+        try:
+            ok, answer, error = await self._query_llm_for_answer(q, user_text, raise_errors=True)
+        except Exception as e:
+            self.logger.warning(f"LLM answer extraction failed: {e}")
+            return False, None, None
+        if ok:
+            self._remember_answer(q, user_text, answer)
+        else:
+            self._nl_failure_cache[key] = (time.monotonic(), error)
+            if len(self._nl_failure_cache) > self.NL_FAILURE_CACHE_SIZE:
+                self._nl_failure_cache.popitem(last=False)
+        return ok, answer, error
+
+    async def extract_answers_batch(self, q: Dict[str, Any], replies: List[str]) -> List[Any]:
+        """Map several independent replies to the same question with at most one LLM call.
+
+        Replies the rule-based matchers or the cache can resolve never reach the
+        LLM; the rest share a single prompt. If that batched reply cannot be
+        parsed, each remaining reply falls back to its own extraction.
+
+        Returns:
+            One parsed answer per reply, in order; None where no answer could be extracted.
+        """
+        qtype = (q.get("type") or "free-text").lower()
+        if qtype == "free-text":
+            return list(replies)
+
+        answers = [self._lookup_answer_locally(q, r) for r in replies]
+        pending = [i for i, a in enumerate(answers) if a is None]
+        if not pending or not self.llm_service:
+            return answers
+
+        extracted = await self._query_llm_for_answers(q, [replies[i] for i in pending])
+        if extracted is None:
+            results = await asyncio.gather(
+                *(self._extract_answer_with_llm(q, replies[i]) for i in pending)
+            )
+            extracted = [answer if ok else None for ok, answer, _ in results]
+
+        for i, answer in zip(pending, extracted):
+            if answer is not None:
+                answers[i] = answer
+                self._remember_answer(q, replies[i], answer)
+        return answers
+
+    async def _query_llm_for_answers(
+        self, q: Dict[str, Any], replies: List[str]
+    ) -> Optional[List[Any]]:
+        """Ask the LLM to map a batch of replies in one call.
+
+        Returns:
+            Validated answers aligned with ``replies`` (None for unmatched entries),
+            or None when the LLM reply is unusable.
+        """
+        qtype = (q.get("type") or "free-text").lower()
+        choices = q.get("answer_option_dict_list") or []
+        if qtype == "yes-no":
+            rule = 'answer "Yes" or "No"'
+            options_block = ""
+        else:
+            rule = (
+                "answer with ONE option value"
+                if qtype == "single-select"
+                else "answer with a list of one or more option values"
+            )
+            options_block = "Available options:\n" + "\n".join(
+                f"- {c.get('label', c.get('value'))}: {c.get('value')}" for c in choices
+            )
+        numbered = "\n".join(f'{n}. "{text}"' for n, text in enumerate(replies, 1))
+        prompt = f"""Extract structured answers from several independent user responses to the same question.
+Question asked: "{q.get('text', '')}"
+{options_block}
+
+Responses:
+{numbered}
+
+For each response, in order, {rule}. Use null when a response does not clearly match.
+Respond with ONLY: {{"answers": [...]}} containing exactly {len(replies)} entries."""
+
+        try:
+            response = await self.llm_service.generate_response(
+                prompt,
+                context={"conversation_history": []},
+                system_message=self.EXTRACTION_SYSTEM_MESSAGE,
+            )
+            response_str = str(response or "")
+            start = response_str.find("{")
+            end = response_str.rfind("}")
+            if start == -1 or end == -1:
+                return None
+            answers = json.loads(response_str[start : end + 1]).get("answers")
+        except Exception as e:
+            self.logger.warning(f"Batched LLM answer extraction failed: {e}")
+            return None
+
+        if not isinstance(answers, list) or len(answers) != len(replies):
+            return None
+        return [
+            a if a is not None and self._is_valid_extracted_answer(qtype, choices, a) else None
+            for a in answers
+        ]
+
+    @staticmethod
+    def _is_valid_extracted_answer(qtype: str, choices: List[Dict[str, Any]], answer: Any) -> bool:
+        """Check an LLM-extracted answer against the question type and choices."""
+        if qtype == "yes-no":
+            return answer in ["Yes", "No"]
+        valid_values = [c.get("value") for c in choices]
+        if qtype == "single-select":
+            return answer in valid_values
+        if qtype == "multi-select":
+            return isinstance(answer, list) and all(a in valid_values for a in answer)
+        return False
+
+    async def _query_llm_for_answer(
+        self, q: Dict[str, Any], user_text: str, raise_errors: bool = False
     ) -> Tuple[bool, Any, str]:
         """Use LLM to extract a structured answer from a natural language response.
 
         Args:
             q: The current question dict.
             user_text: The user's raw response text.
+            raise_errors: Propagate LLM call errors instead of reporting them as
+                an unparsed answer.
 
         Returns:
             Tuple of (success, parsed_answer, error_message). On failure,
@@ -469,7 +905,7 @@ Examples:
             response = await self.llm_service.generate_response(
                 prompt,
                 context={"conversation_history": []},
-                system_message="You are a precise data extraction assistant. Extract structured answers from natural language. Respond only with JSON.",
+                system_message=self.EXTRACTION_SYSTEM_MESSAGE,
             )
 
             # Parse LLM response
@@ -484,20 +920,11 @@ Examples:
                     try:
                         parsed = _json.loads(response_str[start : end + 1])
                         answer = parsed.get("answer")
-                        if answer is not None:
-                            # Validate the answer matches expected format
-                            if qtype == "yes-no" and answer in ["Yes", "No"]:
-                                return True, answer, ""
-                            elif qtype == "single-select":
-                                # Check if answer is valid choice
-                                valid_values = [c.get("value") for c in choices]
-                                if answer in valid_values:
-                                    return True, answer, ""
-                            elif qtype == "multi-select" and isinstance(answer, list):
-                                # Check if all answers are valid choices
-                                valid_values = [c.get("value") for c in choices]
-                                if all(a in valid_values for a in answer):
-                                    return True, answer, ""
+                        # Validate the answer matches expected format
+                        if answer is not None and self._is_valid_extracted_answer(
+                            qtype, choices, answer
+                        ):
+                            return True, answer, ""
                     except Exception:
                         pass
 
@@ -505,6 +932,8 @@ Examples:
             return False, None, None
 
         except Exception as e:
+            if raise_errors:
+                raise
             self.logger.warning(f"LLM answer extraction failed: {e}")
             return False, None, None
 
@@ -522,20 +951,16 @@ Examples:
             return True, user_text, ""
         if qtype == "yes-no":
             val = user_text.lower()
-            if val in ["yes", "y", "true"]:
+            if val in _YES_REPLIES:
                 return True, "Yes", ""
-            if val in ["no", "n", "false"]:
+            if val in _NO_REPLIES:
                 return True, "No", ""
             return False, None, "Please answer Yes or No."
-        choices = q.get("answer_option_dict_list") or []
-        valid_values = {str(c.get("value")).lower(): c.get("value") for c in choices}
-        valid_labels = {str(c.get("label")).lower(): c.get("value") for c in choices}
+        lookup = _for_choices(_choice_lookup, q)
         if qtype == "single-select":
             key = user_text.lower()
-            if key in valid_values:
-                return True, valid_values[key], ""
-            if key in valid_labels:
-                return True, valid_labels[key], ""
+            if key in lookup:
+                return True, lookup[key], ""
             return False, None, f"Please select one of the available choices."
         if qtype == "multi-select":
             parts = [p.strip().lower() for p in user_text.split(",") if p.strip()]
@@ -543,12 +968,9 @@ Examples:
                 return False, None, "Please provide one or more choices, comma-separated."
             mapped = []
             for p in parts:
-                if p in valid_values:
-                    mapped.append(valid_values[p])
-                elif p in valid_labels:
-                    mapped.append(valid_labels[p])
-                else:
+                if p not in lookup:
                     return False, None, f"'{p}' is not a valid option."
+                mapped.append(lookup[p])
             return True, mapped, ""
         # fallback
         return True, user_text, ""
@@ -578,11 +1000,6 @@ Examples:
         # Build a strict validation prompt
         req = q.get("answer_requirements") or "Provide a complete and specific answer."
         qtext = q.get("text") or ""
-        instruction = (
-            "You are a strict validator for a form-filling assistant. Determine if the user's answer fully satisfies the"
-            " question and its requirements. Respond ONLY in JSON with keys: sufficient (boolean) and feedback (string)."
-            " If insufficient, feedback must clearly state what is missing in 1-2 short sentences."
-        )
         user_prompt = (
             f"Question: {qtext}\n"
             f"Requirements: {req}\n"
@@ -594,7 +1011,7 @@ Examples:
             llm_out = await self.llm_service.generate_response(
                 user_prompt,
                 context={"conversation_history": []},
-                system_message=instruction,
+                system_message=self.VALIDATION_SYSTEM_MESSAGE,
             )
             parsed = None
             if llm_out:
@@ -637,34 +1054,36 @@ Examples:
             return {"success": False, "error": "No submission endpoint configured"}
         try:
             if AIOHTTP_AVAILABLE:
-                async with aiohttp.ClientSession() as session:
-                    method = self.submission_method
-                    if method == "POST":
-                        async with session.post(
-                            self.submission_endpoint, json=payload, headers=self.submission_headers
-                        ) as resp:
-                            data = await resp.text()
-                            ok = 200 <= resp.status < 300
-                            return {"success": ok, "status": resp.status, "response": data}
-                    else:
-                        async with session.get(
-                            self.submission_endpoint,
-                            params=payload,
-                            headers=self.submission_headers,
-                        ) as resp:
-                            data = await resp.text()
-                            ok = 200 <= resp.status < 300
-                            return {"success": ok, "status": resp.status, "response": data}
+                session = await self._get_http_session()
+                if self.submission_method == "POST":
+                    async with session.post(
+                        self.submission_endpoint, json=payload, headers=self.submission_headers
+                    ) as resp:
+                        data = await resp.text()
+                        ok = 200 <= resp.status < 300
+                        return {"success": ok, "status": resp.status, "response": data}
+                else:
+                    async with session.get(
+                        self.submission_endpoint,
+                        params=payload,
+                        headers=self.submission_headers,
+                    ) as resp:
+                        data = await resp.text()
+                        ok = 200 <= resp.status < 300
+                        return {"success": ok, "status": resp.status, "response": data}
             elif REQUESTS_AVAILABLE:
+                # requests is blocking; run it on a worker thread
                 if self.submission_method == "POST":
-                    r = requests.post(
+                    r = await asyncio.to_thread(
+                        requests.post,
                         self.submission_endpoint,
                         json=payload,
                         headers=self.submission_headers,
                         timeout=15,
                     )
                 else:
-                    r = requests.get(
+                    r = await asyncio.to_thread(
+                        requests.get,
                         self.submission_endpoint,
                         params=payload,
                         headers=self.submission_headers,
@@ -679,6 +1098,103 @@ Examples:
         except Exception as e:
             return {"success": False, "error": str(e)}
 
+    async def _get_http_session(self):
+        """Return the running loop's pooled aiohttp session, creating it on first use.
+
+        Keep-alive connections are reused across submissions. Sessions are kept
+        per event loop, since connections cannot move between loops; a session
+        left on another loop is closed when that loop shuts down.
+        """
+        loop = asyncio.get_running_loop()
+        slot = self._http_sessions.get(loop)
+        if slot is None:
+            slot = self._http_sessions[loop] = {}
+            # Started async generators are finalized by loop.shutdown_asyncgens(), which
+            # asyncio.run()/Runner call while the loop can still await session.close()
+            slot["closer"] = closer = self._close_session_on_shutdown()
+            try:
+                closer.__anext__().send(None)
+            except StopIteration:
+                pass
+        session = slot.get("session")
+        if session is None or session.closed:
+            session = slot["session"] = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=64, ttl_dns_cache=300, keepalive_timeout=75)
+            )
+        return session
+
+    async def _close_session_on_shutdown(self):
+        """Park until the loop shuts down, then close the session opened on it."""
+        try:
+            yield
+        finally:
+            # Dropping the slot also releases this generator, which references the loop
+            slot = self._http_sessions.pop(asyncio.get_running_loop(), None) or {}
+            session = slot.get("session")
+            if session is not None and not session.closed:
+                await session.close()
+
+    async def _close_http_session(self):
+        """Close the running loop's pooled aiohttp session, if one was opened."""
+        slot = self._http_sessions.get(asyncio.get_running_loop())
+        session = slot.pop("session", None) if slot else None
+        if session is not None and not session.closed:
+            await session.close()
+
+    async def _dispatch_submission(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Submit now, or enqueue for the background worker when background_submission is set."""
+        if not self.background_submission:
+            return await self._submit(payload)
+        if self._submission_queue is None:
+            self._submission_queue = asyncio.Queue()
+        if self._submission_worker_task is None or self._submission_worker_task.done():
+            self._submission_worker_task = asyncio.create_task(self._submission_worker())
+        await self._submission_queue.put(payload)
+        return {"success": True, "status": "queued"}
+
+    async def _submission_worker(self):
+        """Drain queued submissions one at a time, logging failures."""
+        queue = self._submission_queue
+        while True:
+            payload = await queue.get()
+            try:
+                result = await self._submit(payload)
+                if not result.get("success"):
+                    self.logger.warning(
+                        f"Background submission failed: {result.get('status') or result.get('error')}"
+                    )
+            except Exception as e:
+                self.logger.warning(f"Background submission error: {e}")
+            finally:
+                queue.task_done()
+
+    async def flush_submissions(self):
+        """Wait for queued submissions to finish and stop the background worker."""
+        if self._submission_queue is not None:
+            await self._submission_queue.join()
+        if self._submission_worker_task is not None:
+            self._submission_worker_task.cancel()
+            try:
+                await self._submission_worker_task
+            except asyncio.CancelledError:
+                pass
+            self._submission_worker_task = None
+
+    async def cleanup_session(self) -> bool:
+        """Flush pending submissions and release HTTP/cache handles before the base cleanup."""
+        try:
+            await self.flush_submissions()
+        except Exception as e:
+            self.logger.warning(f"Could not flush gather submissions: {e}")
+        try:
+            await self._close_http_session()
+        except Exception as e:
+            self.logger.warning(f"Could not close gather HTTP session: {e}")
+        if self._nl_answer_store is not None:
+            self._nl_answer_store.close()
+            self._nl_answer_store = None
+        return await super().cleanup_session()
+
     # -------- Main message processing --------
     async def process_message(
         self, message: AgentMessage, context: ExecutionContext = None
@@ -710,7 +1226,7 @@ Examples:
 
         # Check for user commands
         lower = user_text.strip().lower()
-        if lower in ("finish", "submit", "done"):
+        if lower in _FINISH_COMMANDS:
             # Decide result status
             required_ids = (
                 [
@@ -732,7 +1248,7 @@ Examples:
                 "answers": answers,
                 "timestamp": datetime.now(timezone.utc).isoformat(),
             }
-            submit_result = await self._submit(payload)
+            submit_result = await self._dispatch_submission(payload)
             await self._clear_state()
             content = (
                 f"Submitting your responses now. Status: {result_status}. "
@@ -746,7 +1262,7 @@ Examples:
                 conversation_id=message.conversation_id,
             )
 
-        if lower in ("cancel", "abort", "stop"):
+        if lower in _ABORT_COMMANDS:
             payload = {
                 "session_id": self.context.session_id,
                 "conversation_id": self.context.conversation_id,
@@ -754,7 +1270,7 @@ Examples:
                 "answers": answers,
                 "timestamp": datetime.now(timezone.utc).isoformat(),
             }
-            submit_result = await self._submit(payload)
+            submit_result = await self._dispatch_submission(payload)
             await self._clear_state()
             content = f"Okay, aborting the gathering. Submission status: {submit_result.get('status') or submit_result.get('error')}"
             return self.create_response(
@@ -823,7 +1339,7 @@ Examples:
                     "answers": answers,
                     "timestamp": datetime.now(timezone.utc).isoformat(),
                 }
-                submit_result = await self._submit(payload)
+                submit_result = await self._dispatch_submission(payload)
                 await self._clear_state()
                 content = (
                     f"We have reached the end of the questionnaire. Status: {result_status}. "
@@ -925,7 +1441,7 @@ Examples:
                 "answers": answers,
                 "timestamp": datetime.now(timezone.utc).isoformat(),
             }
-            submit_result = await self._submit(payload)
+            submit_result = await self._dispatch_submission(payload)
             await self._clear_state()
             content = (
                 f"Thanks, that's all I needed. Status: {result_status}. "
@@ -1855,9 +1855,15 @@ class KnowledgeBaseAgent(BaseAgent, KnowledgeBaseAgentHistoryMixin):
         best_answer = None
         best_kb = None
         best_source_count = -1
-        for kb in selected_kbs:
+        # The KBs are independent, so query them concurrently and consolidate in order
+        results = await asyncio.gather(
+            *(
+                self._query_knowledge_base(kb["kb_name"], query, question_type=question_type)
+                for kb in selected_kbs
+            )
+        )
+        for kb, result in zip(selected_kbs, results):
             name = kb["kb_name"]
-            result = await self._query_knowledge_base(name, query, question_type=question_type)
             per_kb_results[name] = result
             if result.get("success"):
                 srcs = result.get("source_details", [])
@@ -2115,8 +2121,9 @@ class KnowledgeBaseAgent(BaseAgent, KnowledgeBaseAgentHistoryMixin):
     ) -> Dict[str, Any]:
         """Query the knowledge base"""
         try:
-            # Use existing conduct_query method
-            answer, ans_dict_list = self.qdrant_service.conduct_query(
+            # conduct_query blocks on retrieval + synthesis; keep it off the event loop
+            answer, ans_dict_list = await asyncio.to_thread(
+                self.qdrant_service.conduct_query,
                 query=query,
                 kb_name=kb_name,
                 additional_prompt=additional_prompt,
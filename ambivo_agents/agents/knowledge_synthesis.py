@@ -8,8 +8,9 @@ best possible answer is provided to users.
 
 import asyncio
 import json
+import re
 import time
-from typing import Dict, Any, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass
 from enum import Enum
 
@@ -37,6 +38,33 @@ _QUALITY_ORDINALS = {
 }
 
 
+# Phrases that let users steer source selection inline, in precedence order.
+# Matched in one pass by a lookahead alternation, so overlapping phrases are
+# all seen.
+_PREFERENCE_PHRASES = (
+    ("prioritize web search", "web_search"),
+    ("search the web", "web_search"),
+    ("prioritize knowledge base", "knowledge_base"),
+    ("check knowledge base", "knowledge_base"),
+    ("check all sources", "all"),
+    ("comprehensive search", "all"),
+)
+_PREFERENCE_TAGS = dict(_PREFERENCE_PHRASES)
+_PREFERENCE_PATTERN = re.compile(
+    "(?=(" + "|".join(re.escape(phrase) for phrase, _ in _PREFERENCE_PHRASES) + "))",
+    re.IGNORECASE,
+)
+
+
+def _detect_source_preference(message_text: str) -> Optional[str]:
+    """Return 'web_search', 'knowledge_base', 'all' or None for an inline source hint."""
+    tags = {_PREFERENCE_TAGS[m.group(1).lower()] for m in _PREFERENCE_PATTERN.finditer(message_text)}
+    for tag in ("web_search", "knowledge_base", "all"):
+        if tag in tags:
+            return tag
+    return None
+
+
 class SearchStrategy(Enum):
     """Search strategies for information gathering"""
     KNOWLEDGE_FIRST = "knowledge_first"    # Check KB first, then web if needed
@@ -648,7 +676,8 @@ Please provide analysis in JSON format:
     async def process_with_quality_assessment(
         self,
         query: str,
-        user_preferences: Optional[Dict[str, Any]] = None
+        user_preferences: Optional[Dict[str, Any]] = None,
+        on_token: Optional[Callable[[str], Any]] = None
     ) -> Dict[str, Any]:
         """
         Process query with quality assessment and iterative improvement.
@@ -656,6 +685,8 @@ Please provide analysis in JSON format:
         Args:
             query: User's question
             user_preferences: Optional preferences (e.g., {"prioritize": "web_search"})
+            on_token: Optional callback receiving the final answer text as it is
+                generated. Synthesis then runs once, for the kept assessment only
             
         Returns:
             Final response with quality assessment metadata
@@ -673,6 +704,7 @@ Please provide analysis in JSON format:
                 query_analysis.search_strategy = SearchStrategy.KNOWLEDGE_FIRST
         
         best_assessment = None
+        best_responses: List[SourceResponse] = []
         all_responses = []
         iteration = -1
 
@@ -695,12 +727,13 @@ Please provide analysis in JSON format:
                 assessment = await self.assessor.assess_response(
                     query,
                     responses,
-                    user_preferences
+                    user_preferences,
+                    synthesize=on_token is None
                 )
                 
                 # Check if quality is acceptable (use ordinal comparison, not string)
                 if _QUALITY_ORDINALS.get(assessment.quality_level, 0) >= _QUALITY_ORDINALS.get(self.quality_threshold, 0):
-                    best_assessment = assessment
+                    best_assessment, best_responses = assessment, responses
                     break
                 
                 # If not acceptable, try additional sources
@@ -720,7 +753,14 @@ Please provide analysis in JSON format:
                             if scrape_resp:
                                 responses.append(scrape_resp)
                 
-                best_assessment = assessment
+                best_assessment, best_responses = assessment, responses
+        
+        streamed = False
+        if on_token is not None and best_assessment and best_responses:
+            await self.assessor.synthesize_response(
+                query, best_responses, best_assessment, on_token=on_token
+            )
+            streamed = True
         
         # Prepare final response with robust fallback mechanisms
         final_response = ""
@@ -745,6 +785,9 @@ Please provide analysis in JSON format:
                 self.logger.error(f"Fallback to assistant agent failed: {e}")
                 final_response = "I couldn't find sufficient information to answer your question. Please try rephrasing or providing more context."
         
+        if on_token is not None and not streamed:
+            on_token(final_response)
+        
         return {
             'success': True,
             'response': final_response,
@@ -785,13 +828,11 @@ Please provide analysis in JSON format:
 
         user_preferences = kwargs.get('user_preferences', {})
 
-        message_lower = message_text.lower()
-        if 'prioritize web search' in message_lower or 'search the web' in message_lower:
-            user_preferences['prioritize'] = 'web_search'
-        elif 'prioritize knowledge base' in message_lower or 'check knowledge base' in message_lower:
-            user_preferences['prioritize'] = 'knowledge_base'
-        elif 'check all sources' in message_lower or 'comprehensive search' in message_lower:
+        preference = _detect_source_preference(message_text)
+        if preference == 'all':
             user_preferences['search_all'] = True
+        elif preference:
+            user_preferences['prioritize'] = preference
 
         result = await self.process_with_quality_assessment(message_text, user_preferences)
 
@@ -841,33 +882,60 @@ Please provide analysis in JSON format:
         # long-running coroutine (60-120s+ for technical queries) — without
         # this, the stream is silent for the entire duration and intermediate
         # proxies with idle-based timeouts kill the connection.
+        # The final answer's tokens arrive through this queue as the LLM writes them.
+        tokens: asyncio.Queue = asyncio.Queue()
         synthesis_task = asyncio.create_task(
             self.process_with_quality_assessment(
-                message_text, kwargs.get('user_preferences', {})
+                message_text, kwargs.get('user_preferences', {}), on_token=tokens.put_nowait
             )
         )
 
         heartbeat_interval = 20.0  # seconds between keep-alive chunks
-        start_time = time.time()
-        while True:
-            done, _ = await asyncio.wait({synthesis_task}, timeout=heartbeat_interval)
-            if synthesis_task in done:
-                break
-            elapsed = time.time() - start_time
-            yield StreamChunk(
-                text="",
-                sub_type=StreamSubType.STATUS,
-                event_type=SSEEventType.STATUS,
-                metadata={
-                    "heartbeat": True,
-                    "elapsed_seconds": round(elapsed, 1),
-                    "stage": "synthesizing",
-                    "agent_id": self.agent_id,
-                },
-            )
+        start_time = time.perf_counter()
+        streamed = False
+        next_token = asyncio.ensure_future(tokens.get())
+        try:
+            while True:
+                done, _ = await asyncio.wait(
+                    {synthesis_task, next_token},
+                    timeout=heartbeat_interval,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if next_token in done:
+                    streamed = True
+                    yield StreamChunk(
+                        text=next_token.result(),
+                        sub_type=StreamSubType.CONTENT,
+                        event_type=SSEEventType.CONTENT,
+                    )
+                    next_token = asyncio.ensure_future(tokens.get())
+                    continue
+                if synthesis_task in done:
+                    break
+                elapsed = time.perf_counter() - start_time
+                yield StreamChunk(
+                    text="",
+                    sub_type=StreamSubType.STATUS,
+                    event_type=SSEEventType.STATUS,
+                    metadata={
+                        "heartbeat": True,
+                        "elapsed_seconds": round(elapsed, 1),
+                        "stage": "synthesizing",
+                        "agent_id": self.agent_id,
+                    },
+                )
+        finally:
+            next_token.cancel()
 
         # Propagates any exception raised inside synthesis
         result = synthesis_task.result()
+        while not tokens.empty():
+            streamed = True
+            yield StreamChunk(
+                text=tokens.get_nowait(),
+                sub_type=StreamSubType.CONTENT,
+                event_type=SSEEventType.CONTENT,
+            )
 
         response_text = result.get('response', '')
 
@@ -878,13 +946,15 @@ Please provide analysis in JSON format:
                 metadata={"quality_assessment": quality_info},
             )
 
-        chunk_size = 50
-        for i in range(0, len(response_text), chunk_size):
-            chunk = response_text[i:i + chunk_size]
-            yield StreamChunk(
-                text=chunk, sub_type=StreamSubType.CONTENT, event_type=SSEEventType.CONTENT,
-            )
-            await asyncio.sleep(0.01)
+        # Fallback for callers whose synthesis did not report tokens
+        if not streamed:
+            chunk_size = 50
+            for i in range(0, len(response_text), chunk_size):
+                chunk = response_text[i:i + chunk_size]
+                yield StreamChunk(
+                    text=chunk, sub_type=StreamSubType.CONTENT, event_type=SSEEventType.CONTENT,
+                )
+                await asyncio.sleep(0.01)
 
         yield StreamChunk(
             text="", sub_type=StreamSubType.RESULT, event_type=SSEEventType.COMPLETE,
@@ -143,6 +143,8 @@ class ModeratorAgent(BaseAgent, BaseAgentHistoryMixin):
         self.enabled_agents = enabled_agents or self._get_default_enabled_agents()
         self.specialized_agents = {}
         self.agent_routing_patterns = {}
+        # agent_type -> (source pattern list, compiled regexes); see _routing_regexes
+        self._compiled_routing_patterns: Dict[str, tuple] = {}
 
         # Setup logging
         self.logger = logging.getLogger(f"ModeratorAgent-{agent_id[:8]}")
@@ -238,11 +240,15 @@ class ModeratorAgent(BaseAgent, BaseAgentHistoryMixin):
 
                 # CRITICAL: Create agent with MODERATOR's session context
                 if hasattr(agent_class, "create_simple"):
-                    # Use create_simple but with moderator's context
+                    # Use create_simple but with moderator's context. Hand over the
+                    # moderator's memory and LLM service up front so each sub-agent
+                    # doesn't build its own only to have them replaced below.
                     agent_instance = agent_class.create_simple(
                         agent_id=f"{agent_type}_{self.agent_id}",
                         user_id=self.context.user_id,
                         tenant_id=self.context.tenant_id,
+                        memory_manager=self.memory,
+                        llm_service=self.llm_service,
                         session_metadata={
                             "parent_moderator": self.agent_id,
                             "agent_type": agent_type,
@@ -467,6 +473,18 @@ class ModeratorAgent(BaseAgent, BaseAgentHistoryMixin):
                 "priority": 3, # Lower priority but catches general requests
             },
         }
+        self._compiled_routing_patterns = {}
+        for agent_type in self.agent_routing_patterns:
+            self._routing_regexes(agent_type)
+
+    def _routing_regexes(self, agent_type: str) -> list:
+        """Compiled regexes for an agent's routing patterns, built once per pattern list"""
+        source = self.agent_routing_patterns[agent_type]["patterns"]
+        cached = self._compiled_routing_patterns.get(agent_type)
+        if cached is None or cached[0] is not source:
+            cached = (source, [re.compile(pattern) for pattern in source])
+            self._compiled_routing_patterns[agent_type] = cached
+        return cached[1]
 
     def _fast_route_check(self, user_message: str) -> Optional[Dict[str, Any]]:
         """Deterministic fast-path routing for unambiguous patterns.
@@ -776,7 +794,9 @@ class ModeratorAgent(BaseAgent, BaseAgentHistoryMixin):
 
             score = 0
             score += sum(3 for keyword in patterns["keywords"] if keyword in message_lower)
-            score += sum(5 for pattern in patterns["patterns"] if re.search(pattern, message_lower))
+            score += sum(
+                5 for regex in self._routing_regexes(agent_type) if regex.search(message_lower)
+            )
             score += sum(2 for indicator in patterns["indicators"] if indicator in message_lower)
 
             agent_scores[agent_type] = score
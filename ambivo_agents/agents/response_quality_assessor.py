@@ -7,7 +7,7 @@ and determines if the response is sufficient or if additional sources need to be
 
 import asyncio
 import json
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
 
@@ -124,7 +124,8 @@ When assessing, be thorough but fair. Consider the context and complexity of the
         self,
         question: str,
         responses: List[SourceResponse],
-        user_preferences: Optional[Dict[str, Any]] = None
+        user_preferences: Optional[Dict[str, Any]] = None,
+        synthesize: bool = True
     ) -> ResponseAssessment:
         """
         Assess the quality of responses from various sources.
@@ -133,6 +134,8 @@ When assessing, be thorough but fair. Consider the context and complexity of the
             question: The original user question
             responses: List of responses from different sources
             user_preferences: Optional user preferences (e.g., prioritize web search)
+            synthesize: Write final_response now. Pass False to leave it empty and
+                call synthesize_response() later on the assessment that is kept
             
         Returns:
             ResponseAssessment with quality analysis and recommendations
@@ -163,8 +166,10 @@ When assessing, be thorough but fair. Consider the context and complexity of the
         # sources don't cover the question (see the _synthesize_response
         # prompt). _synthesize_response has its own LLM-failure fallback to
         # raw best-confidence content, so there's no loss-of-information risk.
-        if responses:
+        if responses and synthesize:
             final_response = await self._synthesize_response(question, responses, assessment_data)
+        elif responses:
+            final_response = ""
         else:
             final_response = "I couldn't find sufficient information to answer your question."
         
@@ -316,11 +321,32 @@ Please provide your assessment in the following JSON format:
         else:
             return QualityLevel.UNACCEPTABLE
     
+    async def synthesize_response(
+        self,
+        question: str,
+        responses: List[SourceResponse],
+        assessment: ResponseAssessment,
+        on_token: Optional[Callable[[str], Any]] = None
+    ) -> str:
+        """Fill in final_response for an assessment made with ``synthesize=False``.
+
+        With ``on_token`` the synthesis is streamed and each text chunk is passed
+        to it as it arrives.
+        """
+        assessment.final_response = await self._synthesize_response(
+            question,
+            responses,
+            assessment.metadata.get('assessment_data', {}),
+            on_token=on_token,
+        )
+        return assessment.final_response
+
     async def _synthesize_response(
         self,
         question: str,
         responses: List[SourceResponse],
-        assessment_data: Dict[str, Any]
+        assessment_data: Dict[str, Any],
+        on_token: Optional[Callable[[str], Any]] = None
     ) -> str:
         """Synthesize source responses into a clean, user-facing answer via LLM.
 
@@ -375,16 +401,27 @@ Please provide your assessment in the following JSON format:
             "question, say so explicitly instead of inventing an answer."
         )
 
+        system_message = (
+            "You are a response synthesizer. You read one or more source "
+            "documents and write a clean, direct answer to the user's "
+            "question. You never echo raw search-result formatting and "
+            "you never fabricate information absent from the sources."
+        )
+        streamed: List[str] = []
         try:
-            synthesized = await self.llm_service.generate_response(
-                prompt=synthesis_prompt,
-                system_message=(
-                    "You are a response synthesizer. You read one or more source "
-                    "documents and write a clean, direct answer to the user's "
-                    "question. You never echo raw search-result formatting and "
-                    "you never fabricate information absent from the sources."
-                ),
-            )
+            if on_token is None:
+                synthesized = await self.llm_service.generate_response(
+                    prompt=synthesis_prompt,
+                    system_message=system_message,
+                )
+            else:
+                async for chunk in self.llm_service.generate_response_stream(
+                    synthesis_prompt, system_message=system_message
+                ):
+                    if chunk:
+                        streamed.append(chunk)
+                        on_token(chunk)
+                synthesized = "".join(streamed)
             if synthesized and synthesized.strip():
                 return synthesized.strip()
             self.logger.warning(
@@ -392,11 +429,16 @@ Please provide your assessment in the following JSON format:
             )
         except Exception as e:
             self.logger.error(f"LLM synthesis call failed: {e}")
+            if streamed:
+                # The caller has already shown this text; keep the answer consistent with it
+                return "".join(streamed).strip()
 
         # Fallback: return the highest-confidence source's raw content. This
         # preserves the pre-fix behavior when the LLM is unavailable so the
         # user still sees something, even if it's the ugly raw format.
         best_response = max(responses, key=lambda r: r.confidence)
+        if on_token is not None:
+            on_token(best_response.content)
         return best_response.content
     
     def _suggest_additional_sources(
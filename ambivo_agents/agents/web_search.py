@@ -26,6 +26,22 @@ from ..core.base import (
 )
 from ..core.history import ContextType, WebAgentHistoryMixin
 
+# Process-wide pooled session: every search in a conversation reuses the provider's
+# keep-alive TLS connection instead of paying a fresh handshake per requests.get
+_HTTP_SESSION: Optional[requests.Session] = None
+
+
+def _http_session() -> requests.Session:
+    """Return the shared provider session, creating it on first use."""
+    global _HTTP_SESSION
+    if _HTTP_SESSION is None:
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=32)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _HTTP_SESSION = session
+    return _HTTP_SESSION
+
 
 @dataclass
 class SearchResult:
@@ -378,7 +394,7 @@ class WebSearchServiceAdapter:
             params["freshness"] = freshness
 
         try:
-            response = requests.get(
+            response = _http_session().get(
                 provider_config["base_url"], headers=headers, params=params, timeout=15
             )
 
@@ -442,7 +458,7 @@ class WebSearchServiceAdapter:
         }
 
         try:
-            response = requests.get(
+            response = _http_session().get(
                 provider_config["base_url"], headers=headers, params=params, timeout=15
             )
 
@@ -315,16 +315,15 @@ class EnhancedConfigManager:
 
         try:
             Path(path).parent.mkdir(parents=True, exist_ok=True)
-            with open(path, "w") as f:
-                # Write comments and config
-                f.write("# Ambivo Agents Configuration\n")
-                f.write(
-                    "# Environment variables with AMBIVO_AGENTS_ prefix will override these settings\n"
-                )
-                f.write("# Example: export AMBIVO_AGENTS_REDIS_HOST=localhost\n")
-                f.write("# Example: export AMBIVO_AGENTS_OPENAI_API_KEY=your_key_here\n\n")
-
-                yaml.dump(sample_config, f, default_flow_style=False, indent=2)
+            # Render comments and config up front, then write the file in one call
+            header = (
+                "# Ambivo Agents Configuration\n"
+                "# Environment variables with AMBIVO_AGENTS_ prefix will override these settings\n"
+                "# Example: export AMBIVO_AGENTS_REDIS_HOST=localhost\n"
+                "# Example: export AMBIVO_AGENTS_OPENAI_API_KEY=your_key_here\n\n"
+            )
+            body = yaml.dump(sample_config, default_flow_style=False, indent=2)
+            Path(path).write_bytes((header + body).encode("utf-8"))
             return True
         except Exception as e:
             print(f"Failed to save sample config: {e}")
@@ -1038,6 +1037,10 @@ def interactive():
 def shell():
     """Start Ambivo Agents interactive shell with full environment variable support"""
 
+    # One event loop for the whole shell session, so cached agents keep their
+    # loop-bound LLM clients and connection pools warm between commands
+    runner = asyncio.Runner()
+
     # Show enhanced welcome message
     from ambivo_agents import __version__
     click.echo(f"Ambivo Agents Shell v{__version__}")
@@ -1236,7 +1239,7 @@ Ambivo Agents Enhanced Shell Commands:
             except Exception as e:
                 click.echo(f"Error: {e}")
 
-        asyncio.run(process_chat())
+        runner.run(process_chat())
         return True
 
     def handle_interactive_command():
@@ -1276,7 +1279,7 @@ Ambivo Agents Enhanced Shell Commands:
                     click.echo("\nReturning to shell...")
                     break
 
-        asyncio.run(interactive_chat())
+        runner.run(interactive_chat())
         return True
 
     def handle_health_command():
@@ -1477,6 +1480,8 @@ Ambivo Agents Enhanced Shell Commands:
             import traceback
 
             traceback.print_exc()
+    finally:
+        runner.close()
 
 
 @cli.command()
@@ -5,6 +5,7 @@ Supports both YAML file and environment variables for configuration.
 YAML file is now OPTIONAL when environment variables are provided.
 """
 
+import copy
 import logging
 import os
 from pathlib import Path
@@ -93,6 +94,16 @@ LLM_PROVIDER_ENV_VARS = [
     f"{ENV_PREFIX}AWS_ACCESS_KEY_ID",
 ]
 
+# Parsed and validated YAML configs keyed by (resolved path, mtime_ns, size).
+# Editing the file changes the key, so stale entries are never served.
+_YAML_CONFIG_CACHE: Dict[tuple, Dict[str, Any]] = {}
+_YAML_CONFIG_CACHE_MAX = 8
+
+
+def clear_config_cache() -> None:
+    """Drop all memoized YAML configurations."""
+    _YAML_CONFIG_CACHE.clear()
+
 
 def load_config(config_path: str = None, use_env_vars: bool = None) -> Dict[str, Any]:
     """
@@ -247,16 +258,24 @@ def _load_config_from_yaml(config_path: str = None) -> Dict[str, Any]:
             "Either create this file or use environment variables."
         )
 
-    # Warn if config file is world-readable (contains credentials)
     try:
-        file_mode = config_file.stat().st_mode
-        if file_mode & 0o004:  # world-readable
-            logger.warning(
-                f"Config file {config_file} is world-readable (mode {oct(file_mode)}). "
-                "This file contains credentials and should be restricted (e.g., chmod 600)."
-            )
+        file_stat = config_file.stat()
+        cache_key = (str(config_file.resolve()), file_stat.st_mtime_ns, file_stat.st_size)
     except OSError:
-        pass
+        file_stat = None
+        cache_key = None
+
+    # Return a copy of the memoized config when the file is unchanged;
+    # callers mutate the returned dict.
+    if cache_key is not None and cache_key in _YAML_CONFIG_CACHE:
+        return copy.deepcopy(_YAML_CONFIG_CACHE[cache_key])
+
+    # Warn if config file is world-readable (contains credentials)
+    if file_stat is not None and file_stat.st_mode & 0o004:  # world-readable
+        logger.warning(
+            f"Config file {config_file} is world-readable (mode {oct(file_stat.st_mode)}). "
+            "This file contains credentials and should be restricted (e.g., chmod 600)."
+        )
 
     try:
         with open(config_file, "r", encoding="utf-8") as f:
@@ -268,6 +287,11 @@ def _load_config_from_yaml(config_path: str = None) -> Dict[str, Any]:
         # Apply defaults to YAML configuration
         _set_env_config_defaults(config)
         _validate_config(config)
+
+        if cache_key is not None:
+            if len(_YAML_CONFIG_CACHE) >= _YAML_CONFIG_CACHE_MAX:
+                _YAML_CONFIG_CACHE.pop(next(iter(_YAML_CONFIG_CACHE)))
+            _YAML_CONFIG_CACHE[cache_key] = copy.deepcopy(config)
         return config
 
     except yaml.YAMLError as e:
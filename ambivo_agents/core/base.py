@@ -4,12 +4,15 @@ Enhanced BaseAgent with built-in auto-context session management and simplified
 """
 
 import asyncio
+import json
 import logging
 import os
+import sys
 import tempfile
 import time
 import uuid
 from abc import ABC, abstractmethod
+from collections import Counter, OrderedDict
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
@@ -39,6 +42,14 @@ try:
 except ImportError:
     YAML_AVAILABLE = False
 
+# Optional orjson for faster JSON parsing in the file utilities
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Optional requests import for URL fallback
 try:
     import requests
@@ -49,6 +60,80 @@ except ImportError:
 
 DOCKER_AVAILABLE = False  # Docker no longer used in core
 
+# chat_sync() from inside a running loop is logged once per process
+_CHAT_SYNC_IN_LOOP_WARNED = False
+
+
+_MISSING = object()
+
+
+def _convert_csv_value(value: str) -> Any:
+    """Map a CSV cell to None (empty), int, float, or the original string."""
+    if value == "":
+        return None
+    if value.isdigit():
+        return int(value)
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+
+def _yaml_safe_load(content: str) -> Any:
+    """yaml.safe_load, using libyaml's C loader when PyYAML was built with it."""
+    loader = getattr(yaml, "CSafeLoader", None) or yaml.SafeLoader
+    return yaml.load(content, Loader=loader)
+
+
+def _json_loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON with orjson when available.
+
+    Input orjson rejects but the stdlib accepts (NaN, integers beyond 64 bits)
+    falls back to json.loads, so results match the stdlib parser.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+# URL reads remembered with their ETag/Last-Modified so re-reads can be conditional
+_URL_CACHE: "OrderedDict[str, Tuple[Dict[str, str], Dict[str, Any]]]" = OrderedDict()
+_URL_CACHE_MAX = 32
+
+# URL bodies larger than this are rejected while streaming instead of being held in memory
+_URL_READ_MAX_BYTES = 10 * 1024 * 1024
+
+
+def _url_cache_headers(url: str) -> Dict[str, str]:
+    """Conditional request headers for a previously read URL (empty if unknown)."""
+    entry = _URL_CACHE.get(url)
+    return dict(entry[0]) if entry else {}
+
+
+def _url_cache_hit(url: str) -> Dict[str, Any]:
+    """Return a copy of the cached read_file result for a URL that answered 304."""
+    _URL_CACHE.move_to_end(url)
+    return dict(_URL_CACHE[url][1])
+
+
+def _url_cache_store(url: str, headers: Any, result: Dict[str, Any]) -> None:
+    """Remember a URL read if the server sent validators; forget it otherwise."""
+    validators = {}
+    if headers.get("ETag"):
+        validators["If-None-Match"] = headers["ETag"]
+    if headers.get("Last-Modified"):
+        validators["If-Modified-Since"] = headers["Last-Modified"]
+    if not validators:
+        _URL_CACHE.pop(url, None)
+        return
+    _URL_CACHE[url] = (validators, dict(result))
+    _URL_CACHE.move_to_end(url)
+    while len(_URL_CACHE) > _URL_CACHE_MAX:
+        _URL_CACHE.popitem(last=False)
+
 
 class AgentRole(Enum):
     """Enumeration of agent roles that determine default behavior and system messages."""
@@ -697,6 +782,10 @@ class BaseAgent(ABC):
         """
         Synchronous version of chat() that properly handles event loops
 
+        Intended for genuinely synchronous callers. Inside a coroutine use
+        ``await agent.chat(...)``: calling chat_sync from a running event loop
+        blocks that loop while the chat runs on a helper thread.
+
         Args:
             message: User message as string
             **kwargs: Optional metadata to add to the message
@@ -704,37 +793,42 @@ class BaseAgent(ABC):
         Returns:
             Agent response as string
         """
-        try:
-            # Check if we're already in an async context
-            try:
-                # Try to get the current event loop
-                loop = asyncio.get_running_loop()
-                # If we get here, we're in an async context - use run_in_executor
-                import concurrent.futures
-                import threading
-
-                def run_chat():
-                    # Create new event loop in thread
-                    new_loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(new_loop)
-                    try:
-                        # Filter out timeout parameter for async chat call
-                        filtered_kwargs = {k: v for k, v in kwargs.items() if k != "timeout"}
-                        return new_loop.run_until_complete(self.chat(message, **filtered_kwargs))
-                    finally:
-                        new_loop.close()
+        global _CHAT_SYNC_IN_LOOP_WARNED
 
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(run_chat)
-                    timeout = kwargs.get("timeout", 120)
-                    return future.result(timeout=timeout)
+        # Filter out timeout parameter that chat()/asyncio.run() don't accept
+        filtered_kwargs = {k: v for k, v in kwargs.items() if k != "timeout"}
 
+        try:
+            try:
+                asyncio.get_running_loop()
             except RuntimeError:
                 # No event loop running, safe to use asyncio.run()
-                # Filter out timeout parameter that asyncio.run() doesn't accept
-                filtered_kwargs = {k: v for k, v in kwargs.items() if k != "timeout"}
                 return asyncio.run(self.chat(message, **filtered_kwargs))
 
+            # We're in an async context - run on a fresh loop in a helper thread
+            if not _CHAT_SYNC_IN_LOOP_WARNED:
+                _CHAT_SYNC_IN_LOOP_WARNED = True
+                logging.warning(
+                    "chat_sync() called from a running event loop; the loop is blocked "
+                    "until the chat completes. Use 'await agent.chat()' in async code."
+                )
+
+            import concurrent.futures
+
+            def run_chat():
+                # Create new event loop in thread
+                new_loop = asyncio.new_event_loop()
+                asyncio.set_event_loop(new_loop)
+                try:
+                    return new_loop.run_until_complete(self.chat(message, **filtered_kwargs))
+                finally:
+                    new_loop.close()
+
+            with concurrent.futures.ThreadPoolExecutor() as executor:
+                future = executor.submit(run_chat)
+                timeout = kwargs.get("timeout", 120)
+                return future.result(timeout=timeout)
+
         except Exception as e:
             error_msg = f"Sync chat error: {str(e)}"
             logging.error(f"Agent {self.agent_id} sync chat error: {e}")
@@ -915,6 +1009,29 @@ class BaseAgent(ABC):
             logging.error(f"Failed to get conversation history for {self.agent_id}: {e}")
             return []
 
+    async def count_conversation_messages(self) -> int:
+        """
+        Count messages in this agent's conversation without loading them
+
+        Cheaper than ``len(await get_conversation_history())`` when only the
+        size is needed (a single LLEN on Redis).
+
+        Returns:
+            Number of stored messages (0 if memory is unavailable)
+        """
+        try:
+            if not self.memory:
+                return 0
+            conversation_id = self.context.conversation_id
+            if hasattr(self.memory, "count_messages"):
+                return self.memory.count_messages(conversation_id=conversation_id)
+            return len(
+                self.memory.get_recent_messages(limit=sys.maxsize, conversation_id=conversation_id)
+            )
+        except Exception as e:
+            logging.error(f"Failed to count conversation messages for {self.agent_id}: {e}")
+            return 0
+
     async def add_to_conversation_history(
         self, message: str, message_type: str = "user", metadata: Dict[str, Any] = None
     ) -> bool:
@@ -1006,10 +1123,9 @@ class BaseAgent(ABC):
 
             # Analyze conversation
             total_messages = len(history)
-            user_messages = len([msg for msg in history if msg.get("message_type") == "user_input"])
-            agent_messages = len(
-                [msg for msg in history if msg.get("message_type") == "agent_response"]
-            )
+            type_counts = Counter(msg.get("message_type") for msg in history)
+            user_messages = type_counts["user_input"]
+            agent_messages = type_counts["agent_response"]
 
             # Calculate session duration
             first_msg_time = self.context.created_at
@@ -1258,13 +1374,17 @@ class BaseAgent(ABC):
             # If any error occurs in checking, err on the side of caution
             return True
 
-    async def read_file(self, file_path: str, encoding: str = "utf-8") -> Dict[str, Any]:
+    async def read_file(
+        self, file_path: str, encoding: str = "utf-8", max_bytes: Optional[int] = None
+    ) -> Dict[str, Any]:
         """
         Read a file from local filesystem or URL
 
         Args:
             file_path: Local file path or URL (http/https)
             encoding: Text encoding (default: utf-8)
+            max_bytes: Largest URL body to accept (default 10 MB); larger
+                responses fail without being downloaded in full
 
         Returns:
             Dict with success status, content, and metadata
@@ -1282,14 +1402,34 @@ class BaseAgent(ABC):
             # Check if it's a URL
             if file_path.startswith(("http://", "https://")):
                 # Prefer aiohttp when available, fallback to requests
+                # Revalidate earlier reads; an unchanged document comes back as 304
+                conditional = _url_cache_headers(file_path)
+                limit = _URL_READ_MAX_BYTES if max_bytes is None else max_bytes
+                too_large = {
+                    "success": False,
+                    "error": f"Response from {file_path} exceeds {limit} bytes",
+                    "path": file_path,
+                }
                 if AIOHTTP_AVAILABLE:
                     import aiohttp
 
                     async with aiohttp.ClientSession() as session:
-                        async with session.get(file_path) as response:
+                        async with session.get(file_path, headers=conditional or None) as response:
+                            if response.status == 304 and conditional:
+                                return _url_cache_hit(file_path)
                             response.raise_for_status()
-                            content = await response.text()
-                            return {
+                            declared = response.content_length
+                            if declared is not None and declared > limit:
+                                return too_large
+                            # read(n) returns whatever is buffered, so collect chunks until EOF
+                            chunks, size = [], 0
+                            async for chunk in response.content.iter_chunked(65536):
+                                size += len(chunk)
+                                if size > limit:
+                                    return too_large
+                                chunks.append(chunk)
+                            content = b"".join(chunks).decode(response.charset or encoding, errors="replace")
+                            result = {
                                 "success": True,
                                 "content": content,
                                 "source": "url",
@@ -1298,12 +1438,26 @@ class BaseAgent(ABC):
                                 "content_type": response.headers.get("Content-Type", "text/plain"),
                                 "encoding": encoding,
                             }
+                            _url_cache_store(file_path, response.headers, result)
+                            return result
                 elif REQUESTS_AVAILABLE:
                     try:
-                        resp = requests.get(file_path, timeout=15)
-                        resp.raise_for_status()
-                        content = resp.text
-                        return {
+                        extra = {"headers": conditional} if conditional else {}
+                        resp = requests.get(file_path, timeout=15, stream=True, **extra)
+                        try:
+                            if resp.status_code == 304 and conditional:
+                                return _url_cache_hit(file_path)
+                            resp.raise_for_status()
+                            chunks, size = [], 0
+                            for chunk in resp.iter_content(chunk_size=65536):
+                                size += len(chunk)
+                                if size > limit:
+                                    return too_large
+                                chunks.append(chunk)
+                        finally:
+                            resp.close()
+                        content = b"".join(chunks).decode(resp.encoding or encoding, errors="replace")
+                        result = {
                             "success": True,
                             "content": content,
                             "source": "url",
@@ -1312,6 +1466,8 @@ class BaseAgent(ABC):
                             "content_type": resp.headers.get("Content-Type", "text/plain"),
                             "encoding": resp.encoding or encoding,
                         }
+                        _url_cache_store(file_path, resp.headers, result)
+                        return result
                     except Exception as e:
                         return {"success": False, "error": str(e), "path": file_path}
                 else:
@@ -1351,28 +1507,12 @@ class BaseAgent(ABC):
                 # Detect file type
                 mime_type, _ = mimetypes.guess_type(str(path))
 
-                # Read file
+                # Read file in a worker thread so slow disks don't stall the event loop
                 if path.suffix.lower() in [".json", ".csv", ".txt", ".xml", ".yml", ".yaml"]:
-                    if AIOFILES_AVAILABLE:
-                        import aiofiles
-
-                        async with aiofiles.open(path, mode="r", encoding=encoding) as f:
-                            content = await f.read()
-                    else:
-                        # Fallback to sync read
-                        with open(path, "r", encoding=encoding) as f:
-                            content = f.read()
+                    content = await asyncio.to_thread(path.read_text, encoding=encoding)
                 else:
                     # Binary file
-                    if AIOFILES_AVAILABLE:
-                        import aiofiles
-
-                        async with aiofiles.open(path, mode="rb") as f:
-                            content = await f.read()
-                    else:
-                        # Fallback to sync read
-                        with open(path, "rb") as f:
-                            content = f.read()
+                    content = await asyncio.to_thread(path.read_bytes)
 
                     return {
                         "success": True,
@@ -1414,7 +1554,6 @@ class BaseAgent(ABC):
             Parsed content as appropriate data structure
         """
         try:
-            import json
             import csv
             import xml.etree.ElementTree as ET
             import yaml
@@ -1429,7 +1568,7 @@ class BaseAgent(ABC):
 
             if file_type == "json":
                 # Parse JSON
-                data = json.loads(content)
+                data = _json_loads(content)
                 return {
                     "success": True,
                     "data": data,
@@ -1479,9 +1618,9 @@ class BaseAgent(ABC):
                         "success": False,
                         "error": "PyYAML not available. Install with: pip install PyYAML",
                     }
-                import yaml
-
-                data = yaml.safe_load(content)
+                # Always the YAML loader: JSON-looking YAML can still resolve scalars
+                # differently from a JSON parser (1e3 is a string in YAML 1.1)
+                data = _yaml_safe_load(content)
                 return {"success": True, "data": data, "type": "yaml"}
 
             else:
@@ -1512,13 +1651,12 @@ class BaseAgent(ABC):
             Dict with CSV content and metadata
         """
         try:
-            import json
             import csv
             from io import StringIO
 
             # Parse JSON if string
             if isinstance(json_data, str):
-                data = json.loads(json_data)
+                data = _json_loads(json_data)
             else:
                 data = json_data
 
@@ -1535,16 +1673,14 @@ class BaseAgent(ABC):
                 return {"success": True, "csv": "", "rows": 0, "columns": []}
 
             # Get all unique keys
-            all_keys = set()
-            for item in data:
-                if isinstance(item, dict):
-                    all_keys.update(item.keys())
+            columns = sorted(set().union(*(item for item in data if isinstance(item, dict))))
 
-            # Create CSV
+            # Create CSV. The header already covers every key, so skip DictWriter's
+            # per-row extra-field check and emit rows straight to the C writer.
             output = StringIO()
-            writer = csv.DictWriter(output, fieldnames=sorted(all_keys))
-            writer.writeheader()
-            writer.writerows(data)
+            writer = csv.writer(output)
+            writer.writerow(columns)
+            writer.writerows([row.get(key, "") for key in columns] for row in data)
 
             csv_content = output.getvalue()
 
@@ -1552,7 +1688,7 @@ class BaseAgent(ABC):
                 "success": True,
                 "csv": csv_content,
                 "rows": len(data),
-                "columns": sorted(all_keys),
+                "columns": columns,
             }
 
         except Exception as e:
@@ -1573,30 +1709,25 @@ class BaseAgent(ABC):
         """
         try:
             import csv
-            import json
             from io import StringIO
 
             # Parse CSV
             reader = csv.DictReader(StringIO(csv_data))
-            data = []
-
-            for row in reader:
-                if numeric_conversion:
-                    # Convert numeric strings
-                    converted_row = {}
-                    for key, value in row.items():
-                        if value == "":
-                            converted_row[key] = None
-                        elif value.isdigit():
-                            converted_row[key] = int(value)
-                        else:
-                            try:
-                                converted_row[key] = float(value)
-                            except ValueError:
-                                converted_row[key] = value
-                    data.append(converted_row)
-                else:
-                    data.append(row)
+
+            if numeric_conversion:
+                # Convert numeric strings. Tabular data repeats cell values heavily
+                # (categories, flags), so each distinct string is converted once.
+                converted: Dict[str, Any] = {}
+
+                def convert(value):
+                    result = converted.get(value, _MISSING)
+                    if result is _MISSING:
+                        result = converted[value] = _convert_csv_value(value)
+                    return result
+
+                data = [{key: convert(value) for key, value in row.items()} for row in reader]
+            else:
+                data = list(reader)
 
             return {
                 "success": True,
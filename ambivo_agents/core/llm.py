@@ -4,37 +4,25 @@ LLM service with multiple provider support and automatic rotation.
 """
 
 import asyncio
+import importlib.util
 import logging
 import os
 import re
+import weakref
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Any, AsyncIterator, Dict, List, Optional
 
 from ..config.loader import get_config_section, load_config
 from .base import ProviderConfig, ProviderTracker
 
-# LLM Provider imports - direct SDK usage (no langchain)
-try:
-    import openai
-
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
-
-try:
-    import anthropic as anthropic_sdk
-
-    ANTHROPIC_AVAILABLE = True
-except ImportError:
-    ANTHROPIC_AVAILABLE = False
-
-try:
-    import boto3
-
-    BOTO3_AVAILABLE = True
-except ImportError:
-    BOTO3_AVAILABLE = False
+# LLM Provider SDKs - direct SDK usage (no langchain). Importing openai and
+# anthropic dominates package import time, so only check that they are
+# installed here; each provider imports its SDK when it is set up.
+OPENAI_AVAILABLE = importlib.util.find_spec("openai") is not None
+ANTHROPIC_AVAILABLE = importlib.util.find_spec("anthropic") is not None
+BOTO3_AVAILABLE = importlib.util.find_spec("boto3") is not None
 
 # Optional: LlamaIndex for knowledge base (installed via [knowledge] extra)
 LLAMA_INDEX_AVAILABLE = False
@@ -101,21 +89,121 @@ async def _async_retry_with_backoff(coro_func, max_retries=3, base_delay=1.0):
                 raise
 
 
+# Provider SDK clients are shared process-wide, keyed by provider and API key, so
+# agents reuse one connection pool (and its TLS sessions) instead of each opening
+# their own. Async clients are also scoped to the event loop that uses them,
+# since pooled connections cannot move between loops.
+_SHARED_SYNC_CLIENTS: Dict[tuple, Any] = {}
+_SHARED_ASYNC_CLIENTS: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+# Per-loop async generators whose cleanup closes that loop's clients (see below)
+_ASYNC_CLIENT_CLOSERS: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def _get_shared_client(key: tuple, factory):
+    """Return the process-wide sync SDK client for key, creating it on first use."""
+    client = _SHARED_SYNC_CLIENTS.get(key)
+    if client is None:
+        client = _SHARED_SYNC_CLIENTS[key] = factory()
+    return client
+
+
+def _get_shared_async_client(key: tuple, factory):
+    """Return the async SDK client for key bound to the running event loop."""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return factory()
+
+    # Drop clients left behind by loops that have since been closed
+    for stale in [l for l in list(_SHARED_ASYNC_CLIENTS.keys()) if l.is_closed()]:
+        _SHARED_ASYNC_CLIENTS.pop(stale, None)
+        _ASYNC_CLIENT_CLOSERS.pop(stale, None)
+
+    clients = _SHARED_ASYNC_CLIENTS.get(loop)
+    if clients is None:
+        clients = _SHARED_ASYNC_CLIENTS[loop] = {}
+        # Started async generators are finalized by loop.shutdown_asyncgens(), which
+        # asyncio.run()/Runner call while the loop can still await the clients' close().
+        # The first step reaches the yield without awaiting, so it is driven in place;
+        # that also registers the generator with this loop.
+        closer = _ASYNC_CLIENT_CLOSERS[loop] = _close_clients_on_shutdown(clients)
+        try:
+            closer.__anext__().send(None)
+        except StopIteration:
+            pass
+    client = clients.get(key)
+    if client is None:
+        client = clients[key] = factory()
+    return client
+
+
+async def _close_clients_on_shutdown(clients: Dict[tuple, Any]):
+    """Park until the loop shuts down, then close the SDK clients created on it."""
+    try:
+        yield
+    finally:
+        # Dropping the entry also releases this generator, which references the loop
+        _ASYNC_CLIENT_CLOSERS.pop(asyncio.get_running_loop(), None)
+        for client in list(clients.values()):
+            close = getattr(client, "close", None)
+            if close is None:
+                continue
+            try:
+                await close()
+            except Exception:
+                pass
+        clients.clear()
+
+
+_MISSING = object()
+
+
+def _content_or_str(obj) -> str:
+    """Return obj.content when present, otherwise str(obj)."""
+    content = getattr(obj, "content", _MISSING)
+    return str(obj) if content is _MISSING else content
+
+
+def _openai_messages(prompt: str, system: Optional[str] = None) -> List[Dict[str, str]]:
+    """Chat messages with the stable system text first so OpenAI's automatic
+    prefix caching can reuse it across requests."""
+    messages = [{"role": "system", "content": system}] if system else []
+    messages.append({"role": "user", "content": prompt})
+    return messages
+
+
+def _anthropic_system(system: Optional[str] = None) -> Dict[str, Any]:
+    """``system=`` kwarg for messages.create, marked as an ephemeral cache block"""
+    if not system:
+        return {}
+    return {"system": [{"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}]}
+
+
 class DirectOpenAILLM:
     """Direct OpenAI SDK wrapper with invoke/ainvoke/astream interface"""
 
     def __init__(self, model: str, temperature: float, api_key: str):
         self.model = model
         self.temperature = temperature
-        self.client = openai.OpenAI(api_key=api_key)
-        self.async_client = openai.AsyncOpenAI(api_key=api_key)
+        import openai
 
-    def invoke(self, prompt: str) -> LLMResponse:
+        self._api_key = api_key
+        self.client = _get_shared_client(("openai", api_key), lambda: openai.OpenAI(api_key=api_key))
+
+    @property
+    def async_client(self):
+        import openai
+
+        return _get_shared_async_client(
+            ("openai", self._api_key), lambda: openai.AsyncOpenAI(api_key=self._api_key)
+        )
+
+    def invoke(self, prompt: str, system: Optional[str] = None) -> LLMResponse:
         def _call():
             return self.client.chat.completions.create(
                 model=self.model,
                 temperature=self.temperature,
-                messages=[{"role": "user", "content": prompt}],
+                messages=_openai_messages(prompt, system),
             )
 
         response = _retry_with_backoff(_call)
@@ -124,12 +212,12 @@ class DirectOpenAILLM:
             content = response.choices[0].message.content or ""
         return LLMResponse(content)
 
-    async def ainvoke(self, prompt: str) -> LLMResponse:
+    async def ainvoke(self, prompt: str, system: Optional[str] = None) -> LLMResponse:
         async def _call():
             return await self.async_client.chat.completions.create(
                 model=self.model,
                 temperature=self.temperature,
-                messages=[{"role": "user", "content": prompt}],
+                messages=_openai_messages(prompt, system),
             )
 
         response = await _async_retry_with_backoff(_call)
@@ -138,12 +226,12 @@ class DirectOpenAILLM:
             content = response.choices[0].message.content or ""
         return LLMResponse(content)
 
-    async def astream(self, prompt: str):
+    async def astream(self, prompt: str, system: Optional[str] = None):
         try:
             stream = await self.async_client.chat.completions.create(
                 model=self.model,
                 temperature=self.temperature,
-                messages=[{"role": "user", "content": prompt}],
+                messages=_openai_messages(prompt, system),
                 stream=True,
             )
             async for chunk in stream:
@@ -152,7 +240,7 @@ class DirectOpenAILLM:
                     yield LLMResponse(delta.content)
         except Exception as e:
             logging.warning(f"OpenAI streaming failed, falling back to non-streaming: {e}")
-            response = await self.ainvoke(prompt)
+            response = await self.ainvoke(prompt, system)
             yield response
 
 
@@ -162,17 +250,30 @@ class DirectAnthropicLLM:
     def __init__(self, model: str, temperature: float, api_key: str, timeout: int = 120):
         self.model = model
         self.temperature = temperature
-        self.client = anthropic_sdk.Anthropic(api_key=api_key)
-        self.async_client = anthropic_sdk.AsyncAnthropic(api_key=api_key)
+        import anthropic as anthropic_sdk
+
+        self._api_key = api_key
+        self.client = _get_shared_client(
+            ("anthropic", api_key), lambda: anthropic_sdk.Anthropic(api_key=api_key)
+        )
         self.timeout = timeout
 
-    def invoke(self, prompt: str) -> LLMResponse:
+    @property
+    def async_client(self):
+        import anthropic as anthropic_sdk
+
+        return _get_shared_async_client(
+            ("anthropic", self._api_key), lambda: anthropic_sdk.AsyncAnthropic(api_key=self._api_key)
+        )
+
+    def invoke(self, prompt: str, system: Optional[str] = None) -> LLMResponse:
         def _call():
             return self.client.messages.create(
                 model=self.model,
                 max_tokens=4096,
                 temperature=self.temperature,
                 messages=[{"role": "user", "content": prompt}],
+                **_anthropic_system(system),
             )
 
         response = _retry_with_backoff(_call)
@@ -182,13 +283,14 @@ class DirectAnthropicLLM:
             content = first.text if hasattr(first, "text") else str(first)
         return LLMResponse(content)
 
-    async def ainvoke(self, prompt: str) -> LLMResponse:
+    async def ainvoke(self, prompt: str, system: Optional[str] = None) -> LLMResponse:
         async def _call():
             return await self.async_client.messages.create(
                 model=self.model,
                 max_tokens=4096,
                 temperature=self.temperature,
                 messages=[{"role": "user", "content": prompt}],
+                **_anthropic_system(system),
             )
 
         response = await _async_retry_with_backoff(_call)
@@ -198,20 +300,21 @@ class DirectAnthropicLLM:
             content = first.text if hasattr(first, "text") else str(first)
         return LLMResponse(content)
 
-    async def astream(self, prompt: str):
+    async def astream(self, prompt: str, system: Optional[str] = None):
         try:
             async with self.async_client.messages.stream(
                 model=self.model,
                 max_tokens=4096,
                 temperature=self.temperature,
                 messages=[{"role": "user", "content": prompt}],
+                **_anthropic_system(system),
             ) as stream:
                 async for text in stream.text_stream:
                     if text:
                         yield LLMResponse(text)
         except Exception as e:
             logging.warning(f"Anthropic streaming failed, falling back to non-streaming: {e}")
-            response = await self.ainvoke(prompt)
+            response = await self.ainvoke(prompt, system)
             yield response
 
 
@@ -372,6 +475,9 @@ class MultiProviderLLMService(LLMServiceInterface):
         self.current_llm = None
         self.current_embeddings = None
         self.temperature = config_data.get("temperature", 0.5)
+        # Exact-match LRU of responses; only used for deterministic (temperature 0) calls
+        self.response_cache_size = int(config_data.get("response_cache_size", 0))
+        self._response_cache: "OrderedDict[tuple, str]" = OrderedDict()
 
         if not LANGCHAIN_AVAILABLE:
             raise ImportError(
@@ -513,6 +619,8 @@ class MultiProviderLLMService(LLMServiceInterface):
         aws_secret_key = self.config_data.get("aws_secret_access_key")
         if not aws_secret_key:
             raise ValueError("aws_secret_access_key not configured")
+        import boto3
+
         boto3_client = boto3.client(
             "bedrock-runtime",
             region_name=self.config_data.get("aws_region", "us-east-1"),
@@ -683,13 +791,28 @@ class MultiProviderLLMService(LLMServiceInterface):
         # Build context-aware prompt BEFORE provider calls
         final_prompt = self._build_system_aware_prompt(prompt, context, system_message)
 
+        cached = self._cached_response(final_prompt)
+        if cached is not None:
+            return cached
+
         def _generate():
             try:
+                if system_message and self._supports_system_block():
+                    # Send the system message as its own leading block so the
+                    # provider's prompt cache can reuse it between requests
+                    response = self.current_llm.invoke(
+                        self._build_system_aware_prompt(
+                            prompt, context, system_message, include_system=False
+                        ),
+                        system=system_message,
+                    )
+                    return _content_or_str(response)
                 if hasattr(self.current_llm, "invoke"):
                     # FIX: Use context-enhanced prompt
                     response = self.current_llm.invoke(final_prompt)
-                    if hasattr(response, "content"):
-                        return response.content
+                    content = getattr(response, "content", _MISSING)
+                    if content is not _MISSING:
+                        return content
                     elif hasattr(response, "text"):
                         return response.text
                     else:
@@ -700,8 +823,9 @@ class MultiProviderLLMService(LLMServiceInterface):
                 elif hasattr(self.current_llm, "__call__"):
                     # FIX: Use context-enhanced prompt
                     response = self.current_llm(final_prompt)
-                    if hasattr(response, "content"):
-                        return response.content
+                    content = getattr(response, "content", _MISSING)
+                    if content is not _MISSING:
+                        return content
                     elif hasattr(response, "text"):
                         return response.text
                     else:
@@ -714,19 +838,58 @@ class MultiProviderLLMService(LLMServiceInterface):
                 raise e
 
         try:
-            return self._execute_with_retry(_generate)
+            response = self._execute_with_retry(_generate)
         except Exception as e:
             raise RuntimeError(f"Failed to generate response after retries: {str(e)}")
+        self._cache_response(final_prompt, response)
+        return response
+
+    def _response_cache_key(self, final_prompt: str) -> Optional[tuple]:
+        """Cache key for a prompt, or None when response caching does not apply"""
+        if self.response_cache_size <= 0 or self.temperature != 0:
+            return None
+        return (self.current_provider, getattr(self.current_llm, "model", None), final_prompt)
+
+    def _cached_response(self, final_prompt: str) -> Optional[str]:
+        """Return a cached response for an identical deterministic prompt, if any"""
+        key = self._response_cache_key(final_prompt)
+        if key is None or key not in self._response_cache:
+            return None
+        self._response_cache.move_to_end(key)
+        return self._response_cache[key]
+
+    def _cache_response(self, final_prompt: str, response: Any):
+        """Remember a deterministic response, evicting the least recently used entry"""
+        key = self._response_cache_key(final_prompt)
+        if key is None or not isinstance(response, str):
+            return
+        self._response_cache[key] = response
+        self._response_cache.move_to_end(key)
+        if len(self._response_cache) > self.response_cache_size:
+            self._response_cache.popitem(last=False)
+
+    def _supports_system_block(self) -> bool:
+        """Whether the current LLM accepts the system message as a separate block"""
+        return isinstance(self.current_llm, (DirectOpenAILLM, DirectAnthropicLLM))
 
     def _build_system_aware_prompt(
-        self, user_prompt: str, context: Dict[str, Any] = None, system_message: str = None
+        self,
+        user_prompt: str,
+        context: Dict[str, Any] = None,
+        system_message: str = None,
+        include_system: bool = True,
     ) -> str:
-        """Build prompt with system message integration"""
+        """Build prompt with system message integration.
+
+        With ``include_system=False`` the system message is left out of the
+        text (the caller sends it as a separate system block) and only the
+        per-request tail is returned.
+        """
 
         prompt_parts = []
 
         # 1. Add system message if provided
-        if system_message:
+        if system_message and include_system:
             prompt_parts.append(f"SYSTEM INSTRUCTIONS:\n{system_message}\n")
 
         # 2. Add conversation context (existing functionality enhanced)
@@ -826,7 +989,18 @@ class MultiProviderLLMService(LLMServiceInterface):
 
         async def _generate_stream():
             try:
-                if self.current_provider == "anthropic":
+                if system_message and self._supports_system_block():
+                    tail_prompt = self._build_system_aware_prompt(
+                        prompt, context, system_message, include_system=False
+                    )
+                    stream = (
+                        self._stream_anthropic(tail_prompt, system_message)
+                        if self.current_provider == "anthropic"
+                        else self._stream_openai(tail_prompt, system_message)
+                    )
+                    async for chunk in stream:
+                        yield chunk
+                elif self.current_provider == "anthropic":
                     async for chunk in self._stream_anthropic(final_prompt):
                         yield chunk
                 elif self.current_provider == "openai":
@@ -897,34 +1071,38 @@ class MultiProviderLLMService(LLMServiceInterface):
             }
         return stats
 
-    async def _stream_anthropic(self, prompt: str) -> AsyncIterator[str]:
+    async def _stream_anthropic(
+        self, prompt: str, system: Optional[str] = None
+    ) -> AsyncIterator[str]:
         """Stream from Anthropic Claude"""
         try:
-            async for chunk in self.current_llm.astream(prompt):
-                content = chunk.content if hasattr(chunk, "content") else str(chunk)
+            async for chunk in self.current_llm.astream(prompt, system):
+                content = _content_or_str(chunk)
                 if content and content != "None":
                     yield content
         except Exception as e:
             logging.warning(f"Anthropic streaming failed, falling back to non-streaming: {e}")
             try:
-                response = await self.current_llm.ainvoke(prompt)
-                yield response.content if hasattr(response, "content") else str(response)
+                response = await self.current_llm.ainvoke(prompt, system)
+                yield _content_or_str(response)
             except Exception as fallback_err:
                 logging.error(f"Anthropic non-streaming fallback also failed: {fallback_err}", exc_info=True)
                 raise RuntimeError(f"Anthropic streaming exhausted: {fallback_err}") from fallback_err
 
-    async def _stream_openai(self, prompt: str) -> AsyncIterator[str]:
+    async def _stream_openai(
+        self, prompt: str, system: Optional[str] = None
+    ) -> AsyncIterator[str]:
         """Stream from OpenAI GPT"""
         try:
-            async for chunk in self.current_llm.astream(prompt):
-                content = chunk.content if hasattr(chunk, "content") else str(chunk)
+            async for chunk in self.current_llm.astream(prompt, system):
+                content = _content_or_str(chunk)
                 if content and content != "None":
                     yield content
         except Exception as e:
             logging.warning(f"OpenAI streaming failed, falling back to non-streaming: {e}")
             try:
-                response = await self.current_llm.ainvoke(prompt)
-                yield response.content if hasattr(response, "content") else str(response)
+                response = await self.current_llm.ainvoke(prompt, system)
+                yield _content_or_str(response)
             except Exception as fallback_err:
                 logging.error(f"OpenAI non-streaming fallback also failed: {fallback_err}", exc_info=True)
                 raise RuntimeError(f"OpenAI streaming exhausted: {fallback_err}") from fallback_err
@@ -933,14 +1111,14 @@ class MultiProviderLLMService(LLMServiceInterface):
         """Stream from AWS Bedrock"""
         try:
             async for chunk in self.current_llm.astream(prompt):
-                content = chunk.content if hasattr(chunk, "content") else str(chunk)
+                content = _content_or_str(chunk)
                 if content and content != "None":
                     yield content
         except Exception as e:
             logging.warning(f"Bedrock streaming failed, falling back to non-streaming: {e}")
             try:
                 response = await self.current_llm.ainvoke(prompt)
-                yield response.content if hasattr(response, "content") else str(response)
+                yield _content_or_str(response)
             except Exception as fallback_err:
                 logging.error(f"Bedrock non-streaming fallback also failed: {fallback_err}", exc_info=True)
                 raise RuntimeError(f"Bedrock streaming exhausted: {fallback_err}") from fallback_err
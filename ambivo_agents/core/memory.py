@@ -12,6 +12,7 @@ import gzip
 import hashlib
 import json
 import logging
+import sys
 import threading
 import time
 from abc import ABC, abstractmethod
@@ -86,6 +87,21 @@ class MemoryManagerInterface(ABC):
         """
         pass
 
+    def count_messages(self, conversation_id: Optional[str] = None, session_id: Optional[str] = None) -> int:
+        """Return the number of stored messages without deserializing them.
+
+        Backends should override this with a native count; the default falls
+        back to retrieving the messages.
+
+        Args:
+            conversation_id: Scope to a specific conversation.
+            session_id: Scope to a specific session.
+
+        Returns:
+            Number of stored messages.
+        """
+        return len(self.get_recent_messages(limit=sys.maxsize, conversation_id=conversation_id))
+
     @abstractmethod
     def store_context(self, key: str, value: Any, conversation_id: Optional[str] = None):
         """Store a key-value context entry.
@@ -201,6 +217,20 @@ class InMemoryMemoryManager(MemoryManagerInterface):
             self.stats.error_count += 1
             return []
 
+    def count_messages(self, conversation_id: Optional[str] = None, session_id: Optional[str] = None) -> int:
+        """Return the number of stored messages.
+
+        Args:
+            conversation_id: Scope to a specific conversation.
+            session_id: Scope to a specific session.
+
+        Returns:
+            Number of stored messages.
+        """
+        key = self._get_key(session_id, conversation_id)
+        self.stats.total_operations += 1
+        return len(self._messages.get(key, ()))
+
     def store_context(self, key: str, value: Any, conversation_id: Optional[str] = None, session_id: Optional[str] = None):
         """Store a key-value context entry.
 
@@ -714,6 +744,25 @@ class RedisMemoryManager(MemoryManagerInterface):
             self.stats.error_count += 1
             return []
 
+    def count_messages(self, conversation_id: Optional[str] = None, session_id: Optional[str] = None) -> int:
+        """Return the number of stored messages with a single LLEN.
+
+        Args:
+            conversation_id: Scope to a specific conversation.
+            session_id: Scope to a specific session.
+
+        Returns:
+            Number of stored messages (0 on error).
+        """
+        try:
+            key = self._get_message_key(session_id, conversation_id)
+            self.stats.total_operations += 1
+            return int(self.redis_client.llen(key))
+        except Exception as e:
+            logging.error(f"Error counting messages: {e}")
+            self.stats.error_count += 1
+            return 0
+
     def store_context(self, key: str, value: Any, conversation_id: Optional[str] = None, session_id: Optional[str] = None):
         """Store a key-value context entry in a Redis hash.
 
@@ -573,6 +573,11 @@ class FileProcessorService:
         if not text:
             return False
 
+        # Fast path: str.split() drops exactly the isspace() characters, so if
+        # what remains is printable every character qualifies
+        if "".join(text.split()).isprintable():
+            return True
+
         printable_chars = sum(1 for c in text if c.isprintable() or c.isspace())
         total_chars = len(text)
 
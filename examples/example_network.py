@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Shared connectivity check for the example scripts.
+
+Every demo talks to an LLM provider, so the scripts make one quick DNS probe
+of the configured provider's API host up front and skip their demos when it
+fails, instead of letting each demo wait out its own timeout.
+
+Set AMBIVO_EXAMPLES_OFFLINE=1 to skip without probing.
+"""
+
+import asyncio
+import os
+
+# Same order the LLM service ranks providers by when no preference is set
+_PROVIDER_KEYS = (
+    ("anthropic", "anthropic_api_key"),
+    ("openai", "openai_api_key"),
+    ("bedrock", "aws_access_key_id"),
+)
+
+
+def llm_api_host() -> str:
+    """Host name of the LLM provider the examples will talk to."""
+    try:
+        from ambivo_agents.config.loader import get_config_section
+
+        llm_config = get_config_section("llm")
+    except Exception:
+        llm_config = {}
+
+    configured = [name for name, key in _PROVIDER_KEYS if llm_config.get(key)]
+    preferred = llm_config.get("preferred_provider")
+    provider = preferred if preferred in configured else (configured or ["openai"])[0]
+
+    if provider == "anthropic":
+        return "api.anthropic.com"
+    if provider == "bedrock":
+        region = llm_config.get("aws_region") or "us-east-1"
+        return f"bedrock-runtime.{region}.amazonaws.com"
+    return "api.openai.com"
+
+
+async def llm_reachable(timeout: float = 1.0) -> bool:
+    """False when AMBIVO_EXAMPLES_OFFLINE=1 or the provider host does not resolve in time."""
+    if os.getenv("AMBIVO_EXAMPLES_OFFLINE") == "1":
+        return False
+    try:
+        await asyncio.wait_for(
+            asyncio.get_running_loop().getaddrinfo(llm_api_host(), 443), timeout
+        )
+    except (OSError, asyncio.TimeoutError):
+        return False
+    return True
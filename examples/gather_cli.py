@@ -25,27 +25,68 @@ Note
 """
 import argparse
 import asyncio
+import contextlib
+import copy
 import json
+import os
+import re
 import sys
-from typing import Any, Dict, Optional
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 from ambivo_agents.agents.gather_agent import GatherAgent
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _json_loads(data):
+    """Parse JSON text/bytes, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize to a JSON string, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    if indent:
+        return json.dumps(obj, indent=2)
+    # Compact like orjson: no padding after separators
+    return json.dumps(obj, separators=(",", ":"))
+
 
 class LocalMemory:
-    """Minimal async in-memory context store (subset used by GatherAgent)."""
+    """Minimal in-memory store implementing the sync MemoryManagerInterface subset used by GatherAgent."""
 
     def __init__(self):
         self._ctx: Dict[str, Any] = {}
+        self._messages: List[Any] = []
+
+    def store_message(self, message):
+        self._messages.append(message)
 
-    async def store_context(self, key: str, value: Any, conversation_id: Optional[str] = None):
+    def get_recent_messages(self, limit: int = 10, conversation_id: Optional[str] = None,
+                            session_id: Optional[str] = None):
+        return self._messages[-limit:]
+
+    def store_context(self, key: str, value: Any, conversation_id: Optional[str] = None,
+                      session_id: Optional[str] = None):
         self._ctx[key] = value
 
-    async def get_context(self, key: str, conversation_id: Optional[str] = None):
+    def get_context(self, key: str, conversation_id: Optional[str] = None,
+                    session_id: Optional[str] = None):
         return self._ctx.get(key)
 
-    async def clear_memory(self, conversation_id: Optional[str] = None):
+    def clear_memory(self, conversation_id: Optional[str] = None, session_id: Optional[str] = None):
         self._ctx.clear()
+        self._messages.clear()
 
 
 DEFAULT_QUESTIONNAIRE = {
@@ -95,22 +136,86 @@ DEFAULT_QUESTIONNAIRE = {
     ]
 }
 
+# Agent replies that mean the session is over (submitted, finished, or cancelled)
+_END_OF_SESSION_RE = re.compile(
+    r"submitting your responses now"
+    r"|we have reached the end of the questionnaire"
+    r"|thanks, that's all i needed"
+    r"|aborting the gathering",
+    re.IGNORECASE,
+)
+
+# The default questionnaire is constant, so render its prompts once at import;
+# handed to the agent via gather.prompt_cache
+_PROMPT_CACHE: Dict[str, str] = {
+    qn["question_id"]: GatherAgent.render_question_prompt(qn)
+    for qn in map(GatherAgent._normalize_question, DEFAULT_QUESTIONNAIRE["questions"])
+}
+
+
+# Parsed local questionnaires keyed by (path, mtime_ns, size); URLs are never cached
+_QUESTIONNAIRE_CACHE: "OrderedDict[Tuple[str, int, int], Dict[str, Any]]" = OrderedDict()
+_QUESTIONNAIRE_CACHE_MAX = 16
+_STRUCTURED_SUFFIXES = (".json", ".yaml", ".yml")
+
+
+def _questionnaire_cache_key(path: str) -> Optional[Tuple[str, int, int]]:
+    if path.startswith(("http://", "https://")):
+        return None
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+
 
 async def _load_questionnaire_from_path(agent: GatherAgent, path: str) -> Dict[str, Any]:
     """Use agent's file utils to read and parse JSON/YAML questionnaire from a file/URL."""
+    key = _questionnaire_cache_key(path)
+    if key is not None and key in _QUESTIONNAIRE_CACHE:
+        _QUESTIONNAIRE_CACHE.move_to_end(key)
+        return copy.deepcopy(_QUESTIONNAIRE_CACHE[key])
+
+    questionnaire = await _parse_questionnaire(agent, path)
+    if key is not None:
+        _QUESTIONNAIRE_CACHE[key] = copy.deepcopy(questionnaire)
+        while len(_QUESTIONNAIRE_CACHE) > _QUESTIONNAIRE_CACHE_MAX:
+            _QUESTIONNAIRE_CACHE.popitem(last=False)
+    return questionnaire
+
+
+async def _parse_questionnaire(agent: GatherAgent, path: str) -> Dict[str, Any]:
     res = await agent.read_and_parse_file(path, auto_parse=True)
     if not res.get("success"):
         raise RuntimeError(f"Failed to load questionnaire from {path}: {res.get('error')}")
-    content = res.get("content")
+    # read_and_parse_file has already parsed JSON/YAML; reuse that instead of parsing again
+    parse_result = res.get("parse_result") or {}
+    if not res.get("parsed") and parse_result.get("error") and Path(path).suffix.lower() in _STRUCTURED_SUFFIXES:
+        # The JSON/YAML parser already rejected this file; re-parsing the same text cannot succeed
+        raise RuntimeError(f"Failed to parse questionnaire {path}: {parse_result['error']}")
+    content = parse_result.get("data") if res.get("parsed") else res.get("content")
     if isinstance(content, (dict, list)):
         return content if isinstance(content, dict) else {"questions": content}
     # if text, try JSON
-    return json.loads(content)
+    return _json_loads(content)
+
+
+async def _chat_stream(agent: GatherAgent) -> AsyncIterator[str]:
+    """Read answers from stdin and yield the agent's reply to each one."""
+    while True:
+        try:
+            # Read stdin on a worker thread so the event loop keeps running while we wait
+            user_input = (await asyncio.to_thread(input, "> ")).strip()
+        except (EOFError, KeyboardInterrupt):
+            user_input = "cancel"
+            print("\nCancelling...")
+        yield await agent.chat(user_input)
 
 
 async def _simulate_submit(self, payload: Dict[str, Any]) -> Dict[str, Any]:
     print("\n[Simulated Submission] The agent would submit the following payload:")
-    print(json.dumps(payload, indent=2))
+    # Pretty-print for people; piped/CI output gets compact JSON
+    print(_json_dumps(payload, indent=sys.stdout.isatty()))
     return {"success": True, "status": 200, "response": "ok"}
 
 
@@ -140,6 +245,9 @@ async def main():
             "enable_natural_language_parsing": args.natural_language,  # Enable NLP if flag set
         }
     }
+    if not args.path:
+        # Pre-rendered prompts only match the built-in questionnaire
+        config["gather"]["prompt_cache"] = _PROMPT_CACHE
     
     # Create agent with optional LLM service for natural language parsing
     if args.natural_language:
@@ -189,28 +297,29 @@ async def main():
     else:
         print("For multi-select, enter comma-separated values, e.g., 'AWS, Azure'\n")
 
-    # Start by sending the questionnaire JSON
-    first_prompt = await agent.chat(json.dumps(questionnaire))
+    # Hand the parsed questionnaire to the agent and ask for the first question
+    await agent.load_questionnaire(questionnaire)
+    first_prompt = await agent.chat("start")
     print(first_prompt)
 
     # Interactive loop: after each answer, agent prompts next question or submits
-    while True:
-        try:
-            user_input = input("> ").strip()
-        except (EOFError, KeyboardInterrupt):
-            user_input = "cancel"
-            print("\nCancelling...")
-
-        reply = await agent.chat(user_input)
-        print(reply)
-
-        # Stop once the agent indicates it submitted (covers auto-submit or explicit finish/cancel)
-        lower = reply.lower()
-        if ("submitting your responses now" in lower) or ("we have reached the end of the questionnaire" in lower) or ("thanks, that's all i needed" in lower) or ("aborting the gathering" in lower):
-            break
+    async with contextlib.aclosing(_chat_stream(agent)) as replies:
+        async for reply in replies:
+            print(reply)
+            # Stop once the agent indicates it submitted (covers auto-submit or explicit finish/cancel)
+            if _END_OF_SESSION_RE.search(reply):
+                break
 
     print("\nDone. Goodbye!")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop (speedups extra) runs the event loop in C; fall back to the default loop
+    try:
+        import uvloop
+
+        loop_factory = uvloop.new_event_loop
+    except ImportError:
+        loop_factory = None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(main())
@@ -11,30 +11,70 @@ This script simulates a short form-filling conversation:
 To keep the example self-contained and not require Redis/LLM, we:
 - Use create_advanced with a tiny in-memory memory manager (LocalMemory)
 - Patch the submission endpoint to a placeholder; tests monkeypatch _submit
+
+Pass use_redis=True to run_demo to keep gather state in Redis instead
+(REDIS_URL if set, otherwise the redis section of agent_config.yaml), so
+several worker processes can share it.
 """
 import asyncio
-import json
-from typing import List, Optional, Any, Dict
+import os
+import sys
+import time
+from collections import OrderedDict
+from typing import List, Optional, Any, Dict, Tuple
+from urllib.parse import urlparse
 
 from ambivo_agents.agents.gather_agent import GatherAgent
+from ambivo_agents.config.loader import get_config_section, load_config
 from ambivo_agents.core.base import AgentMessage, MessageType
+from ambivo_agents.core.memory import create_redis_memory_manager
 
 
 class LocalMemory:
-    """Very small async in-memory key/value store implementing the subset
+    """Very small in-memory key/value store implementing the subset
     of MemoryManagerInterface used by GatherAgent (store_context/get_context).
+
+    Methods are plain functions: the memory interface is synchronous, and a
+    dict operation gains nothing from a coroutine hop. Context entries expire
+    after ``ttl`` seconds and the least recently used ones are evicted beyond
+    ``max_entries``, so the store stays bounded when reused in long runs.
     """
-    def __init__(self):
-        self._ctx: Dict[str, Any] = {}
 
-    async def store_context(self, key: str, value: Any, conversation_id: Optional[str] = None):
-        self._ctx[key] = value
+    def __init__(self, ttl: float = 3600, max_entries: int = 1024):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._ctx: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._messages: List[Any] = []
+
+    def store_message(self, message):
+        self._messages.append(message)
 
-    async def get_context(self, key: str, conversation_id: Optional[str] = None):
-        return self._ctx.get(key)
+    def get_recent_messages(self, limit: int = 10, conversation_id: Optional[str] = None,
+                            session_id: Optional[str] = None):
+        return self._messages[-limit:]
 
-    async def clear_memory(self, conversation_id: Optional[str] = None):
+    def store_context(self, key: str, value: Any, conversation_id: Optional[str] = None,
+                      session_id: Optional[str] = None):
+        self._ctx.pop(key, None)
+        self._ctx[key] = (time.monotonic() + self.ttl, value)
+        while len(self._ctx) > self.max_entries:
+            self._ctx.popitem(last=False)
+
+    def get_context(self, key: str, conversation_id: Optional[str] = None,
+                    session_id: Optional[str] = None):
+        entry = self._ctx.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._ctx[key]
+            return None
+        self._ctx.move_to_end(key)
+        return value
+
+    def clear_memory(self, conversation_id: Optional[str] = None, session_id: Optional[str] = None):
         self._ctx.clear()
+        self._messages.clear()
 
 
 DEFAULT_QUESTIONNAIRE = {
@@ -79,142 +119,208 @@ DEFAULT_QUESTIONNAIRE = {
 }
 
 
-async def run_demo(questionnaire: dict | None = None, enable_nlp: bool = False) -> List[str]:
+def _demo_config(enable_nlp: bool) -> Dict[str, Any]:
+    return {
+        "gather": {
+            "submission_endpoint": "http://localhost/void",
+            "submission_method": "POST",
+            "submission_headers": {"Content-Type": "application/json"},
+            "memory_ttl_seconds": 3600,
+            "enable_natural_language_parsing": enable_nlp,
+        }
+    }
+
+
+def _redis_config_from_env() -> Optional[Dict[str, Any]]:
+    """Redis connection settings from REDIS_URL, or None to use agent_config.yaml."""
+    url = os.getenv("REDIS_URL")
+    if not url:
+        return None
+    parsed = urlparse(url)
+    config: Dict[str, Any] = {
+        "host": parsed.hostname or "localhost",
+        "port": parsed.port or 6379,
+        "db": int(parsed.path.lstrip("/") or 0),
+        "ssl": parsed.scheme == "rediss",
+    }
+    if parsed.password:
+        config["password"] = parsed.password
+    return config
+
+
+# One agent per (mode, backend), reused across demo runs so config/LLM setup happens once
+_AGENT_CACHE: Dict[Tuple[bool, bool], GatherAgent] = {}
+
+
+def get_or_create_agent(enable_nlp: bool = False, use_redis: bool = False) -> GatherAgent:
+    """Return the shared demo agent for the given mode, creating it on first use."""
+    agent = _AGENT_CACHE.get((enable_nlp, use_redis))
+    if agent is None:
+        if enable_nlp:
+            # Use create_simple for auto-configured LLM when NLP is enabled; it
+            # already picks Redis memory when Redis is configured
+            agent = GatherAgent.create_simple(user_id="gather_demo", config=_demo_config(True))
+        else:
+            # Create agent with minimal config and local (or Redis) memory
+            config = _demo_config(False)
+            if use_redis:
+                memory = create_redis_memory_manager("gather_demo", _redis_config_from_env())
+            else:
+                memory = LocalMemory(ttl=config["gather"]["memory_ttl_seconds"], max_entries=1024)
+            agent = GatherAgent.create_advanced(
+                agent_id="gather_demo",
+                memory_manager=memory,
+                llm_service=None,  # no LLM needed for deterministic prompts
+                config=config,
+            )
+        _AGENT_CACHE[(enable_nlp, use_redis)] = agent
+    return agent
+
+
+async def run_demo(
+    questionnaire: dict | None = None, enable_nlp: bool = False, use_redis: bool = False
+) -> List[str]:
     """Run a short conversation with GatherAgent and return response texts.
     
     Args:
         questionnaire: Optional custom questionnaire
         enable_nlp: Whether to enable natural language parsing
+        use_redis: Keep gather state in Redis instead of the in-process LocalMemory
     """
     qn = questionnaire or DEFAULT_QUESTIONNAIRE
 
-    # Create agent with optional natural language parsing
-    if enable_nlp:
-        # Use create_simple for auto-configured LLM when NLP is enabled
-        agent = GatherAgent.create_simple(
-            user_id="gather_demo",
-            config={
-                "gather": {
-                    "submission_endpoint": "http://localhost/void",
-                    "submission_method": "POST",
-                    "submission_headers": {"Content-Type": "application/json"},
-                    "memory_ttl_seconds": 3600,
-                    "enable_natural_language_parsing": True,  # Enable NLP
-                }
-            },
-        )
-    else:
-        # Create agent with minimal config and local memory
-        agent = GatherAgent.create_advanced(
-            agent_id="gather_demo",
-            memory_manager=LocalMemory(),
-            llm_service=None,  # no LLM needed for deterministic prompts
-            config={
-                "gather": {
-                    "submission_endpoint": "http://localhost/void",
-                    "submission_method": "POST",
-                    "submission_headers": {"Content-Type": "application/json"},
-                    "memory_ttl_seconds": 3600,
-                    "enable_natural_language_parsing": False,
-                }
-            },
-        )
+    # Reuse the mode's agent; loading the questionnaire replaces any previous run's state
+    agent = get_or_create_agent(enable_nlp, use_redis)
 
     responses: List[str] = []
 
-    # 1) Provide the questionnaire JSON to the agent
-    msg1 = AgentMessage(
-        id="m1",
-        sender_id="user_demo",
-        recipient_id=agent.agent_id,
-        content=json.dumps(qn),
-        message_type=MessageType.USER_INPUT,
-        session_id=agent.context.session_id,
-        conversation_id=agent.context.conversation_id,
-    )
-    r1 = await agent.process_message(msg1)
-    responses.append(r1.content)
+    # Resolve the per-turn lookups once; every message shares sender, session and conversation
+    process_message = agent.process_message
+    recipient_id = agent.agent_id
+    session_id = agent.context.session_id
+    conversation_id = agent.context.conversation_id
+
+    async def send(msg_id: str, content: str) -> str:
+        reply = await process_message(
+            AgentMessage(
+                id=msg_id,
+                sender_id="user_demo",
+                recipient_id=recipient_id,
+                content=content,
+                message_type=MessageType.USER_INPUT,
+                session_id=session_id,
+                conversation_id=conversation_id,
+            )
+        )
+        responses.append(reply.content)
+        return reply.content
+
+    # 1) Hand the questionnaire to the agent directly (no JSON round-trip);
+    #    the first message then gets the first question
+    await agent.load_questionnaire(qn)
+    await send("m1", "start")
 
     # 2) Answer the first question - use natural language if enabled
-    answer_content = "Absolutely, we have multiple tools!" if enable_nlp else "Yes"
-    msg2 = AgentMessage(
-        id="m2",
-        sender_id="user_demo",
-        recipient_id=agent.agent_id,
-        content=answer_content,
-        message_type=MessageType.USER_INPUT,
-        session_id=agent.context.session_id,
-        conversation_id=agent.context.conversation_id,
-    )
-    r2 = await agent.process_message(msg2)
-    responses.append(r2.content)
+    r2 = await send("m2", "Absolutely, we have multiple tools!" if enable_nlp else "Yes")
 
     # 3) Answer the conditional question (single-select) - natural language if enabled
-    if "preferred security vendor" in r2.content:
-        answer_content = "I'd go with Microsoft Defender" if enable_nlp else "microsoft"
-        msg3 = AgentMessage(
-            id="m3",
-            sender_id="user_demo",
-            recipient_id=agent.agent_id,
-            content=answer_content,
-            message_type=MessageType.USER_INPUT,
-            session_id=agent.context.session_id,
-            conversation_id=agent.context.conversation_id,
-        )
-        r3 = await agent.process_message(msg3)
-        responses.append(r3.content)
-    
+    if "preferred security vendor" in r2:
+        await send("m3", "I'd go with Microsoft Defender" if enable_nlp else "microsoft")
+
     # 4) Answer the multi-select question - natural language if enabled
-    answer_content = "We need both SOC 2 and ISO certification" if enable_nlp else "soc2, iso27001"
-    msg4 = AgentMessage(
-        id="m4",
-        sender_id="user_demo",
-        recipient_id=agent.agent_id,
-        content=answer_content,
-        message_type=MessageType.USER_INPUT,
-        session_id=agent.context.session_id,
-        conversation_id=agent.context.conversation_id,
+    await send(
+        "m4", "We need both SOC 2 and ISO certification" if enable_nlp else "soc2, iso27001"
     )
-    r4 = await agent.process_message(msg4)
-    responses.append(r4.content)
 
     return responses
 
 
+_RULE = "=" * 70
+
+_COMPARISON_HEADER = "\n".join((
+    _RULE,
+    "GatherAgent Demo: Strict vs Natural Language Modes",
+    _RULE,
+))
+
+_MODES_TEXT = "\n".join((
+    "",
+    "1. STRICT MODE (Default):",
+    "-" * 30,
+    "User answers: 'Yes', 'microsoft', 'soc2, iso27001'",
+    "Agent accepts exact matches only.",
+    "",
+    "",
+    "2. NATURAL LANGUAGE MODE:",
+    "-" * 30,
+    "User answers: 'Absolutely, we have multiple tools!', ",
+    "              'I'd go with Microsoft Defender',",
+    "              'We need both SOC 2 and ISO certification'",
+))
+
+_CONFIG_TEXT = "\n".join((
+    _RULE,
+    "Configuration:",
+    "  gather:",
+    "    enable_natural_language_parsing: true  # or false",
+    "",
+    "Or via environment variable:",
+    "  export AMBIVO_AGENTS_GATHER_ENABLE_NATURAL_LANGUAGE_PARSING=true",
+    _RULE,
+))
+
+
+def _llm_available() -> bool:
+    """Cheap check for a configured LLM provider, without constructing any client."""
+    try:
+        llm_cfg = get_config_section("llm", load_config())
+    except Exception:
+        return False
+    return any(llm_cfg.get(k) for k in ("openai_api_key", "anthropic_api_key", "aws_access_key_id"))
+
+
 async def demo_comparison():
     """Show the difference between strict and natural language modes"""
-    print("=" * 70)
-    print("GatherAgent Demo: Strict vs Natural Language Modes")
-    print("=" * 70)
-    
-    print("\n1. STRICT MODE (Default):")
-    print("-" * 30)
-    strict_responses = await run_demo(enable_nlp=False)
-    print("User answers: 'Yes', 'microsoft', 'soc2, iso27001'")
-    print("Agent accepts exact matches only.\n")
-    
-    print("\n2. NATURAL LANGUAGE MODE:")
-    print("-" * 30)
-    print("User answers: 'Absolutely, we have multiple tools!', ")
-    print("              'I'd go with Microsoft Defender',")
-    print("              'We need both SOC 2 and ISO certification'")
-    
-    # Only run NLP demo if LLM is configured
-    try:
-        nlp_responses = await run_demo(enable_nlp=True)
+    sys.stdout.write(_COMPARISON_HEADER + "\n")
+
+    if _llm_available():
+        # The two runs use separate agents, so run them concurrently; the NLP run
+        # waits on the LLM while the strict run completes locally.
+        strict_result, nlp_result = await asyncio.gather(
+            run_demo(enable_nlp=False),
+            run_demo(enable_nlp=True),
+            return_exceptions=True,
+        )
+        if isinstance(strict_result, BaseException):
+            raise strict_result
+    else:
+        # Don't build an LLM-backed agent just to find out there is no provider
+        await run_demo(enable_nlp=False)
+        nlp_result = None
+
+    sys.stdout.write(_MODES_TEXT + "\n")
+
+    # The NLP run only succeeds if an LLM is configured
+    if nlp_result is None:
+        print("Note: Natural language mode requires LLM configuration; skipped.\n")
+    elif isinstance(nlp_result, Exception):
+        print(f"Note: Natural language mode requires LLM configuration: {nlp_result}\n")
+    elif isinstance(nlp_result, BaseException):
+        raise nlp_result
+    else:
         print("Agent understands conversational responses!\n")
-    except Exception as e:
-        print(f"Note: Natural language mode requires LLM configuration: {e}\n")
-    
-    print("=" * 70)
-    print("Configuration:")
-    print("  gather:")
-    print("    enable_natural_language_parsing: true  # or false")
-    print("\nOr via environment variable:")
-    print("  export AMBIVO_AGENTS_GATHER_ENABLE_NATURAL_LANGUAGE_PARSING=true")
-    print("=" * 70)
+
+    sys.stdout.write(_CONFIG_TEXT + "\n")
 
 
 if __name__ == "__main__":
+    # uvloop (speedups extra) runs the event loop in C; fall back to the default loop
+    try:
+        import uvloop
+
+        loop_factory = uvloop.new_event_loop
+    except ImportError:
+        loop_factory = None
     # Run comparison demo
-    asyncio.run(demo_comparison())
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(demo_comparison())
@@ -6,9 +6,13 @@ to intelligently gather information from multiple sources and ensure high-qualit
 """
 
 import asyncio
+import hashlib
+import re
 import sys
 import os
-from typing import Dict, Any, Optional
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
 from datetime import datetime
 import json
 from pathlib import Path
@@ -22,19 +26,104 @@ from ambivo_agents.core import AgentSession
 from ambivo_agents.config.loader import load_config
 import logging
 
+try:
+    import aiofiles
+
+    AIOFILES_AVAILABLE = True
+except ImportError:
+    AIOFILES_AVAILABLE = False
+
+
+_WELCOME_TEXT = """
+Features:
+- Multi-source information gathering (Knowledge Base, Web Search, Web Scraping)
+- Automatic response quality assessment
+- Intelligent source prioritization based on query analysis
+- Iterative improvement until quality threshold is met
+
+Commands:
+  /help - Show this help message
+  /status - Show system status and last response quality
+  /sources - Show available information sources
+  /history - Show conversation history
+  /clear - Clear conversation history
+  /config - Show current configuration
+  /prefer <source> - Set source preference (kb/web/all)
+  /quality - Show last response quality assessment
+  /exit or /quit - Exit the system
+"""
+
+_WELCOME_TEMPLATE = (
+    "\n" + "=" * 80 + "\n"
+    "Intelligent Conversation System\n"
+    + "=" * 80 + "\n"
+    "Session ID: {session_id}\n"
+    "Quality Threshold: {quality_threshold}\n"
+    + _WELCOME_TEXT
+    + "=" * 80 + "\n\n"
+)
+
+_SOURCES_TEXT = """
+Information Sources:
+  1. Knowledge Base - Curated information repository
+  2. Web Search - Real-time internet search
+  3. Web Scraping - Deep content extraction from URLs
+
+Current Strategy: Adaptive (based on query analysis)
+"""
+
+# Queries are compared as lower-cased word sequences, ignoring punctuation and spacing
+_WORD_RE = re.compile(r"\w+")
+
+# Leading list markers ("1.", "-", "*") stripped from predicted follow-up questions
+_LIST_MARKER_RE = re.compile(r"^\s*(?:\d+[.)]|[-*])\s*")
+
+# Quality indicator shown next to each response
+_QUALITY_EMOJI = {
+    'excellent': '',
+    'good': '[OK]',
+    'fair': '[WARN]',
+    'poor': '[ERROR]',
+    'unacceptable': ''
+}
+
+_HELP_TEXT = """
+Available Commands:
+  /help - Show this help message
+  /status - Show system status
+  /sources - Show information sources status
+  /history - Show conversation history
+  /clear - Clear conversation history
+  /config - Show current configuration
+  /prefer <source> - Set source preference
+    - /prefer kb - Prioritize knowledge base
+    - /prefer web - Prioritize web search
+    - /prefer all - Use all sources in parallel
+  /quality - Show last response quality assessment
+  /exit or /quit - Exit the system
+
+"""
+
 
 class IntelligentConversationSystem:
     """
     A conversation system that uses multiple information sources
     and ensures response quality through assessment.
     """
+
+    # Repeated (query, preferences) pairs are answered from an in-process cache;
+    # queries are keyed on their casefolded word sequence, so only case and
+    # punctuation differences hit the same entry
+    RESULT_CACHE_TTL_SECONDS = 15 * 60
+    RESULT_CACHE_MAX_ENTRIES = 100
     
     def __init__(
         self,
         user_id: str = "default_user",
         config_path: Optional[str] = None,
         quality_threshold: QualityLevel = QualityLevel.GOOD,
-        enable_logging: bool = True
+        enable_logging: bool = True,
+        prefetch_follow_ups: int = 0
     ):
         """
         Initialize the intelligent conversation system.
@@ -44,6 +133,10 @@ class IntelligentConversationSystem:
             config_path: Path to configuration file
             quality_threshold: Minimum acceptable quality level
             enable_logging: Enable detailed logging
+            prefetch_follow_ups: After each answer, predict this many likely
+                follow-up questions and answer them into the cache in the
+                background while the user reads (0 disables; each one costs a
+                full multi-source query)
         """
         self.user_id = user_id
         self.config = load_config(config_path) if config_path else None
@@ -61,11 +154,17 @@ class IntelligentConversationSystem:
         self.moderator = None
         self.context = None
         self.conversation_history = []
+        self._history_file = None  # JSONL handle, opened on the first saved turn
+        self._history_saved = False
         self.session_metadata = {
             'start_time': datetime.now().isoformat(),
             'user_id': user_id,
             'quality_threshold': quality_threshold.value
         }
+        # digest -> (stored_at, query words, preferences JSON, result)
+        self._result_cache: "OrderedDict[bytes, tuple]" = OrderedDict()
+        self.prefetch_follow_ups = prefetch_follow_ups
+        self._prefetch_task: Optional[asyncio.Task] = None
     
     async def initialize(self):
         """Initialize the conversation system and agents"""
@@ -83,28 +182,12 @@ class IntelligentConversationSystem:
         
         self.logger.info(f"System initialized with session ID: {self.context.session_id}")
         
-        # Display welcome message
-        print("\n" + "="*80)
-        print("Intelligent Conversation System")
-        print("="*80)
-        print(f"Session ID: {self.context.session_id}")
-        print(f"Quality Threshold: {self.quality_threshold.value}")
-        print("\nFeatures:")
-        print("- Multi-source information gathering (Knowledge Base, Web Search, Web Scraping)")
-        print("- Automatic response quality assessment")
-        print("- Intelligent source prioritization based on query analysis")
-        print("- Iterative improvement until quality threshold is met")
-        print("\nCommands:")
-        print("  /help - Show this help message")
-        print("  /status - Show system status and last response quality")
-        print("  /sources - Show available information sources")
-        print("  /history - Show conversation history")
-        print("  /clear - Clear conversation history")
-        print("  /config - Show current configuration")
-        print("  /prefer <source> - Set source preference (kb/web/all)")
-        print("  /quality - Show last response quality assessment")
-        print("  /exit or /quit - Exit the system")
-        print("="*80 + "\n")
+        # Display welcome message in a single write
+        sys.stdout.write(_WELCOME_TEMPLATE.format(
+            session_id=self.context.session_id,
+            quality_threshold=self.quality_threshold.value
+        ))
+        sys.stdout.flush()
     
     async def process_command(self, command: str) -> bool:
         """
@@ -116,119 +199,122 @@ class IntelligentConversationSystem:
         Returns:
             True if command was processed, False if it's exit command
         """
-        command = command.lower().strip()
-        
-        if command in ['/exit', '/quit']:
-            return False
-        
-        elif command == '/help':
-            print("\nAvailable Commands:")
-            print("  /help - Show this help message")
-            print("  /status - Show system status")
-            print("  /sources - Show information sources status")
-            print("  /history - Show conversation history")
-            print("  /clear - Clear conversation history")
-            print("  /config - Show current configuration")
-            print("  /prefer <source> - Set source preference")
-            print("    - /prefer kb - Prioritize knowledge base")
-            print("    - /prefer web - Prioritize web search")
-            print("    - /prefer all - Use all sources in parallel")
-            print("  /quality - Show last response quality assessment")
-            print("  /exit or /quit - Exit the system\n")
-        
-        elif command == '/status':
-            print("\nSystem Status:")
-            print(f"  Session ID: {self.context.session_id}")
-            print(f"  User ID: {self.user_id}")
-            print(f"  Quality Threshold: {self.quality_threshold.value}")
-            print(f"  Conversation Length: {len(self.conversation_history)} messages")
-            print(f"  Session Started: {self.session_metadata['start_time']}")
-            if self.conversation_history:
-                last_entry = self.conversation_history[-1]
-                if 'quality_assessment' in last_entry:
-                    qa = last_entry['quality_assessment']
-                    print(f"  Last Response Quality: {qa.get('quality_level', 'N/A')}")
-                    print(f"  Last Confidence Score: {qa.get('confidence_score', 0):.2f}")
-        
-        elif command == '/sources':
-            print("\nInformation Sources:")
-            print("  1. Knowledge Base - Curated information repository")
-            print("  2. Web Search - Real-time internet search")
-            print("  3. Web Scraping - Deep content extraction from URLs")
-            print("\nCurrent Strategy: Adaptive (based on query analysis)")
-        
-        elif command == '/history':
-            if not self.conversation_history:
-                print("\nNo conversation history yet.")
-            else:
-                print("\nConversation History:")
-                print("-" * 60)
-                for i, entry in enumerate(self.conversation_history, 1):
-                    print(f"\n[{i}] {entry['timestamp']}")
-                    print(f"User: {entry['user_message'][:100]}...")
-                    print(f"Assistant: {entry['assistant_response'][:100]}...")
-                    if 'quality_assessment' in entry:
-                        qa = entry['quality_assessment']
-                        print(f"Quality: {qa.get('quality_level', 'N/A')} (confidence: {qa.get('confidence_score', 0):.2f})")
-        
-        elif command == '/clear':
-            self.conversation_history = []
-            await self.moderator.clear_conversation_history()
-            print("\nConversation history cleared.")
-        
-        elif command == '/config':
-            print("\nCurrent Configuration:")
-            print(f"  Quality Threshold: {self.quality_threshold.value}")
-            print(f"  Max Iterations: {self.moderator.max_iterations}")
-            print(f"  Auto Scraping: {self.moderator.enable_auto_scraping}")
-            print(f"  Max Scrape URLs: {self.moderator.max_scrape_urls}")
-        
-        elif command.startswith('/prefer '):
-            preference = command.split(' ', 1)[1] if ' ' in command else ''
-            if preference == 'kb':
-                self.session_metadata['preference'] = 'knowledge_base'
-                print("\n[OK] Preference set: Prioritize Knowledge Base")
-            elif preference == 'web':
-                self.session_metadata['preference'] = 'web_search'
-                print("\n[OK] Preference set: Prioritize Web Search")
-            elif preference == 'all':
-                self.session_metadata['preference'] = 'all'
-                print("\n[OK] Preference set: Use all sources in parallel")
-            else:
-                print("\n[ERROR] Invalid preference. Use: kb, web, or all")
-        
-        elif command == '/quality':
-            if self.conversation_history and 'quality_assessment' in self.conversation_history[-1]:
-                qa = self.conversation_history[-1]['quality_assessment']
-                print("\nLast Response Quality Assessment:")
-                print(f"  Quality Level: {qa.get('quality_level', 'N/A')}")
-                print(f"  Confidence Score: {qa.get('confidence_score', 0):.2f}")
-                print(f"  Sources Used: {', '.join(qa.get('sources_used', []))}")
-                
-                if qa.get('strengths'):
-                    print(f"\n  [OK] Strengths:")
-                    for strength in qa['strengths']:
-                        print(f"    - {strength}")
-                
-                if qa.get('weaknesses'):
-                    print(f"\n  [WARN]Weaknesses:")
-                    for weakness in qa['weaknesses']:
-                        print(f"    - {weakness}")
-            else:
-                print("\nNo quality assessment available yet.")
-        
-        else:
-            print(f"\n[ERROR] Unknown command: {command}")
+        verb, _, arg = command.strip().lower().partition(' ')
+        handler = self._COMMANDS.get(verb)
+        if handler is None:
+            print(f"\n[ERROR] Unknown command: {command.strip()}")
             print("Type /help for available commands.")
+            return True
+        return await handler(self, arg.strip()) is not False
+    
+    async def _cmd_exit(self, arg: str) -> bool:
+        return False
+    
+    async def _cmd_help(self, arg: str):
+        sys.stdout.write(_HELP_TEXT)
+        sys.stdout.flush()
+    
+    async def _cmd_status(self, arg: str):
+        print("\nSystem Status:")
+        print(f"  Session ID: {self.context.session_id}")
+        print(f"  User ID: {self.user_id}")
+        print(f"  Quality Threshold: {self.quality_threshold.value}")
+        print(f"  Conversation Length: {len(self.conversation_history)} messages")
+        print(f"  Session Started: {self.session_metadata['start_time']}")
+        if self.conversation_history:
+            last_entry = self.conversation_history[-1]
+            if 'quality_assessment' in last_entry:
+                qa = last_entry['quality_assessment']
+                print(f"  Last Response Quality: {qa.get('quality_level', 'N/A')}")
+                print(f"  Last Confidence Score: {qa.get('confidence_score', 0):.2f}")
+    
+    async def _cmd_sources(self, arg: str):
+        sys.stdout.write(_SOURCES_TEXT)
+        sys.stdout.flush()
+    
+    async def _cmd_history(self, arg: str):
+        if not self.conversation_history:
+            print("\nNo conversation history yet.")
+            return
+        print("\nConversation History:")
+        print("-" * 60)
+        for i, entry in enumerate(self.conversation_history, 1):
+            print(f"\n[{i}] {entry['timestamp']}")
+            print(f"User: {entry['user_message'][:100]}...")
+            print(f"Assistant: {entry['assistant_response'][:100]}...")
+            if 'quality_assessment' in entry:
+                qa = entry['quality_assessment']
+                print(f"Quality: {qa.get('quality_level', 'N/A')} (confidence: {qa.get('confidence_score', 0):.2f})")
+    
+    async def _cmd_clear(self, arg: str):
+        self.conversation_history = []
+        self._result_cache.clear()
+        await self.moderator.clear_conversation_history()
+        print("\nConversation history cleared.")
+    
+    async def _cmd_config(self, arg: str):
+        print("\nCurrent Configuration:")
+        print(f"  Quality Threshold: {self.quality_threshold.value}")
+        print(f"  Max Iterations: {self.moderator.max_iterations}")
+        print(f"  Auto Scraping: {self.moderator.enable_auto_scraping}")
+        print(f"  Max Scrape URLs: {self.moderator.max_scrape_urls}")
+    
+    async def _cmd_prefer(self, arg: str):
+        if arg == 'kb':
+            self.session_metadata['preference'] = 'knowledge_base'
+            print("\n[OK] Preference set: Prioritize Knowledge Base")
+        elif arg == 'web':
+            self.session_metadata['preference'] = 'web_search'
+            print("\n[OK] Preference set: Prioritize Web Search")
+        elif arg == 'all':
+            self.session_metadata['preference'] = 'all'
+            print("\n[OK] Preference set: Use all sources in parallel")
+        else:
+            print("\n[ERROR] Invalid preference. Use: kb, web, or all")
+    
+    async def _cmd_quality(self, arg: str):
+        if not (self.conversation_history and 'quality_assessment' in self.conversation_history[-1]):
+            print("\nNo quality assessment available yet.")
+            return
+        qa = self.conversation_history[-1]['quality_assessment']
+        print("\nLast Response Quality Assessment:")
+        print(f"  Quality Level: {qa.get('quality_level', 'N/A')}")
+        print(f"  Confidence Score: {qa.get('confidence_score', 0):.2f}")
+        print(f"  Sources Used: {', '.join(qa.get('sources_used', []))}")
         
-        return True
+        if qa.get('strengths'):
+            print(f"\n  [OK] Strengths:")
+            for strength in qa['strengths']:
+                print(f"    - {strength}")
+        
+        if qa.get('weaknesses'):
+            print(f"\n  [WARN]Weaknesses:")
+            for weakness in qa['weaknesses']:
+                print(f"    - {weakness}")
     
-    async def process_message(self, message: str) -> Dict[str, Any]:
+    # Command word -> handler(self, argument); a handler returning False ends the session
+    _COMMANDS = {
+        '/exit': _cmd_exit,
+        '/quit': _cmd_exit,
+        '/help': _cmd_help,
+        '/status': _cmd_status,
+        '/sources': _cmd_sources,
+        '/history': _cmd_history,
+        '/clear': _cmd_clear,
+        '/config': _cmd_config,
+        '/prefer': _cmd_prefer,
+        '/quality': _cmd_quality,
+    }
+    
+    async def process_message(
+        self, message: str, on_token: Optional[Callable[[str], Any]] = None
+    ) -> Dict[str, Any]:
         """
         Process a user message and return response with quality assessment.
         
         Args:
             message: User's message
+            on_token: Called with answer text as it is generated (not for cache hits)
             
         Returns:
             Response dictionary with quality assessment
@@ -244,10 +330,28 @@ class IntelligentConversationSystem:
         print("\nProcessing your query...")
         print("  1⃣ Analyzing query to determine optimal search strategy...")
         
-        result = await self.moderator.process_with_quality_assessment(
-            message,
-            user_preferences
-        )
+        words = _WORD_RE.findall(message.casefold())
+        prefs = json.dumps(user_preferences, sort_keys=True)
+        cache_key = self._cache_key(words, prefs)
+        result = self._get_cached_result(cache_key)
+        from_cache = result is not None
+        if from_cache:
+            print("  (answered from cache)")
+        else:
+            # Predictions for the previous turn are stale now; free the sources for this one
+            await self._cancel_prefetch()
+            result = await self.moderator.process_with_quality_assessment(
+                message,
+                user_preferences,
+                on_token=on_token
+            )
+            if on_token is not None:
+                print()  # end the streamed answer line
+            self._store_cached_result(cache_key, result)
+            if self.prefetch_follow_ups > 0:
+                self._prefetch_task = asyncio.create_task(
+                    self._prefetch(message, result.get('response', ''), user_preferences)
+                )
         
         # Display progress information
         if 'query_analysis' in result:
@@ -266,12 +370,102 @@ class IntelligentConversationSystem:
             'assistant_response': result.get('response', ''),
             'quality_assessment': result.get('quality_assessment', {}),
             'query_analysis': result.get('query_analysis', {}),
-            'metadata': result.get('metadata', {})
+            'metadata': result.get('metadata', {}),
+            'from_cache': from_cache
         }
         self.conversation_history.append(history_entry)
+        await self._save_history_line(history_entry)
         
         return result
     
+    @property
+    def history_path(self) -> str:
+        """Where this session's turns are appended, one JSON record per line"""
+        return f"conversation_history_{self.context.session_id}.jsonl"
+    
+    async def _save_history_line(self, record: Dict[str, Any]):
+        """Append one record to the session's JSONL history so nothing is lost on a crash."""
+        line = json.dumps(record, default=str) + "\n"
+        try:
+            if AIOFILES_AVAILABLE:
+                if self._history_file is None:
+                    self._history_file = await aiofiles.open(self.history_path, 'a')
+                await self._history_file.write(line)
+                await self._history_file.flush()
+            else:
+                await asyncio.to_thread(self._append_history_line, line)
+            self._history_saved = True
+        except Exception as e:
+            self.logger.error(f"Failed to save conversation history: {e}")
+    
+    def _append_history_line(self, line: str):
+        with open(self.history_path, 'a') as f:
+            f.write(line)
+    
+    @staticmethod
+    def _cache_key(words: List[str], prefs: str) -> bytes:
+        """Digest of the preferences and the query's word sequence"""
+        return hashlib.sha256(f"{prefs}\n{' '.join(words)}".encode()).digest()
+
+    async def _prefetch(self, message: str, response: str, user_preferences: Dict[str, Any]):
+        """Answer likely follow-up questions into the result cache in the background."""
+        try:
+            predicted = await self.moderator.llm_service.generate_response(
+                f"User asked: {message}\n\nAssistant answered: {response[:2000]}\n\n"
+                f"List the {self.prefetch_follow_ups} follow-up questions this user is most "
+                "likely to ask next, one per line, with no other text."
+            )
+            questions = [
+                _LIST_MARKER_RE.sub("", line).strip() for line in str(predicted).splitlines()
+            ]
+            prefs = json.dumps(user_preferences, sort_keys=True)
+            for question in [q for q in questions if q][: self.prefetch_follow_ups]:
+                words = _WORD_RE.findall(question.casefold())
+                key = self._cache_key(words, prefs)
+                if self._get_cached_result(key) is not None:
+                    continue
+                result = await self.moderator.process_with_quality_assessment(
+                    question, user_preferences
+                )
+                self._store_cached_result(key, result)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.logger.debug(f"Follow-up prefetch stopped: {e}")
+
+    async def _cancel_prefetch(self):
+        """Stop an in-flight prefetch, keeping whatever it already cached."""
+        task, self._prefetch_task = self._prefetch_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def _get_cached_result(self, key: bytes) -> Optional[Dict[str, Any]]:
+        """Return a cached result for key if it has not expired"""
+        entry = self._result_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, result = entry
+        if time.monotonic() - stored_at > self.RESULT_CACHE_TTL_SECONDS:
+            del self._result_cache[key]
+            return None
+        self._result_cache.move_to_end(key)
+        return result
+
+    def _store_cached_result(self, key: bytes, result: Dict[str, Any]):
+        """Cache a result, evicting the least recently used entries.
+
+        Results with an empty response are cached too, so a query already
+        known to yield nothing is not sent to the LLM again within the TTL.
+        """
+        self._result_cache[key] = (time.monotonic(), result)
+        self._result_cache.move_to_end(key)
+        while len(self._result_cache) > self.RESULT_CACHE_MAX_ENTRIES:
+            self._result_cache.popitem(last=False)
+
     async def run(self):
         """Run the interactive conversation loop"""
         await self.initialize()
@@ -280,7 +474,8 @@ class IntelligentConversationSystem:
             while True:
                 # Get user input
                 try:
-                    user_input = input("\nYou: ").strip()
+                    # Read on a worker thread so background tasks keep running
+                    user_input = (await asyncio.to_thread(input, "\nYou: ")).strip()
                 except (EOFError, KeyboardInterrupt):
                     print("\n\nGoodbye!")
                     break
@@ -297,32 +492,36 @@ class IntelligentConversationSystem:
                 
                 # Process user message
                 try:
-                    result = await self.process_message(user_input)
+                    # Print the answer as it is generated rather than after the whole pipeline
+                    streamed = []
+                    
+                    def show_token(token: str):
+                        if not streamed:
+                            sys.stdout.write("\nAssistant: ")
+                        streamed.append(token)
+                        sys.stdout.write(token)
+                        sys.stdout.flush()
+                    
+                    result = await self.process_message(user_input, on_token=show_token)
                     
-                    # Display response
-                    print(f"\nAssistant: {result.get('response', 'No response generated.')}")
+                    # Build the rest of the response block and write it in one go
+                    lines = [] if streamed else [f"\nAssistant: {result.get('response', 'No response generated.')}"]
                     
                     # Display quality indicator
                     if 'quality_assessment' in result:
                         quality = result['quality_assessment']
                         quality_level = quality.get('quality_level', 'unknown')
                         confidence = quality.get('confidence_score', 0)
+                        quality_emoji = _QUALITY_EMOJI.get(quality_level, '')
                         
-                        # Quality indicator emoji
-                        quality_emoji = {
-                            'excellent': '',
-                            'good': '[OK]',
-                            'fair': '[WARN]',
-                            'poor': '[ERROR]',
-                            'unacceptable': ''
-                        }.get(quality_level, '')
-                        
-                        print(f"\n{quality_emoji} Response Quality: {quality_level} (confidence: {confidence:.2%})")
+                        lines.append(f"\n{quality_emoji} Response Quality: {quality_level} (confidence: {confidence:.2%})")
                         
                         # Show sources used
                         if quality.get('sources_used'):
-                            sources_display = ', '.join(quality['sources_used'])
-                            print(f"Sources: {sources_display}")
+                            lines.append(f"Sources: {', '.join(quality['sources_used'])}")
+                    
+                    sys.stdout.write("\n".join(lines) + "\n")
+                    sys.stdout.flush()
                 
                 except Exception as e:
                     self.logger.error(f"Error processing message: {e}")
@@ -336,19 +535,15 @@ class IntelligentConversationSystem:
     async def cleanup(self):
         """Clean up resources"""
         self.logger.info("Cleaning up conversation system...")
+        await self._cancel_prefetch()
         
-        # Save conversation history if needed
-        if self.conversation_history:
-            history_file = f"conversation_history_{self.context.session_id}.json"
-            try:
-                with open(history_file, 'w') as f:
-                    json.dump({
-                        'session_metadata': self.session_metadata,
-                        'conversation_history': self.conversation_history
-                    }, f, indent=2, default=str)
-                print(f"\nConversation history saved to: {history_file}")
-            except Exception as e:
-                self.logger.error(f"Failed to save conversation history: {e}")
+        # Turns were appended as they happened; close the log with the session metadata
+        if self._history_saved:
+            await self._save_history_line({'session_metadata': self.session_metadata})
+            print(f"\nConversation history saved to: {self.history_path}")
+        if self._history_file is not None:
+            await self._history_file.close()
+            self._history_file = None
         
         # Cleanup moderator
         if self.moderator:
@@ -372,6 +567,8 @@ async def main():
                        choices=['excellent', 'good', 'fair', 'poor'],
                        help='Minimum quality threshold')
     parser.add_argument('--no-logging', action='store_true', help='Disable logging')
+    parser.add_argument('--prefetch', type=int, default=0, metavar='N',
+                       help='Answer N predicted follow-up questions in the background after each reply')
     
     args = parser.parse_args()
     
@@ -389,7 +586,8 @@ async def main():
         user_id=args.user_id,
         config_path=args.config,
         quality_threshold=quality_threshold,
-        enable_logging=not args.no_logging
+        enable_logging=not args.no_logging,
+        prefetch_follow_ups=args.prefetch
     )
     
     try:
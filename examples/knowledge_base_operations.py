@@ -11,11 +11,15 @@ License: MIT
 """
 
 import asyncio
+import contextlib
+import hashlib
+import io
 import os
 import sys
 import time
 import json
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
@@ -173,7 +177,7 @@ class KnowledgeBaseDemo:
             )
 
             # Test connection by getting collections
-            collections = client.get_collections()
+            collections = await asyncio.to_thread(client.get_collections)
             print("[OK] Qdrant is accessible")
             print(f"Found {len(collections.collections)} existing collections")
 
@@ -259,13 +263,13 @@ class KnowledgeBaseDemo:
             print(f"[ERROR] [DIRECT] Exception during text ingestion: {e}")
             raise
 
-    async def direct_query_knowledge_base(self, query: str):
+    async def direct_query_knowledge_base(self, query: str, out=None):
         """Directly query KB using KB agent"""
         if not self.kb_agent:
             raise RuntimeError("No direct KB agent available - initialization failed")
 
         try:
-            print(f"[DIRECT] Querying: {query}")
+            print(f"[DIRECT] Querying: {query}", file=out)
 
             # Use the agent's tool directly with configured kb_name
             result = await self.kb_agent._query_knowledge_base(
@@ -278,28 +282,84 @@ class KnowledgeBaseDemo:
                 answer = result.get('answer', 'No answer provided')
                 sources = result.get('source_details', [])
 
-                print(f"[OK] [DIRECT] Query successful!")
-                print(f"Answer: {answer}")
+                print(f"[OK] [DIRECT] Query successful!", file=out)
+                print(f"Answer: {answer}", file=out)
 
                 if sources:
-                    print(f"Found {len(sources)} source(s)")
+                    print(f"Found {len(sources)} source(s)", file=out)
                     for i, source in enumerate(sources[:2], 1):  # Show first 2 sources
                         if isinstance(source, dict):
-                            print(f"  Source {i}: {source.get('source', 'Unknown')}")
+                            print(f"  Source {i}: {source.get('source', 'Unknown')}", file=out)
 
                 return answer
             else:
-                print(f"[ERROR] [DIRECT] Query failed: {result.get('error', 'Unknown error')}")
+                print(f"[ERROR] [DIRECT] Query failed: {result.get('error', 'Unknown error')}", file=out)
                 return None
 
         except Exception as e:
-            print(f"[ERROR] [DIRECT] Exception during query: {e}")
+            print(f"[ERROR] [DIRECT] Exception during query: {e}", file=out)
             raise
 
-    def create_sample_documents(self):
-        """Create sample text documents for ingestion in configured directory"""
-        print(f"\nCreating sample documents in: {self.docs_dir}")
-
+    async def direct_query_batch(self, queries: list, max_concurrency: int = 3):
+        """Run several independent KB queries concurrently
+
+        Yields (output, answer) per query in the original order, as soon as that
+        query and the ones before it are done; ``output`` is the query's buffered
+        log and ``answer`` is the result or the exception it raised.
+        """
+        sem = asyncio.Semaphore(max_concurrency)
+        total = len(queries)
+
+        async def _run(i: int, query: str):
+            buf = io.StringIO()
+            print(f"\n--- Query {i}/{total}: {query[:50]}... ---", file=buf)
+            try:
+                async with sem:
+                    answer = await self.direct_query_knowledge_base(query, out=buf)
+            except Exception as e:
+                answer = e
+            return buf.getvalue(), answer
+
+        tasks = [asyncio.create_task(_run(i, q)) for i, q in enumerate(queries, 1)]
+        try:
+            for task in tasks:
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    @staticmethod
+    def _write_if_changed(file_path: Path, text: str) -> bool:
+        """Write text unless file_path already holds it, per its .sha256 sidecar
+
+        Returns True when the file was (re)written.
+        """
+        # Encode once and use the same bytes for hashing and writing
+        data = text.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest().encode("ascii")
+        hash_path = file_path.with_name(file_path.name + ".sha256")
+        try:
+            if file_path.exists() and hash_path.read_bytes().strip() == digest:
+                return False
+        except OSError:
+            pass
+
+        # Write to temp files and rename so an interrupted run never leaves
+        # a document paired with a stale hash
+        for path, payload in ((file_path, data), (hash_path, digest)):
+            tmp = path.with_name(path.name + ".tmp")
+            tmp.write_bytes(payload)
+            tmp.replace(path)
+        return True
+
+    @staticmethod
+    def _report_sample_documents(results):
+        for file_path, was_written in results:
+            print(f"{'Created' if was_written else 'Unchanged'}: {file_path.name}")
+        return [str(file_path) for file_path, _ in results]
+
+    def _write_sample_documents(self):
+        """Write the sample documents without printing; returns [(path, was_written)]"""
         documents = {
             "company_overview.txt": """
 Ambivo Company Overview
@@ -387,14 +447,14 @@ Deployment Recommendations:
             """
         }
 
-        created_files = []
-        for filename, content in documents.items():
-            file_path = self.docs_dir / filename
-            file_path.write_text(content.strip())
-            created_files.append(str(file_path))
-            print(f"Created: {filename}")
+        # The documents are independent, so submit all writes as one batch
+        paths = [self.docs_dir / filename for filename in documents]
+        with ThreadPoolExecutor(max_workers=len(paths)) as pool:
+            written = list(pool.map(
+                self._write_if_changed, paths, (c.strip() for c in documents.values())
+            ))
 
-        return created_files
+        return list(zip(paths, written))
 
     async def run_comprehensive_demo(self):
         """Run the complete knowledge base demonstration - CONFIG-DRIVEN VERSION"""
@@ -402,7 +462,12 @@ Deployment Recommendations:
         print("COMPREHENSIVE KNOWLEDGE BASE OPERATIONS DEMO (CONFIG-DRIVEN)")
         print("=" * 80)
 
+        docs_task = None
         try:
+            # Writing the sample documents is local disk work that step 4 needs;
+            # start it now so it overlaps the network checks below.
+            docs_task = asyncio.create_task(asyncio.to_thread(self._write_sample_documents))
+
             # 1. Test Qdrant connection with configured URL
             await self.test_qdrant_connection()
 
@@ -423,7 +488,8 @@ Deployment Recommendations:
 
             # 4. Create sample documents in configured directory
             print("\n--- Creating Sample Documents ---")
-            document_files = self.create_sample_documents()
+            print(f"\nCreating sample documents in: {self.docs_dir}")
+            document_files = self._report_sample_documents(await docs_task)
 
             # 5. Direct document ingestion
             print("\n--- Direct Document Ingestion ---")
@@ -486,40 +552,47 @@ Deployment Recommendations:
                 "What enterprise features are available?"
             ]
 
+            # The queries are independent: run a few at a time (bounded for rate
+            # limits) instead of one by one with a fixed pause in between
             successful_queries = 0
-            for i, query in enumerate(queries, 1):
-                print(f"\n--- Query {i}/{len(queries)}: {query[:50]}... ---")
-
-                try:
-                    answer = await self.direct_query_knowledge_base(query)
-                    if answer and len(answer) > 50:  # Valid answer with substance
-                        successful_queries += 1
-                        print(f"[OK] Query successful")
-                    else:
-                        print(f"[WARN] Query returned minimal response")
-                except Exception as e:
-                    print(f"[ERROR] Query failed: {e}")
-
-                await asyncio.sleep(1)
+            async for output, answer in self.direct_query_batch(queries):
+                sys.stdout.write(output)
+                if isinstance(answer, Exception):
+                    print(f"[ERROR] Query failed: {answer}")
+                elif answer and len(answer) > 50:  # Valid answer with substance
+                    successful_queries += 1
+                    print(f"[OK] Query successful")
+                else:
+                    print(f"[WARN] Query returned minimal response")
 
             # 9. Final verification
             print("\n--- Final Verification ---")
             await self.test_qdrant_connection()
 
-            print(f"\n[OK] Knowledge Base operations demo completed!")
-            print(f"Documents ingested: {ingested_count}")
-            print(f"Text content ingested: {'[OK]' if text_success else '[ERROR]'}")
-            print(f"Successful queries: {successful_queries}/{len(queries)}")
-
+            summary = [
+                "\n[OK] Knowledge Base operations demo completed!",
+                f"Documents ingested: {ingested_count}",
+                f"Text content ingested: {'[OK]' if text_success else '[ERROR]'}",
+                f"Successful queries: {successful_queries}/{len(queries)}",
+            ]
             if successful_queries > 0:
-                print("Knowledge Base is working correctly with your configuration!")
-            else:
+                summary.append("Knowledge Base is working correctly with your configuration!")
+            sys.stdout.write("\n".join(summary) + "\n")
+
+            if successful_queries == 0:
                 raise RuntimeError("All queries failed - check Qdrant connection and agent configuration")
 
         except Exception as e:
             print(f"\n[ERROR] Demo failed with error: {e}")
             print("Check your agent_config.yaml file for proper configuration")
             raise
+        finally:
+            # An early failure leaves the write unawaited; reap it so its
+            # outcome is not reported as a never-retrieved task exception
+            if docs_task is not None:
+                docs_task.cancel()  # no-op once it has finished
+                with contextlib.suppress(asyncio.CancelledError, Exception):
+                    await docs_task
 
     async def cleanup(self):
         """Clean up demo resources"""
@@ -527,7 +600,7 @@ Deployment Recommendations:
 
         # Delete the demo session
         if self.session_id:
-            success = self.agent_service.delete_session(self.session_id)
+            success = await asyncio.to_thread(self.agent_service.delete_session, self.session_id)
             if success:
                 print(f"[OK] Deleted demo session: {self.session_id}")
 
@@ -549,7 +622,8 @@ async def main():
     args = parser.parse_args()
 
     try:
-        demo = KnowledgeBaseDemo()
+        # Service creation and session setup are blocking I/O; keep them off the event loop
+        demo = await asyncio.to_thread(KnowledgeBaseDemo)
 
         # Override kb_name if provided
         if args.kb_name:
@@ -605,500 +679,3 @@ async def main():
 
 if __name__ == "__main__":
     asyncio.run(main())
-
-
-    async def initialize_direct_kb_agent(self):
-        """Initialize Knowledge Base Agent directly"""
-        try:
-            from ambivo_agents.config.loader import load_config, get_config_section
-            from ambivo_agents.agents.knowledge_base import KnowledgeBaseAgent
-
-            print("Initializing direct Knowledge Base Agent...")
-
-            # Load configuration
-            config = load_config()
-            redis_config = get_config_section('redis', config)
-            llm_config = get_config_section('llm', config)
-
-            # Create memory manager for KB agent
-            kb_memory = create_memory_manager(f"kb_agent_{int(time.time())}", redis_config)
-
-            # Create LLM service
-            self.llm_service = create_multi_provider_llm_service(llm_config)
-
-            # Create KB agent directly
-            self.kb_agent = KnowledgeBaseAgent(
-                agent_id=f"kb_direct_{int(time.time())}",
-                memory_manager=kb_memory,
-                llm_service=self.llm_service
-            )
-
-            print("[OK] Direct Knowledge Base Agent initialized successfully!")
-            return True
-
-        except Exception as e:
-            print(f"[ERROR] Failed to initialize direct KB agent: {e}")
-            return False
-
-
-    async def check_knowledge_base_availability(self):
-        """Check if knowledge base agent is available"""
-        print("\nChecking Knowledge Base Agent Availability...")
-
-        # Try to initialize direct KB agent
-        if await self.initialize_direct_kb_agent():
-            print("[OK] Knowledge Base Agent is available (direct mode)")
-            return True
-
-        # Fallback to service health check
-        health = self.agent_service.health_check()
-        available_agents = health.get('available_agent_types', {})
-
-        if available_agents.get('knowledge_base', False):
-            print("[OK] Knowledge Base Agent is available (via service)")
-            return True
-        else:
-            print("[ERROR] Knowledge Base Agent is not available")
-            print("Please ensure knowledge_base is enabled in agent_config.yaml")
-            print("Also ensure Qdrant is running and accessible")
-            return False
-
-
-    async def direct_ingest_document(self, file_path: str):
-        """Directly ingest a document using KB agent"""
-        if not self.kb_agent:
-            print("[ERROR] No direct KB agent available")
-            return False
-
-        try:
-            print(f"[DIRECT] Ingesting document: {file_path}")
-
-            # Use the agent's tool directly
-            result = await self.kb_agent._ingest_document(
-                kb_name=self.kb_name,
-                doc_path=file_path,
-                custom_meta={
-                    "demo_source": "direct_ingestion",
-                    "file_name": Path(file_path).name
-                }
-            )
-
-            if result.get('success'):
-                print(f"[OK] [DIRECT] Document ingested: {result.get('message', 'Success')}")
-                return True
-            else:
-                print(f"[ERROR] [DIRECT] Ingestion failed: {result.get('error', 'Unknown error')}")
-                return False
-
-        except Exception as e:
-            print(f"[ERROR] [DIRECT] Exception during ingestion: {e}")
-            return False
-
-
-    async def direct_ingest_text(self, text_content: str, metadata: dict = None):
-        """Directly ingest text using KB agent"""
-        if not self.kb_agent:
-            print("[ERROR] No direct KB agent available")
-            return False
-
-        try:
-            print(f"[DIRECT] Ingesting text content ({len(text_content)} chars)")
-
-            # Use the agent's tool directly
-            result = await self.kb_agent._ingest_text(
-                kb_name=self.kb_name,
-                input_text=text_content,
-                custom_meta=metadata or {"demo_source": "direct_text_ingestion"}
-            )
-
-            if result.get('success'):
-                print(f"[OK] [DIRECT] Text ingested: {result.get('message', 'Success')}")
-                return True
-            else:
-                print(f"[ERROR] [DIRECT] Text ingestion failed: {result.get('error', 'Unknown error')}")
-                return False
-
-        except Exception as e:
-            print(f"[ERROR] [DIRECT] Exception during text ingestion: {e}")
-            return False
-
-
-    async def direct_query_knowledge_base(self, query: str):
-        """Directly query KB using KB agent"""
-        if not self.kb_agent:
-            print("[ERROR] No direct KB agent available")
-            return None
-
-        try:
-            print(f"[DIRECT] Querying: {query}")
-
-            # Use the agent's tool directly
-            result = await self.kb_agent._query_knowledge_base(
-                kb_name=self.kb_name,
-                query=query,
-                question_type="free-text"
-            )
-
-            if result.get('success'):
-                answer = result.get('answer', 'No answer provided')
-                sources = result.get('source_details', [])
-
-                print(f"[OK] [DIRECT] Query successful!")
-                print(f"Answer: {answer}")
-
-                if sources:
-                    print(f"Found {len(sources)} source(s)")
-                    for i, source in enumerate(sources[:2], 1):  # Show first 2 sources
-                        if isinstance(source, dict):
-                            print(f"  Source {i}: {source.get('source', 'Unknown')}")
-
-                return answer
-            else:
-                print(f"[ERROR] [DIRECT] Query failed: {result.get('error', 'Unknown error')}")
-                return None
-
-        except Exception as e:
-            print(f"[ERROR] [DIRECT] Exception during query: {e}")
-            return None
-
-
-    def create_sample_documents(self):
-        """Create sample text documents for ingestion"""
-        print("\nCreating sample documents for knowledge base...")
-
-        documents = {
-            "company_overview.txt": """
-Ambivo Company Overview
-
-Ambivo is a leading technology company specializing in artificial intelligence and automation solutions. 
-Founded in 2020, we have been at the forefront of developing innovative AI-powered systems that help 
-businesses streamline their operations and improve efficiency.
-
-Our Mission:
-To democratize artificial intelligence and make advanced automation accessible to businesses of all sizes.
-
-Our Vision:
-A world where intelligent automation empowers every organization to achieve unprecedented efficiency and innovation.
-
-Core Values:
-- Innovation: We constantly push the boundaries of what's possible with AI
-- Integrity: We build trustworthy and transparent AI systems
-- Inclusivity: We make AI accessible to everyone
-- Impact: We focus on creating meaningful solutions that solve real problems
-
-Founded: 2020
-Headquarters: San Francisco, California
-Employees: 50+
-Industry: Artificial Intelligence, Software Development
-            """,
-
-            "products_services.txt": """
-Ambivo Products and Services
-
-1. Ambivo Agents Platform
-   - Multi-agent AI system for enterprise automation
-   - Supports code execution, web scraping, media processing
-   - Redis-based memory management
-   - Docker-based secure execution
-   - Multi-LLM provider support (OpenAI, Anthropic, AWS Bedrock)
-
-2. Knowledge Base Solutions
-   - Vector database integration with Qdrant
-   - Document ingestion and semantic search
-   - Support for PDF, DOCX, TXT, and web content
-   - Custom metadata and chunking strategies
-
-3. Pricing Plans
-   - Starter Plan: $99/month - Basic features for small teams
-   - Professional Plan: $299/month - Advanced features and integrations
-   - Enterprise Plan: Custom pricing - Full platform access
-   - Consulting Services: $200/hour - Custom development and training
-
-4. Support Services
-   - 24/7 technical support
-   - Custom agent development
-   - Training and onboarding
-   - API integration assistance
-            """,
-
-            "best_practices.txt": """
-Ambivo Agents Best Practices
-
-Performance Optimization:
-- Enable Redis compression for large datasets
-- Use appropriate chunk sizes for document ingestion
-- Configure connection pooling for high-throughput applications
-- Monitor memory usage and scale Redis as needed
-
-Security Guidelines:
-- Always run code execution in isolated Docker containers
-- Use environment variables for API keys and secrets
-- Enable TLS/SSL for all network communications
-- Implement proper input validation and sanitization
-- Regular security audits and updates
-
-Knowledge Base Management:
-- Use descriptive collection names
-- Add meaningful metadata to documents
-- Regular backup of Qdrant data
-- Monitor query performance and optimize as needed
-- Implement proper document lifecycle management
-
-Deployment Recommendations:
-- Use Docker Compose for multi-service deployments
-- Implement health checks for all services
-- Set up monitoring and alerting
-- Plan for disaster recovery
-- Use load balancers for high availability
-            """
-        }
-
-        created_files = []
-        for filename, content in documents.items():
-            file_path = self.docs_dir / filename
-            file_path.write_text(content.strip())
-            created_files.append(str(file_path))
-            print(f"Created: {filename}")
-
-        return created_files
-
-
-    async def test_qdrant_connection(self):
-        """Test direct connection to Qdrant using config URL"""
-        try:
-            print("\nTesting Qdrant connection...")
-
-            # Load Qdrant URL from configuration
-            from ambivo_agents.config.loader import load_config, get_config_section
-            config = load_config()
-            print("!!!!!!!config {}".format(config))
-            kb_config = get_config_section('knowledge_base', config)
-            qdrant_url = kb_config.get('qdrant_url', None)
-            if not qdrant_url:
-                raise ValueError("Qdrant URL not found in knowledge_base section of agent_config.yaml")
-
-            print(f"Using Qdrant URL from config: {qdrant_url}")
-
-            # Test basic connection
-            import requests
-            health_url = f"{qdrant_url}/health"
-            response = requests.get(health_url, timeout=5)
-
-            if response.status_code == 200:
-                print("[OK] Qdrant is accessible")
-
-                # Check collections
-                collections_url = f"{qdrant_url}/collections"
-                collections_response = requests.get(collections_url, timeout=5)
-
-                if collections_response.status_code == 200:
-                    collections = collections_response.json()
-                    print(f"Current collections: {len(collections.get('result', {}).get('collections', []))}")
-
-                    for collection in collections.get('result', {}).get('collections', []):
-                        print(f"  - {collection.get('name', 'Unknown')}")
-
-                return True
-            else:
-                print(f"[ERROR] Qdrant returned status: {response.status_code}")
-                return False
-
-        except Exception as e:
-            print(f"[ERROR] Qdrant connection failed: {e}")
-            print(f"Check qdrant_url in agent_config.yaml: {qdrant_url}")
-            print("Make sure Qdrant is running and accessible")
-            return False
-
-
-    async def run_comprehensive_demo(self):
-        """Run the complete knowledge base demonstration """
-        print("\n" + "=" * 80)
-        print("COMPREHENSIVE KNOWLEDGE BASE OPERATIONS DEMO ")
-        print("=" * 80)
-
-        try:
-            # 1. Test Qdrant connection first
-            if not await self.test_qdrant_connection():
-                print("[ERROR] Cannot proceed without Qdrant connection")
-                return
-
-            # 2. Check agent availability
-            if not await self.check_knowledge_base_availability():
-                print("[ERROR] Knowledge Base agent not available. Exiting demo.")
-                return
-
-            if not self.kb_agent:
-                print("[ERROR] No direct KB agent available. Cannot proceed with demo.")
-                return
-
-            # 3. Create sample documents
-            print("\n--- Creating Sample Documents ---")
-            document_files = self.create_sample_documents()
-
-            # 4. Direct document ingestion
-            print("\n--- Direct Document Ingestion ---")
-            ingested_count = 0
-
-            for doc_file in document_files:
-                success = await self.direct_ingest_document(doc_file)
-                if success:
-                    ingested_count += 1
-                await asyncio.sleep(1)  # Rate limiting
-
-            print(f"Successfully ingested {ingested_count}/{len(document_files)} documents")
-
-            # 5. Direct text ingestion
-            print("\n--- Direct Text Ingestion ---")
-
-            sample_text = """
-            Ambivo Agents Advanced Features
-
-            Machine Learning Integration:
-            - Support for custom ML models
-            - Automated model training and deployment
-            - Real-time inference capabilities
-            - Model versioning and rollback
-
-            Enterprise Features:
-            - Single Sign-On (SSO) integration
-            - Role-based access control
-            - Audit logging and compliance
-            - High availability deployment
-            - Multi-tenancy support
-
-            API Capabilities:
-            - RESTful API for all operations
-            - WebSocket support for real-time updates
-            - GraphQL endpoint for flexible queries
-            - Comprehensive API documentation
-            - Rate limiting and throttling
-            """
-
-            text_success = await self.direct_ingest_text(
-                sample_text,
-                {"category": "advanced_features", "importance": "high"}
-            )
-
-            # 6. Verify collections were created
-            print("\n--- Verifying Qdrant Collections ---")
-            await self.test_qdrant_connection()
-
-            # 7. Direct querying
-            print("\n--- Direct Knowledge Base Queries ---")
-
-            queries = [
-                "What is Ambivo's mission and vision?",
-                "What are the pricing plans for Ambivo services?",
-                "What are the best practices for performance optimization?",
-                "What advanced features does Ambivo Agents offer?",
-                "How much does the Professional Plan cost?",
-                "What security guidelines should I follow?",
-                "What enterprise features are available?"
-            ]
-
-            successful_queries = 0
-            for i, query in enumerate(queries, 1):
-                print(f"\n--- Query {i}/{len(queries)}: {query[:50]}... ---")
-
-                answer = await self.direct_query_knowledge_base(query)
-                if answer and "No proxy scraping methods" not in answer:
-                    successful_queries += 1
-                    print(f"[OK] Query successful")
-                else:
-                    print(f"[ERROR] Query failed or returned invalid response")
-
-                await asyncio.sleep(1)
-
-            # 8. Final verification
-            print("\n--- Final Verification ---")
-            await self.test_qdrant_connection()
-
-            print(f"\n[OK] Knowledge Base operations demo completed!")
-            print(f"Documents ingested: {ingested_count}")
-            print(f"Text content ingested: {'[OK]' if text_success else '[ERROR]'}")
-            print(f"Successful queries: {successful_queries}/{len(queries)}")
-
-            if successful_queries > 0:
-                print("Knowledge Base is working correctly!")
-            else:
-                print("[WARN] Knowledge Base queries failed - check Qdrant and agent configuration")
-
-        except Exception as e:
-            print(f"\n[ERROR] Demo failed with error: {e}")
-            import traceback
-            traceback.print_exc()
-
-
-    async def cleanup(self):
-        """Clean up demo resources"""
-        print("\nCleaning up demo resources...")
-
-        # Delete the demo session
-        if self.session_id:
-            success = self.agent_service.delete_session(self.session_id)
-            if success:
-                print(f"[OK] Deleted demo session: {self.session_id}")
-
-        print("[OK] Cleanup completed")
-        print("Note: Knowledge base data remains in Qdrant for future use")
-        print(" To clear Qdrant data: docker restart qdrant-container")
-
-
-async def main():
-    """Main function to run the knowledge base operations demo"""
-    import argparse
-
-    parser = argparse.ArgumentParser(description="Knowledge Base Operations Demo (Fixed)")
-    parser.add_argument("--kb-name", default="ambivo_demo_kb",
-                        help="Knowledge base name to use")
-    parser.add_argument("--query-only", help="Perform only a specific query")
-    parser.add_argument("--ingest-file", help="Ingest a specific file")
-    parser.add_argument("--test-connection", action="store_true", help="Test Qdrant connection only")
-
-    args = parser.parse_args()
-
-    try:
-        demo = KnowledgeBaseDemo()
-        demo.kb_name = args.kb_name
-
-        if args.test_connection:
-            # Test connection only
-            await demo.test_qdrant_connection()
-
-        elif args.query_only:
-            # Perform specific query only
-            print(f"Performing specific query: {args.query_only}")
-
-            if await demo.check_knowledge_base_availability():
-                answer = await demo.direct_query_knowledge_base(args.query_only)
-                if answer:
-                    print(f"\nFull Answer:\n{answer}")
-
-        elif args.ingest_file:
-            # Ingest specific file only
-            print(f"Ingesting specific file: {args.ingest_file}")
-
-            if await demo.check_knowledge_base_availability():
-                success = await demo.direct_ingest_document(args.ingest_file)
-                if success:
-                    print(f"[OK] File ingested successfully: {args.ingest_file}")
-
-                    # Test query
-                    test_query = f"What information is contained in the document {Path(args.ingest_file).name}?"
-                    await demo.direct_query_knowledge_base(test_query)
-        else:
-            # Run full demo
-            await demo.run_comprehensive_demo()
-
-        await demo.cleanup()
-
-    except KeyboardInterrupt:
-        print("\n\n[WARN] Demo interrupted by user")
-    except Exception as e:
-        print(f"\n\n[ERROR] Demo failed with error: {e}")
-        import traceback
-        traceback.print_exc()
-
-
-if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
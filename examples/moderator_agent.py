@@ -16,6 +16,8 @@ Email: sgosain@ambivo.com
 """
 
 import asyncio
+import io
+import sys
 import time
 from typing import List, Dict, Any
 
@@ -81,35 +83,46 @@ class SimpleModeratorTest:
             print(f"[ERROR] Failed to setup ModeratorAgent: {e}")
             raise
 
-    async def test_query(self, message: str, description: str = None) -> str:
-        """Test a single query with the moderator"""
+    async def test_query(self, message: str, description: str = None, out=None) -> str:
+        """Test a single query with the moderator
+
+        ``out`` is an optional text stream; when omitted output goes to stdout.
+        """
         if description:
-            print(f"\n{description}")
+            print(f"\n{description}", file=out)
 
-        print(f"Query: '{message}'")
+        print(f"Query: '{message}'", file=out)
 
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             # Use the simple chat interface
             response = await self.moderator.chat(message)
 
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
 
-            print(f"Response: {response}")
-            print(f"Processing time: {processing_time:.2f}s")
+            print(f"Response: {response}", file=out)
+            print(f"Processing time: {processing_time:.2f}s", file=out)
 
             return response
 
         except Exception as e:
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             error_msg = f"[ERROR] Error: {e}"
-            print(error_msg)
-            print(f"Processing time: {processing_time:.2f}s")
+            print(error_msg, file=out)
+            print(f"Processing time: {processing_time:.2f}s", file=out)
             return error_msg
 
-    async def run_test_suite(self):
-        """Run a comprehensive test suite"""
+    async def run_test_suite(self, parallel: bool = False, max_concurrency: int = 4):
+        """Run a comprehensive test suite
+
+        With ``parallel=True`` the queries run concurrently (bounded by
+        ``max_concurrency``); each query's output is buffered and written, in
+        case order, as soon as that case and all earlier ones have finished.
+        The concurrent ``chat()`` calls share this moderator's single session,
+        so the cases see each other's turns in the conversation history in
+        completion order; run sequentially when that context matters.
+        """
         print("Running ModeratorAgent Test Suite")
         print("=" * 50)
 
@@ -137,40 +150,83 @@ class SimpleModeratorTest:
             }
         ]
 
-        results = []
-
-        for i, test_case in enumerate(test_cases, 1):
-            print(f"\nTest {i}/{len(test_cases)}")
-            print("-" * 30)
-
-            response = await self.test_query(
-                test_case["message"],
-                test_case["description"]
-            )
-
-            results.append({
-                "test_number": i,
-                "message": test_case["message"],
-                "description": test_case["description"],
-                "response": response,
-                "success": not response.startswith("[ERROR]")
-            })
+        if parallel:
+            results = await self._run_cases_parallel(test_cases, max_concurrency)
+        else:
+            results = []
+            for i, test_case in enumerate(test_cases, 1):
+                print(f"\nTest {i}/{len(test_cases)}")
+                print("-" * 30)
 
-        # Print summary
-        print("\nTest Summary")
-        print("=" * 50)
+                response = await self.test_query(
+                    test_case["message"],
+                    test_case["description"]
+                )
+                results.append(self._make_result(i, test_case, response))
 
         successful_tests = sum(1 for r in results if r["success"])
         total_tests = len(results)
 
-        print(f"[OK] Successful: {successful_tests}/{total_tests}")
-        print(f"[ERROR] Failed: {total_tests - successful_tests}/{total_tests}")
+        # Render the summary into one buffer and write it in a single call
+        buf = io.StringIO()
+        print("\nTest Summary", file=buf)
+        print("=" * 50, file=buf)
+        print(f"[OK] Successful: {successful_tests}/{total_tests}", file=buf)
+        print(f"[ERROR] Failed: {total_tests - successful_tests}/{total_tests}", file=buf)
 
         if successful_tests == total_tests:
-            print("All tests passed!")
+            print("All tests passed!", file=buf)
         else:
-            print("[WARN]Some tests failed - check agent configuration and availability")
+            print("[WARN]Some tests failed - check agent configuration and availability", file=buf)
+        sys.stdout.write(buf.getvalue())
+
+        return results
 
+    @staticmethod
+    def _make_result(i: int, test_case: Dict[str, str], response: str) -> Dict[str, Any]:
+        return {
+            "test_number": i,
+            "message": test_case["message"],
+            "description": test_case["description"],
+            "response": response,
+            "success": not response.startswith("[ERROR]")
+        }
+
+    async def _run_cases_parallel(self, test_cases: List[Dict[str, str]],
+                                  max_concurrency: int) -> List[Dict[str, Any]]:
+        """Run test cases concurrently, printing each case's output atomically
+
+        Results are rendered in order as soon as each one is ready, so output
+        for earlier cases is written while later queries are still in flight.
+        """
+        sem = asyncio.Semaphore(max_concurrency)
+        total = len(test_cases)
+
+        async def _run(i: int, test_case: Dict[str, str]):
+            buf = io.StringIO()
+            print(f"\nTest {i}/{total}", file=buf)
+            print("-" * 30, file=buf)
+            try:
+                async with sem:
+                    response = await self.test_query(
+                        test_case["message"],
+                        test_case["description"],
+                        out=buf
+                    )
+            except Exception as e:
+                # Keep one failing case from cancelling the rest of the group
+                response = f"[ERROR] Error: {e}"
+                print(response, file=buf)
+            return buf.getvalue(), response
+
+        results = []
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(_run(i, tc)) for i, tc in enumerate(test_cases, 1)]
+            for i, (test_case, task) in enumerate(zip(test_cases, tasks), 1):
+                output, response = await task
+                sys.stdout.write(output)
+                sys.stdout.flush()
+                results.append(self._make_result(i, test_case, response))
         return results
 
     async def interactive_mode(self):
@@ -183,16 +239,18 @@ class SimpleModeratorTest:
 
         while True:
             try:
-                user_input = input("\n You: ").strip()
+                # Read on a worker thread so background tasks keep running
+                user_input = (await asyncio.to_thread(input, "\n You: ")).strip()
 
                 if not user_input:
                     continue
 
-                if user_input.lower() in ['quit', 'exit', 'bye']:
+                command = user_input.lower()
+                if command in ('quit', 'exit', 'bye'):
                     print("Goodbye!")
                     break
 
-                if user_input.lower() == 'status':
+                if command == 'status':
                     status = await self.moderator.get_agent_status()
                     print(f"ModeratorAgent Status:")
                     print(f"   • Total agents: {status['total_agents']}")
@@ -204,10 +262,7 @@ class SimpleModeratorTest:
                 # Process the query
                 await self.test_query(user_input)
 
-            except KeyboardInterrupt:
-                print("\nGoodbye!")
-                break
-            except EOFError:
+            except (EOFError, KeyboardInterrupt):
                 print("\nGoodbye!")
                 break
 
@@ -222,7 +277,7 @@ class SimpleModeratorTest:
                 print(f"[WARN]Cleanup warning: {e}")
 
 
-async def main():
+async def main(parallel: bool = False):
     """Main function to run the test"""
     print("ModeratorAgent Simple Test")
     print("=" * 40)
@@ -247,13 +302,25 @@ async def main():
         # Setup the moderator
         await test.setup()
 
+        if parallel:
+            # Non-interactive: run the suite concurrently and skip the menu
+            print("\nRunning automated test suite in parallel...")
+            await test.run_test_suite(parallel=True)
+            return
+
+        if not sys.stdin.isatty():
+            # No terminal to answer the menu (CI, piped runs): just run the suite
+            print("\nNo interactive terminal; running automated test suite...")
+            await test.run_test_suite()
+            return
+
         # Ask user what they want to do
         print("\nWhat would you like to do?")
         print("1. Run automated test suite")
         print("2. Interactive mode (manual testing)")
         print("3. Both")
 
-        choice = input("\nEnter choice (1/2/3): ").strip()
+        choice = (await asyncio.to_thread(input, "\nEnter choice (1/2/3): ")).strip()
 
         if choice in ['1', '3']:
             print("\nRunning automated test suite...")
@@ -288,9 +355,16 @@ if __name__ == "__main__":
         print("Make sure you have a valid configuration file")
         print("You can create one using the CLI: ambivo-agents config save-sample agent_config.yaml")
 
+    import argparse
+
+    parser = argparse.ArgumentParser(description="ModeratorAgent simple test")
+    parser.add_argument("--parallel", action="store_true",
+                        help="Run the automated test suite concurrently without prompting")
+    args = parser.parse_args()
+
     # Run the test
     try:
-        asyncio.run(main())
+        asyncio.run(main(parallel=args.parallel))
     except KeyboardInterrupt:
         print("\nTest interrupted by user")
     except Exception as e:
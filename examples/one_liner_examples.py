@@ -5,26 +5,160 @@ Demonstrates proper memory retention, context preservation, and system messages
 """
 
 import asyncio
+import io
+import sys
+import time
+from collections import Counter
 from datetime import datetime
 from ambivo_agents import (
     KnowledgeBaseAgent, WebSearchAgent,
     ModeratorAgent, AssistantAgent
 )
+from ambivo_agents.core.base import StreamSubType
+
+from example_network import llm_reachable
+
+
+# =============================================================================
+# STATIC BANNERS (encoded once at import)
+# =============================================================================
+
+def _banner(text: str) -> bytes:
+    return (text + "\n").encode("utf-8")
+
+
+def write_banner(banner: bytes, out=None):
+    """Write a prebuilt banner straight to the binary stdout buffer.
+
+    When ``out`` is a text buffer (a section running concurrently), the banner
+    is written there instead so it stays with the rest of that section.
+    """
+    if out is not None:
+        out.write(banner.decode("utf-8"))
+        return
+    sys.stdout.flush()  # keep ordering with earlier print() output
+    sys.stdout.buffer.write(banner)
+    sys.stdout.buffer.flush()
+
+
+_HDR_ULTRA_SIMPLE = _banner("ULTRA-SIMPLE ONE-LINERS\n" + "=" * 30)
+_HDR_CONTEXT_AWARE = _banner("CONTEXT-AWARE EXAMPLES\n" + "=" * 30)
+_HDR_SPECIALIZED = _banner("SPECIALIZED AGENT EXAMPLES\n" + "=" * 35)
+_HDR_SYSTEM_MESSAGE = _banner("SYSTEM MESSAGE EXAMPLES\n" + "=" * 30)
+_HDR_STREAMING = _banner("STREAMING EXAMPLES\n" + "=" * 25)
+_HDR_ERROR_HANDLING = _banner("ERROR HANDLING EXAMPLES\n" + "=" * 30)
+_HDR_BEST_PRACTICES = _banner("BEST PRACTICES SUMMARY\n" + "=" * 30)
+_HDR_MAIN = _banner("\n".join((
+    "CORRECTED ONE-LINER EXAMPLES WITH BEST PRACTICES",
+    "=" * 60,
+    "Fixed event loop issues and ModeratorAgent constructor conflicts",
+    "Demonstrates memory retention, context preservation, and proper error handling",
+    "Perfect for training new developers on the Ambivo Agent system",
+    "=" * 60,
+)))
+_FOOTER_TAKEAWAYS = _banner("\n".join((
+    "ALL EXAMPLES COMPLETED SUCCESSFULLY!",
+    "\nKEY TAKEAWAYS FOR NEW DEVELOPERS:",
+    "   [OK] Always use .create() to get both agent and context",
+    "   [OK] Use system messages to customize agent behavior",
+    "   [OK] Context is automatically preserved across conversations",
+    "   [OK] Always cleanup sessions with await agent.cleanup_session()",
+    "   [OK] Handle errors gracefully with try/except blocks",
+    "   [OK] Use await agent.chat() in async contexts",
+    "   [OK] Use agent.chat_sync() only in non-async contexts",
+    "   [OK] Leverage conversation history for context-aware interactions",
+    "\nYou're ready to build amazing AI agent applications!",
+)))
+
+
+# =============================================================================
+# STREAM OUTPUT HELPER
+# =============================================================================
+
+class ChunkPrinter:
+    """Buffers streamed text and writes it to stdout in batches.
+
+    Printing every token with flush=True costs one write() per chunk; batching
+    on a small size/time budget keeps the output live with far fewer writes.
+    """
+
+    def __init__(self, max_bytes: int = 256, max_delay: float = 0.05):
+        self.buf = bytearray()
+        self.max_bytes = max_bytes
+        self.max_delay = max_delay
+        self.last_flush = time.monotonic()
+
+    def feed(self, text: str):
+        if not text:  # empty status/keepalive frames
+            return
+        self.buf += text.encode("utf-8")
+        if len(self.buf) >= self.max_bytes or time.monotonic() - self.last_flush > self.max_delay:
+            self.flush()
+
+    def flush(self):
+        if self.buf:
+            sys.stdout.flush()
+            sys.stdout.buffer.write(self.buf)
+            sys.stdout.buffer.flush()
+            self.buf.clear()
+        self.last_flush = time.monotonic()
+
+
+def build_stream_handlers(printer: ChunkPrinter) -> dict:
+    """Map StreamChunk sub-types to render callbacks (built once per demo)."""
+    return {
+        StreamSubType.CONTENT: lambda chunk: printer.feed(chunk.text),
+        StreamSubType.STATUS: lambda chunk: printer.feed(chunk.text),
+        StreamSubType.RESULT: lambda chunk: printer.feed(chunk.text),
+        StreamSubType.ERROR: lambda chunk: printer.feed(f"[ERROR] {chunk.text}"),
+        StreamSubType.METADATA: lambda chunk: None,
+    }
+
+
+def render_chunk(handlers: dict, printer: ChunkPrinter, chunk, counts: Counter = None, first: dict = None):
+    """Dispatch a chunk by sub_type; plain strings fall through to the printer.
+
+    When ``counts``/``first`` are given, per-type counts and the first chunk of
+    each type are recorded instead of retaining every chunk.
+    """
+    sub_type = getattr(chunk, 'sub_type', None)
+    if counts is not None:
+        counts[sub_type] += 1
+    if first is not None:
+        first.setdefault(sub_type, chunk)
+    handler = handlers.get(sub_type)
+    if handler is not None:
+        handler(chunk)
+    elif isinstance(chunk, str):
+        # isspace() tests without allocating a stripped copy of the chunk
+        if chunk and not chunk.isspace():
+            printer.feed(chunk)
+    else:
+        printer.feed(str(chunk))
+
+
+async def render_turn(agent, label: str, message: str, handlers: dict, printer: ChunkPrinter,
+                      counts: Counter = None, first: dict = None):
+    """Stream one conversation turn to stdout using a shared handler table."""
+    print(f"{label}: ", end='', flush=True)
+    async for chunk in agent.chat_stream(message):
+        render_chunk(handlers, printer, chunk, counts, first)
+    printer.flush()
+    print()
 
 
 # =============================================================================
 # ASYNC-SAFE ULTRA-SIMPLE EXAMPLES
 # =============================================================================
 
-async def ultra_simple_examples():
+async def ultra_simple_examples(out=None):
     """FIXED: Async-safe ultra-simple examples"""
-    print("ULTRA-SIMPLE ONE-LINERS")
-    print("=" * 30)
+    write_banner(_HDR_ULTRA_SIMPLE, out)
 
     # [OK] FIXED: Use async chat() instead of sync version in async context
     agent = AssistantAgent.create_simple()
     response = await agent.chat("What is Python?")
-    print(f"Python explanation: {response[:100]}...")
+    print(f"Python explanation: {response[:100]}...", file=out)
     await agent.cleanup_session()
 
 
@@ -32,20 +166,19 @@ async def ultra_simple_examples():
         system_message="You are a friendly teacher. Use simple analogies."
     )
     response = await agent.chat("Explain machine learning")
-    print(f"ML explanation: {response[:100]}...")
+    print(f"ML explanation: {response[:100]}...", file=out)
     await agent.cleanup_session()
 
-    print("[OK] Ultra-simple examples completed!\n")
+    print("[OK] Ultra-simple examples completed!\n", file=out)
 
 
 # =============================================================================
 # CONTEXT-AWARE EXAMPLES (WORKING VERSION)
 # =============================================================================
 
-async def context_aware_examples():
+async def context_aware_examples(out=None):
     """[OK] WORKING: Context-aware examples with proper session management"""
-    print("CONTEXT-AWARE EXAMPLES")
-    print("=" * 30)
+    write_banner(_HDR_CONTEXT_AWARE, out)
 
     # [OK] BEST PRACTICE: Create with context for session management
     agent, context = AssistantAgent.create(
@@ -53,103 +186,107 @@ async def context_aware_examples():
         system_message="You are John's personal AI assistant. Remember our conversation history."
     )
 
-    print(f"[OK] Created agent for {context.user_id} in session {context.session_id}")
+    print(f"[OK] Created agent for {context.user_id} in session {context.session_id}", file=out)
 
     # [OK] Multi-turn conversation demonstrating memory
     response1 = await agent.chat("My name is John and I'm a data scientist")
-    print(f"Introduction: {response1[:80]}...")
+    print(f"Introduction: {response1[:80]}...", file=out)
 
     response2 = await agent.chat("What's my profession?")  # Should remember from context
-    print(f"Memory test: {response2[:80]}...")
+    print(f"Memory test: {response2[:80]}...", file=out)
 
     response3 = await agent.chat("Recommend Python libraries for my work")  # Should use both context
-    print(f"Contextual advice: {response3[:80]}...")
+    print(f"Contextual advice: {response3[:80]}...", file=out)
 
     # [OK] Show conversation history
-    history = await agent.get_conversation_history()
-    print(f"Conversation history: {len(history)} messages preserved")
+    message_count = await agent.count_conversation_messages()
+    print(f"Conversation history: {message_count} messages preserved", file=out)
 
     await agent.cleanup_session()
-    print("[OK] Context-aware examples completed!\n")
+    print("[OK] Context-aware examples completed!\n", file=out)
 
 
 # =============================================================================
 # SPECIALIZED AGENT EXAMPLES (WORKING VERSION)
 # =============================================================================
 
-async def specialized_agent_examples():
+async def specialized_agent_examples(out=None):
     """[OK] WORKING: Specialized agents with proper async handling"""
-    print("SPECIALIZED AGENT EXAMPLES")
-    print("=" * 35)
-
-    # [OK] Knowledge Base with proper error handling
-    print("Knowledge Base Example:")
-    agent, context = KnowledgeBaseAgent.create(
-        user_id="researcher",
-        system_message="You are a research assistant. Always cite sources and explain methodology."
+    write_banner(_HDR_SPECIALIZED, out)
+
+    # [OK] The two agents are independent, so build them concurrently off the event loop
+    (kb_agent, _), (search_agent, _) = await asyncio.gather(
+        asyncio.to_thread(
+            KnowledgeBaseAgent.create,
+            user_id="researcher",
+            system_message="You are a research assistant. Always cite sources and explain methodology."
+        ),
+        asyncio.to_thread(
+            WebSearchAgent.create,
+            user_id="searcher",
+            system_message="You are a research specialist. Provide accurate, well-sourced information."
+        ),
     )
 
     try:
-        # [OK] Proper knowledge base workflow
-        result = await agent._ingest_text(
-            kb_name="ai_research_kb",
-            input_text="Artificial Intelligence is transforming industries through machine learning, natural language processing, and computer vision technologies.",
-            custom_meta={"source": "research_summary", "date": datetime.now().isoformat()}
-        )
-
-        if result['success']:
-            print(f"   [OK] Knowledge ingested into {result['kb_name']}")
-
-            # Query with context
-            query_result = await agent._query_knowledge_base(
+        # [OK] Knowledge Base with proper error handling
+        print("Knowledge Base Example:", file=out)
+        try:
+            # [OK] Proper knowledge base workflow
+            result = await kb_agent._ingest_text(
                 kb_name="ai_research_kb",
-                query="What technologies are mentioned in AI research?"
+                input_text="Artificial Intelligence is transforming industries through machine learning, natural language processing, and computer vision technologies.",
+                custom_meta={"source": "research_summary", "date": datetime.now().isoformat()}
             )
 
-            if query_result['success']:
-                print(f"   Query result: {query_result['answer'][:100]}...")
-                print(f"   Sources found: {len(query_result.get('source_details', []))}")
+            if result['success']:
+                print(f"   [OK] Knowledge ingested into {result['kb_name']}", file=out)
 
-    except Exception as e:
-        print(f"   [WARN]KB error handled gracefully: {e}")
+                # Query with context
+                query_result = await kb_agent._query_knowledge_base(
+                    kb_name="ai_research_kb",
+                    query="What technologies are mentioned in AI research?"
+                )
 
-    finally:
-        await agent.cleanup_session()
+                if query_result['success']:
+                    print(f"   Query result: {query_result['answer'][:100]}...", file=out)
+                    print(f"   Sources found: {len(query_result.get('source_details', []))}", file=out)
 
-    # [OK] Web Search with error handling
-    print("\nWeb Search Example:")
-    agent, context = WebSearchAgent.create(
-        user_id="searcher",
-        system_message="You are a research specialist. Provide accurate, well-sourced information."
-    )
+        except Exception as e:
+            print(f"   [WARN]KB error handled gracefully: {e}", file=out)
 
-    try:
-        result = await agent._search_web("latest AI developments 2024", max_results=3)
+        # [OK] Web Search with error handling
+        print("\nWeb Search Example:", file=out)
+        try:
+            result = await search_agent._search_web("latest AI developments 2024", max_results=3)
 
-        if result['success'] and result['results']:
-            print(f"   [OK] Found {len(result['results'])} results")
-            print(f"   Top result: {result['results'][0].get('title', 'No title')[:60]}...")
-            print(f"   Provider: {result.get('provider', 'Unknown')}")
-        else:
-            print("   [WARN]No results found or search failed")
+            if result['success'] and result['results']:
+                print(f"   [OK] Found {len(result['results'])} results", file=out)
+                print(f"   Top result: {result['results'][0].get('title', 'No title')[:60]}...", file=out)
+                print(f"   Provider: {result.get('provider', 'Unknown')}", file=out)
+            else:
+                print("   [WARN]No results found or search failed", file=out)
 
-    except Exception as e:
-        print(f"   [WARN]Search error handled: {e}")
+        except Exception as e:
+            print(f"   [WARN]Search error handled: {e}", file=out)
 
     finally:
-        await agent.cleanup_session()
+        await asyncio.gather(
+            kb_agent.cleanup_session(),
+            search_agent.cleanup_session(),
+            return_exceptions=True
+        )
 
-    print("[OK] Specialized agent examples completed!\n")
+    print("[OK] Specialized agent examples completed!\n", file=out)
 
 
 # =============================================================================
 # SYSTEM MESSAGE EXAMPLES (WORKING VERSION)
 # =============================================================================
 
-async def system_message_examples():
+async def system_message_examples(out=None):
     """[OK] WORKING: System message examples with different personalities"""
-    print("SYSTEM MESSAGE EXAMPLES")
-    print("=" * 30)
+    write_banner(_HDR_SYSTEM_MESSAGE, out)
 
     # [OK] Different personalities for the same agent type
     personalities = [
@@ -161,19 +298,29 @@ async def system_message_examples():
 
     question = "How should I learn Python programming?"
 
-    for name, system_msg in personalities:
-        print(f"\n{name} Assistant:")
-        agent, context = AssistantAgent.create(
-            user_id=f"user_{name.lower()}",
-            system_message=system_msg
-        )
+    # [OK] Each personality has its own agent and session, so the turns are
+    # independent and can run concurrently (bounded to respect rate limits).
+    # Turns that depend on earlier answers must stay sequential.
+    sem = asyncio.Semaphore(3)
+
+    async def ask(name, system_msg):
+        async with sem:
+            agent, context = AssistantAgent.create(
+                user_id=f"user_{name.lower()}",
+                system_message=system_msg
+            )
+            try:
+                return await agent.chat(question)
+            finally:
+                await agent.cleanup_session()
 
-        response = await agent.chat(question)
-        print(f"   Response: {response[:120]}...")
+    responses = await asyncio.gather(*(ask(name, msg) for name, msg in personalities))
 
-        await agent.cleanup_session()
+    for (name, _), response in zip(personalities, responses):
+        print(f"\n{name} Assistant:", file=out)
+        print(f"   Response: {response[:120]}...", file=out)
 
-    print("[OK] System message examples completed!\n")
+    print("[OK] System message examples completed!\n", file=out)
 
 
 # =============================================================================
@@ -182,22 +329,29 @@ async def system_message_examples():
 
 async def streaming_examples():
     """FIXED: Streaming examples with proper ModeratorAgent usage"""
-    print("STREAMING EXAMPLES")
-    print("=" * 25)
+    write_banner(_HDR_STREAMING)
 
     # [OK] FIXED: Don't pass system_message as separate parameter to ModeratorAgent
     agent, context = ModeratorAgent.create(user_id="streamer")
 
-    print("Streaming response: ", end='', flush=True)
-    async for chunk in agent.chat_stream("Help me understand how AI agents work"):
-        print(chunk, end='', flush=True)
-    print()
+    printer = ChunkPrinter()
+    handlers = build_stream_handlers(printer)
+    counts = Counter()
+    first = {}
+
+    await render_turn(agent, "Streaming response", "Help me understand how AI agents work",
+                      handlers, printer, counts, first)
+
+    print(f"Chunks received: {sum(counts.values())} "
+          f"(content={counts[StreamSubType.CONTENT]}, status={counts[StreamSubType.STATUS]}, "
+          f"result={counts[StreamSubType.RESULT]}, error={counts[StreamSubType.ERROR]})")
+    result_chunk = first.get(StreamSubType.RESULT)
+    if result_chunk is not None:
+        print(f"Result metadata: {result_chunk.metadata}")
 
     # [OK] Follow-up with context preservation
-    print("\nFollow-up (with context): ", end='', flush=True)
-    async for chunk in agent.chat_stream("Can you give me a practical example?"):
-        print(chunk, end='', flush=True)
-    print()
+    await render_turn(agent, "\nFollow-up (with context)", "Can you give me a practical example?",
+                      handlers, printer)
 
     await agent.cleanup_session()
     print("[OK] Streaming examples completed!\n")
@@ -207,10 +361,28 @@ async def streaming_examples():
 # ERROR HANDLING EXAMPLES (WORKING VERSION)
 # =============================================================================
 
-async def error_handling_examples():
+def truncate_message(text: str, max_chars: int = 4096) -> str:
+    """Cap a user payload before it is sent to the LLM.
+
+    Production callers should bound input size the same way so arbitrary
+    user input cannot inflate token counts or stored session history.
+    """
+    return text if len(text) <= max_chars else text[:max_chars] + "...[truncated]"
+
+
+# Fixed inputs, built once at import instead of on every call
+_STRESS_INPUT = "x" * 500  # Long input (reduced to avoid timeout)
+_ERROR_TEST_CASES = (
+    "",  # Empty input
+    truncate_message(_STRESS_INPUT, 256),  # Long input, capped to 256 chars
+    "" * 50,  # Unicode stress test (reduced)
+    "Handle this gracefully"  # Normal case
+)
+
+
+async def error_handling_examples(out=None):
     """[OK] WORKING: Error handling with async safety"""
-    print("ERROR HANDLING EXAMPLES")
-    print("=" * 30)
+    write_banner(_HDR_ERROR_HANDLING, out)
 
     agent, context = AssistantAgent.create(
         user_id="error_tester",
@@ -218,35 +390,27 @@ async def error_handling_examples():
     )
 
     # [OK] Test edge cases with async safety
-    test_cases = [
-        "",  # Empty input
-        "x" * 500,  # Long input (reduced to avoid timeout)
-        "" * 50,  # Unicode stress test (reduced)
-        "Handle this gracefully"  # Normal case
-    ]
-
-    for i, test_input in enumerate(test_cases, 1):
+    for i, test_input in enumerate(_ERROR_TEST_CASES, 1):
         try:
-            print(f"Test {i}: ", end='')
+            print(f"Test {i}: ", end='', file=out)
 
             response = await agent.chat(str(test_input))
-            print(f"[OK] Handled successfully: {len(response)} chars")
+            print(f"[OK] Handled successfully: {len(response)} chars", file=out)
 
         except Exception as e:
-            print(f"[WARN]Error handled: {type(e).__name__}")
+            print(f"[WARN]Error handled: {type(e).__name__}", file=out)
 
     await agent.cleanup_session()
-    print("[OK] Error handling examples completed!\n")
+    print("[OK] Error handling examples completed!\n", file=out)
 
 
 # =============================================================================
 # BEST PRACTICES SUMMARY (WORKING VERSION)
 # =============================================================================
 
-async def best_practices_summary():
+async def best_practices_summary(out=None):
     """[OK] WORKING: Comprehensive best practices demonstration"""
-    print("BEST PRACTICES SUMMARY")
-    print("=" * 30)
+    write_banner(_HDR_BEST_PRACTICES, out)
 
     agent, context = AssistantAgent.create(
         user_id="best_practices_demo",
@@ -254,31 +418,31 @@ async def best_practices_summary():
     )
 
     # [OK] Demonstrate all features in one workflow
-    print("Comprehensive workflow demonstration:")
+    print("Comprehensive workflow demonstration:", file=out)
 
     # 1. Initial conversation
     response1 = await agent.chat("I want to learn about AI agent best practices")
-    print(f"1⃣ Initial: {response1[:80]}...")
+    print(f"1⃣ Initial: {response1[:80]}...", file=out)
 
     # 2. Context-aware follow-up
     response2 = await agent.chat("What about memory management?")
-    print(f"2⃣ Context: {response2[:80]}...")
+    print(f"2⃣ Context: {response2[:80]}...", file=out)
 
     # 3. Get conversation history
-    history = await agent.get_conversation_history()
-    print(f"3⃣ History: {len(history)} messages preserved")
+    message_count = await agent.count_conversation_messages()
+    print(f"3⃣ History: {message_count} messages preserved", file=out)
 
     # 4. Add custom context
     await agent.add_to_conversation_history("Key insight: Context preservation is crucial", "system")
 
     # 5. Final summary
     summary = await agent.get_conversation_summary()
-    print(f"4⃣ Summary: {summary['total_messages']} total messages")
-    print(f"   User: {summary['user_messages']}, Agent: {summary['agent_messages']}")
-    print(f"   Duration: {summary['session_duration']}")
+    print(f"4⃣ Summary: {summary['total_messages']} total messages", file=out)
+    print(f"   User: {summary['user_messages']}, Agent: {summary['agent_messages']}", file=out)
+    print(f"   Duration: {summary['session_duration']}", file=out)
 
     await agent.cleanup_session()
-    print("[OK] Best practices summary completed!\n")
+    print("[OK] Best practices summary completed!\n", file=out)
 
 
 # =============================================================================
@@ -287,33 +451,37 @@ async def best_practices_summary():
 
 async def main():
     """[OK] FIXED: Properly async main function"""
-    print("CORRECTED ONE-LINER EXAMPLES WITH BEST PRACTICES")
-    print("=" * 60)
-    print("Fixed event loop issues and ModeratorAgent constructor conflicts")
-    print("Demonstrates memory retention, context preservation, and proper error handling")
-    print("Perfect for training new developers on the Ambivo Agent system")
-    print("=" * 60)
-
-    # Run all examples with proper async handling
-    await ultra_simple_examples()
-    await context_aware_examples()
-    await specialized_agent_examples()
-    await system_message_examples()
-    await streaming_examples()
-    await error_handling_examples()
-    await best_practices_summary()
-
-    print("ALL EXAMPLES COMPLETED SUCCESSFULLY!")
-    print("\nKEY TAKEAWAYS FOR NEW DEVELOPERS:")
-    print("   [OK] Always use .create() to get both agent and context")
-    print("   [OK] Use system messages to customize agent behavior")
-    print("   [OK] Context is automatically preserved across conversations")
-    print("   [OK] Always cleanup sessions with await agent.cleanup_session()")
-    print("   [OK] Handle errors gracefully with try/except blocks")
-    print("   [OK] Use await agent.chat() in async contexts")
-    print("   [OK] Use agent.chat_sync() only in non-async contexts")
-    print("   [OK] Leverage conversation history for context-aware interactions")
-    print("\nYou're ready to build amazing AI agent applications!")
+    write_banner(_HDR_MAIN)
+
+    # Every section talks to an LLM; don't let each one wait out its own timeout
+    if not await llm_reachable():
+        print("Offline mode — skipping examples.")
+        return
+
+    # The sections use separate agents and sessions, so run them concurrently.
+    # Each buffers its own output and is printed in the original order as soon
+    # as it (and everything before it) is done; streaming stays live in between.
+    before_stream = (ultra_simple_examples, context_aware_examples,
+                     specialized_agent_examples, system_message_examples)
+    after_stream = (error_handling_examples, best_practices_summary)
+
+    async with asyncio.TaskGroup() as tg:
+        def start(section):
+            buf = io.StringIO()
+            return buf, tg.create_task(section(out=buf))
+
+        early = [start(section) for section in before_stream]
+        late = [start(section) for section in after_stream]
+
+        for buf, task in early:
+            await task
+            sys.stdout.write(buf.getvalue())
+        await streaming_examples()
+        for buf, task in late:
+            await task
+            sys.stdout.write(buf.getvalue())
+
+    write_banner(_FOOTER_TAKEAWAYS)
 
 
 # =============================================================================
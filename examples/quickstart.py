@@ -7,6 +7,8 @@ Requires: pip install ambivo-agents + at least one LLM API key configured.
 """
 
 import asyncio
+import io
+import sys
 
 from ambivo_agents import (
     AssistantAgent,
@@ -17,28 +19,30 @@ from ambivo_agents import (
     WebSearchAgent,
 )
 
+from example_network import llm_reachable
+
 
 # ---------------------------------------------------------------------------
 # 1. AssistantAgent — General conversation
 # ---------------------------------------------------------------------------
-async def demo_assistant():
-    print("\n" + "=" * 60)
-    print("1. AssistantAgent — General Conversation")
-    print("=" * 60)
+async def demo_assistant(out=None):
+    print("\n" + "=" * 60, file=out)
+    print("1. AssistantAgent — General Conversation", file=out)
+    print("=" * 60, file=out)
 
     agent = AssistantAgent.create_simple(user_id="demo")
     response = await agent.chat("Explain quantum computing in 3 sentences.")
-    print(response)
+    print(response, file=out)
     await agent.cleanup_session()
 
 
 # ---------------------------------------------------------------------------
 # 2. ModeratorAgent — Intelligent routing
 # ---------------------------------------------------------------------------
-async def demo_moderator():
-    print("\n" + "=" * 60)
-    print("2. ModeratorAgent — Intelligent Routing")
-    print("=" * 60)
+async def demo_moderator(out=None):
+    print("\n" + "=" * 60, file=out)
+    print("2. ModeratorAgent — Intelligent Routing", file=out)
+    print("=" * 60, file=out)
 
     agent = ModeratorAgent.create_simple(user_id="demo")
 
@@ -48,9 +52,9 @@ async def demo_moderator():
         "Search the web for latest AI news",   # -> WebSearchAgent
     ]
     for q in queries:
-        print(f"\nQuery: {q}")
+        print(f"\nQuery: {q}", file=out)
         response = await agent.chat(q)
-        print(f"Response: {response[:200]}...")
+        print(f"Response: {response[:200]}...", file=out)
 
     await agent.cleanup_session()
 
@@ -58,41 +62,41 @@ async def demo_moderator():
 # ---------------------------------------------------------------------------
 # 3. WebSearchAgent — Web search via Brave/AVES APIs
 # ---------------------------------------------------------------------------
-async def demo_web_search():
-    print("\n" + "=" * 60)
-    print("3. WebSearchAgent — API-Based Web Search")
-    print("=" * 60)
+async def demo_web_search(out=None):
+    print("\n" + "=" * 60, file=out)
+    print("3. WebSearchAgent — API-Based Web Search", file=out)
+    print("=" * 60, file=out)
 
     try:
         agent = WebSearchAgent.create_simple(user_id="demo")
         response = await agent.chat("Search for recent advances in renewable energy")
-        print(response[:500])
+        print(response[:500], file=out)
         await agent.cleanup_session()
     except RuntimeError as e:
-        print(f"Skipped (no search API key configured): {e}")
+        print(f"Skipped (no search API key configured): {e}", file=out)
 
 
 # ---------------------------------------------------------------------------
 # 4. WebScraperAgent — Content extraction via Jina/Firecrawl/requests
 # ---------------------------------------------------------------------------
-async def demo_web_scraper():
-    print("\n" + "=" * 60)
-    print("4. WebScraperAgent — API-Based Web Scraping")
-    print("=" * 60)
+async def demo_web_scraper(out=None):
+    print("\n" + "=" * 60, file=out)
+    print("4. WebScraperAgent — API-Based Web Scraping", file=out)
+    print("=" * 60, file=out)
 
     agent = WebScraperAgent.create_simple(user_id="demo")
     response = await agent.chat("Scrape https://example.com")
-    print(response[:500])
+    print(response[:500], file=out)
     await agent.cleanup_session()
 
 
 # ---------------------------------------------------------------------------
 # 5. KnowledgeSynthesisAgent — Multi-source research with quality gates
 # ---------------------------------------------------------------------------
-async def demo_knowledge_synthesis():
-    print("\n" + "=" * 60)
-    print("5. KnowledgeSynthesisAgent — Quality-Gated Research")
-    print("=" * 60)
+async def demo_knowledge_synthesis(out=None):
+    print("\n" + "=" * 60, file=out)
+    print("5. KnowledgeSynthesisAgent — Quality-Gated Research", file=out)
+    print("=" * 60, file=out)
 
     try:
         agent = KnowledgeSynthesisAgent.create_simple(user_id="demo")
@@ -100,19 +104,19 @@ async def demo_knowledge_synthesis():
         response = await agent.chat(
             "What are the main challenges in quantum error correction?"
         )
-        print(response[:500])
+        print(response[:500], file=out)
         await agent.cleanup_session()
     except Exception as e:
-        print(f"Skipped: {e}")
+        print(f"Skipped: {e}", file=out)
 
 
 # ---------------------------------------------------------------------------
 # 6. GatherAgent — Conversational form filling
 # ---------------------------------------------------------------------------
-async def demo_gather():
-    print("\n" + "=" * 60)
-    print("6. GatherAgent — Conversational Forms")
-    print("=" * 60)
+async def demo_gather(out=None):
+    print("\n" + "=" * 60, file=out)
+    print("6. GatherAgent — Conversational Forms", file=out)
+    print("=" * 60, file=out)
 
     import json
 
@@ -154,32 +158,32 @@ async def demo_gather():
 
     # Simulate a conversation
     r1 = await agent.chat(json.dumps(questionnaire))
-    print(f"Agent: {r1}")
+    print(f"Agent: {r1}", file=out)
 
     r2 = await agent.chat("Alice")
-    print(f"Agent: {r2}")
+    print(f"Agent: {r2}", file=out)
 
     r3 = await agent.chat("Developer")
-    print(f"Agent: {r3}")
+    print(f"Agent: {r3}", file=out)
 
 
 # ---------------------------------------------------------------------------
 # 7. KnowledgeBaseAgent — Document ingestion & semantic search
 # ---------------------------------------------------------------------------
-async def demo_knowledge_base():
-    print("\n" + "=" * 60)
-    print("7. KnowledgeBaseAgent — Semantic Search (requires Qdrant)")
-    print("=" * 60)
+async def demo_knowledge_base(out=None):
+    print("\n" + "=" * 60, file=out)
+    print("7. KnowledgeBaseAgent — Semantic Search (requires Qdrant)", file=out)
+    print("=" * 60, file=out)
 
     try:
         from ambivo_agents import KnowledgeBaseAgent
 
         agent = KnowledgeBaseAgent.create_simple(user_id="demo")
         response = await agent.chat("List available knowledge bases")
-        print(response[:300])
+        print(response[:300], file=out)
         await agent.cleanup_session()
     except Exception as e:
-        print(f"Skipped (requires Qdrant + knowledge extras): {e}")
+        print(f"Skipped (requires Qdrant + knowledge extras): {e}", file=out)
 
 
 # ---------------------------------------------------------------------------
@@ -189,6 +193,10 @@ async def main():
     print("Ambivo Agents v2.0.0 — Quickstart Demo")
     print("=" * 60)
 
+    if not await llm_reachable():
+        print("Offline mode — skipping demos (they all need an LLM provider).")
+        return
+
     demos = [
         ("AssistantAgent", demo_assistant),
         ("ModeratorAgent", demo_moderator),
@@ -199,11 +207,18 @@ async def main():
         ("KnowledgeBaseAgent", demo_knowledge_base),
     ]
 
-    for name, demo_fn in demos:
+    # Each demo uses its own agent and session, so they can run concurrently.
+    # Output is buffered per demo and printed in order once all have finished.
+    async def _run(name, demo_fn):
+        buf = io.StringIO()
         try:
-            await demo_fn()
+            await demo_fn(out=buf)
         except Exception as e:
-            print(f"\n[{name}] Error: {e}")
+            print(f"\n[{name}] Error: {e}", file=buf)
+        return buf.getvalue()
+
+    outputs = await asyncio.gather(*[_run(name, fn) for name, fn in demos])
+    sys.stdout.write("".join(outputs))
 
     print("\n" + "=" * 60)
     print("All demos complete.")
@@ -0,0 +1,65 @@
+"""Tests for YAML configuration memoization in the config loader"""
+
+import os
+import time
+
+import pytest
+
+from ambivo_agents.config import loader
+from ambivo_agents.config.loader import _load_config_from_yaml, clear_config_cache
+
+CONFIG_YAML = """
+redis:
+  host: localhost
+  port: 6379
+llm:
+  openai_api_key: sk-test
+  temperature: {temperature}
+"""
+
+
+@pytest.fixture(autouse=True)
+def _clean_cache():
+    clear_config_cache()
+    yield
+    clear_config_cache()
+
+
+def _write(path, temperature):
+    path.write_text(CONFIG_YAML.format(temperature=temperature))
+
+
+class TestYamlConfigCache:
+    def test_second_load_is_served_from_cache(self, tmp_path, monkeypatch):
+        config_file = tmp_path / "agent_config.yaml"
+        _write(config_file, 0.5)
+
+        first = _load_config_from_yaml(str(config_file))
+
+        calls = []
+        monkeypatch.setattr(loader.yaml, "safe_load", lambda f: calls.append(f) or {})
+        second = _load_config_from_yaml(str(config_file))
+
+        assert calls == []
+        assert second == first
+
+    def test_returned_config_is_a_copy(self, tmp_path):
+        config_file = tmp_path / "agent_config.yaml"
+        _write(config_file, 0.5)
+
+        first = _load_config_from_yaml(str(config_file))
+        first["llm"]["temperature"] = 99
+
+        second = _load_config_from_yaml(str(config_file))
+        assert second["llm"]["temperature"] == 0.5
+
+    def test_modified_file_is_reparsed(self, tmp_path):
+        config_file = tmp_path / "agent_config.yaml"
+        _write(config_file, 0.5)
+        assert _load_config_from_yaml(str(config_file))["llm"]["temperature"] == 0.5
+
+        _write(config_file, 0.9)
+        future = time.time() + 10
+        os.utime(config_file, (future, future))
+
+        assert _load_config_from_yaml(str(config_file))["llm"]["temperature"] == 0.9
@@ -0,0 +1,67 @@
+"""Tests for the result cache in examples/intelligent_conversation_system.py"""
+
+import importlib.util
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+EXAMPLE = Path(__file__).resolve().parent.parent / "examples" / "intelligent_conversation_system.py"
+
+
+@pytest.fixture(scope="module")
+def example():
+    spec = importlib.util.spec_from_file_location("intelligent_conversation_system", EXAMPLE)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class _CountingModerator:
+    def __init__(self):
+        self.queries = []
+
+    async def process_with_quality_assessment(self, query, user_preferences, on_token=None):
+        self.queries.append(query)
+        return {"response": f"answer to: {query}"}
+
+
+@pytest.fixture
+def system(example, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # per-turn history is appended in the working directory
+    system = example.IntelligentConversationSystem(enable_logging=False)
+    system.moderator = _CountingModerator()
+    system.context = SimpleNamespace(session_id="test")
+    return system
+
+
+async def test_repeat_differing_in_case_and_punctuation_is_served_from_cache(system):
+    await system.process_message("What is the capital of France?")
+    result = await system.process_message("what is the capital of france")
+
+    assert result["response"] == "answer to: What is the capital of France?"
+    assert system.moderator.queries == ["What is the capital of France?"]
+
+
+async def test_reordered_question_is_not_reused(system):
+    await system.process_message("is python faster than java")
+    result = await system.process_message("is java faster than python")
+
+    assert result["response"] == "answer to: is java faster than python"
+    assert len(system.moderator.queries) == 2
+
+
+@pytest.mark.parametrize(
+    "first, second",
+    [
+        ("what was the population of france in 2010", "what was the population of france in 2020"),
+        ("how do i enable tls on the load balancer", "how do i disable tls on the load balancer"),
+        ("is it not safe to run this migration", "is it safe to run this migration"),
+    ],
+)
+async def test_near_duplicate_wording_is_not_reused(system, first, second):
+    await system.process_message(first)
+    result = await system.process_message(second)
+
+    assert result["response"] == f"answer to: {second}"
+    assert system.moderator.queries == [first, second]
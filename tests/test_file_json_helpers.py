@@ -0,0 +1,206 @@
+"""Tests for the JSON/CSV/YAML helpers backing BaseAgent's file utilities"""
+
+import json
+import math
+import sys
+import types
+from collections import OrderedDict
+
+import pytest
+
+from ambivo_agents.core import base
+from ambivo_agents.core.base import _json_loads
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+def orjson_toggle(request, monkeypatch):
+    if request.param and not base.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(base, "ORJSON_AVAILABLE", request.param)
+
+
+class TestJsonHelpers:
+    def test_round_trip(self, orjson_toggle):
+        data = [{"name": "Widget", "price": 9.5, "in_stock": True, "tags": None}]
+        assert _json_loads(json.dumps(data, indent=2)) == data
+
+    def test_accepts_input_only_stdlib_parses(self, orjson_toggle):
+        assert math.isnan(_json_loads('{"v": NaN}')["v"])
+        assert _json_loads(str(2**70)) == 2**70
+
+    def test_invalid_json_still_raises(self, orjson_toggle):
+        with pytest.raises(json.JSONDecodeError):
+            _json_loads("{not json")
+
+
+class TestCsvConversion:
+    async def test_numeric_conversion(self):
+        csv_data = "name,qty,price,note\nWidget,3,9.5,\nGadget,3,1e2,n/a\n"
+        result = await base.BaseAgent.convert_csv_to_json(None, csv_data)
+
+        assert result["success"]
+        assert result["json"] == [
+            {"name": "Widget", "qty": 3, "price": 9.5, "note": None},
+            {"name": "Gadget", "qty": 3, "price": 100.0, "note": "n/a"},
+        ]
+
+    async def test_json_string_matches_stdlib(self):
+        result = await base.BaseAgent.convert_csv_to_json(None, "city,temp\nZürich,1e16\n")
+        assert result["json_string"] == json.dumps(result["json"], indent=2)
+        assert "Z\\u00fcrich" in result["json_string"]
+
+    async def test_round_trip_through_csv(self):
+        rows = [{"b": 2, "a": "x"}, {"a": "y", "c": 1.5}]
+        csv_result = await base.BaseAgent.convert_json_to_csv(None, rows)
+        assert csv_result["columns"] == ["a", "b", "c"]
+
+        json_result = await base.BaseAgent.convert_csv_to_json(None, csv_result["csv"])
+        assert json_result["json"] == [
+            {"a": "x", "b": 2, "c": None},
+            {"a": "y", "b": None, "c": 1.5},
+        ]
+
+
+class TestYamlParsing:
+    async def test_yaml_document(self):
+        result = await base.BaseAgent.parse_file_content(None, "a: 1\nb: [x, y]\n", "yaml")
+        assert result["success"]
+        assert result["data"] == {"a": 1, "b": ["x", "y"]}
+
+    async def test_json_content_in_yaml_file(self):
+        result = await base.BaseAgent.parse_file_content(None, ' {"questions": [{"id": 1}]}', "yml")
+        assert result["data"] == {"questions": [{"id": 1}]}
+
+    async def test_json_looking_yaml_keeps_yaml_scalars(self):
+        result = await base.BaseAgent.parse_file_content(None, '{"limit": 1e3}', "yaml")
+        assert result["data"] == {"limit": "1e3"}
+
+    async def test_flow_yaml_that_is_not_json(self):
+        result = await base.BaseAgent.parse_file_content(None, "{a: 1, b: two}", "yaml")
+        assert result["data"] == {"a": 1, "b": "two"}
+
+
+class _FakeResponse:
+    def __init__(self, text, status_code, headers):
+        self.text = text
+        self.status_code = status_code
+        self.headers = headers
+        self.encoding = "utf-8"
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+    def iter_content(self, chunk_size=1):
+        data = self.text.encode()
+        for i in range(0, len(data), chunk_size):
+            yield data[i : i + chunk_size]
+
+    def close(self):
+        pass
+
+
+class TestUrlRevalidation:
+    URL = "http://example.invalid/q.json"
+
+    @pytest.fixture
+    def fake_get(self, monkeypatch):
+        calls = []
+
+        def get(url, timeout=15, headers=None, stream=False):
+            calls.append(headers)
+            if headers and headers.get("If-None-Match") == '"v1"':
+                return _FakeResponse("", 304, {})
+            return _FakeResponse('{"a": 1}', 200, {"ETag": '"v1"'})
+
+        monkeypatch.setattr(base, "AIOHTTP_AVAILABLE", False)
+        monkeypatch.setattr(base, "REQUESTS_AVAILABLE", True)
+        monkeypatch.setattr(base, "requests", types.SimpleNamespace(get=get))
+        monkeypatch.setattr(base, "_URL_CACHE", OrderedDict())
+        return calls
+
+    async def test_unchanged_url_is_served_from_cache(self, fake_get):
+        first = await base.BaseAgent.read_file(None, self.URL)
+        second = await base.BaseAgent.read_file(None, self.URL)
+
+        assert first["content"] == '{"a": 1}'
+        assert second == first
+        assert fake_get == [None, {"If-None-Match": '"v1"'}]
+
+    async def test_responses_without_validators_are_not_cached(self, fake_get, monkeypatch):
+        monkeypatch.setattr(
+            base,
+            "requests",
+            types.SimpleNamespace(get=lambda url, timeout=15, stream=False: _FakeResponse("x", 200, {})),
+        )
+        await base.BaseAgent.read_file(None, self.URL)
+        assert self.URL not in base._URL_CACHE
+
+    async def test_oversized_body_is_rejected(self, fake_get):
+        result = await base.BaseAgent.read_file(None, self.URL, max_bytes=4)
+        assert not result["success"]
+        assert "exceeds 4 bytes" in result["error"]
+
+
+class _FakeStream:
+    def __init__(self, parts):
+        self._parts = parts
+
+    async def iter_chunked(self, n):
+        for part in self._parts:
+            yield part
+
+
+class _FakeAiohttpResponse:
+    def __init__(self, parts):
+        self.status = 200
+        self.content_length = None
+        self.charset = None
+        self.headers = {}
+        self.content = _FakeStream(parts)
+
+    def raise_for_status(self):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class TestAiohttpUrlRead:
+    URL = "http://example.invalid/page.txt"
+
+    @pytest.fixture
+    def body_parts(self, monkeypatch):
+        parts = []
+
+        class ClientSession:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            def get(self, url, headers=None):
+                return _FakeAiohttpResponse(parts)
+
+        monkeypatch.setitem(sys.modules, "aiohttp", types.SimpleNamespace(ClientSession=ClientSession))
+        monkeypatch.setattr(base, "AIOHTTP_AVAILABLE", True)
+        monkeypatch.setattr(base, "_URL_CACHE", OrderedDict())
+        return parts
+
+    async def test_body_split_across_chunks_is_read_in_full(self, body_parts):
+        body_parts.extend([b"first ", b"second ", b"third"])
+        result = await base.BaseAgent.read_file(None, self.URL)
+
+        assert result["success"]
+        assert result["content"] == "first second third"
+
+    async def test_undeclared_oversized_body_is_rejected(self, body_parts):
+        body_parts.extend([b"abc", b"def"])
+        result = await base.BaseAgent.read_file(None, self.URL, max_bytes=4)
+
+        assert not result["success"]
+        assert "exceeds 4 bytes" in result["error"]
@@ -2,6 +2,7 @@
 """
 Tests for LLM-based answer sufficiency validation in GatherAgent.
 """
+import asyncio
 import json
 import pytest
 
@@ -122,3 +123,355 @@ async def test_llm_validation_blocks_then_allows(monkeypatch):
     r6 = await agent.chat("finish")
     assert "Submitting your responses now" in r6
     assert "Status: successfully_collected" in r6
+
+
+def test_prompt_cache_short_circuits_rendering():
+    question = GatherAgent._normalize_question(
+        {
+            "question_id": "q1",
+            "text": "Preferred contact?",
+            "type": "single-select",
+            "answer_option_dict_list": [{"value": "email"}, {"value": "phone"}],
+        }
+    )
+    rendered = GatherAgent.render_question_prompt(question)
+    assert rendered == "Preferred contact?\nPlease pick one: email, phone"
+
+    agent = GatherAgent.create_advanced(
+        agent_id="gather_prompt_cache",
+        memory_manager=LocalMemory(),
+        llm_service=None,
+        config={"gather": {"prompt_cache": {"q1": "cached prompt"}}},
+    )
+    assert agent._format_question_prompt(question) == "cached prompt"
+    assert agent._format_question_prompt({**question, "question_id": "q2"}) == rendered
+
+
+@pytest.mark.asyncio
+async def test_nl_extraction_reuses_cached_answers():
+    class CountingLLM(FakeLLM):
+        calls = 0
+
+        async def generate_response(self, prompt, context=None, system_message=None):
+            CountingLLM.calls += 1
+            return '{"answer": "email"}'
+
+    agent = GatherAgent.create_advanced(
+        agent_id="gather_nl_cache",
+        memory_manager=LocalMemory(),
+        llm_service=CountingLLM([]),
+        config={"gather": {"enable_natural_language_parsing": True}},
+    )
+    question = {
+        "question_id": "q1",
+        "text": "Preferred contact?",
+        "type": "single-select",
+        "answer_option_dict_list": [{"value": "email"}, {"value": "phone"}],
+    }
+
+    assert await agent._extract_answer_with_llm(question, "The first one!") == (True, "email", "")
+    assert await agent._extract_answer_with_llm(question, "  the FIRST one ") == (True, "email", "")
+    assert CountingLLM.calls == 1
+
+    other = {**question, "text": "Preferred contact for billing?"}
+    await agent._extract_answer_with_llm(other, "The first one!")
+    assert CountingLLM.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_primed_nl_answers_skip_the_llm():
+    fake_llm = FakeLLM([])
+    agent = GatherAgent.create_advanced(
+        agent_id="gather_nl_prime",
+        memory_manager=LocalMemory(),
+        llm_service=fake_llm,
+        config={"gather": {"enable_natural_language_parsing": True}},
+    )
+    question = {
+        "question_id": "q2",
+        "text": "Which clouds?",
+        "type": "multi-select",
+        "answer_option_dict_list": [{"value": "AWS"}, {"value": "GCP"}],
+    }
+
+    assert agent.prime_nl_answer_cache(question, {"Both of them!": ["AWS", "GCP"]}) == 1
+
+    async def fail(*args, **kwargs):
+        raise AssertionError("LLM should not be called for a primed reply")
+
+    fake_llm.generate_response = fail
+    assert await agent._extract_answer_with_llm(question, "both of them") == (
+        True,
+        ["AWS", "GCP"],
+        "",
+    )
+
+
+@pytest.mark.parametrize(
+    "reply,expected",
+    [
+        ("Absolutely!", "Yes"),
+        ("Yeah, we use Datadog and Splunk", "Yes"),
+        ("of course", "Yes"),
+        ("Nope", "No"),
+        ("Not really.", "No"),
+        ("Of course not", None),
+        ("Sure, but not yet", None),
+        ("No idea", None),
+        ("I think we might", None),
+        ("No problem, we do", None),
+        ("No doubt about it", None),
+        ("No worries, yes", None),
+        ("Never had an issue, yes we use it", None),
+        ("No, we don't", "No"),
+    ],
+)
+def test_fast_yes_no(reply, expected):
+    assert GatherAgent._fast_yes_no(reply) == expected
+
+
+def test_fast_option_match():
+    single = {
+        "type": "single-select",
+        "answer_option_dict_list": [
+            {"value": "email", "label": "Email"},
+            {"value": "sms", "label": "Text message"},
+        ],
+    }
+    multi = {
+        "type": "multi-select",
+        "answer_option_dict_list": [{"value": "AWS"}, {"value": "Azure"}, {"value": "GCP"}],
+    }
+
+    assert GatherAgent._fast_option_match(single, "I'd prefer email notifications") == "email"
+    assert GatherAgent._fast_option_match(single, "a text message works") == "sms"
+    assert GatherAgent._fast_option_match(single, "email or a text message") is None
+    assert GatherAgent._fast_option_match(single, "emailing is fine") is None
+    assert GatherAgent._fast_option_match(multi, "We use both Azure and AWS!") == ["AWS", "Azure"]
+    assert GatherAgent._fast_option_match(multi, "All except Azure") is None
+
+    lettered = {
+        "type": "single-select",
+        "answer_option_dict_list": [{"value": "opt_a", "label": "A"}, {"value": "opt_b", "label": "B"}],
+    }
+    numbered = {
+        "type": "single-select",
+        "answer_option_dict_list": [{"value": 1}, {"value": 2}, {"value": 3}],
+    }
+    assert GatherAgent._fast_option_match(lettered, "I want a refund") is None
+    assert GatherAgent._fast_option_match(numbered, "Priority level 3 maybe") is None
+
+
+def test_strict_option_parsing_prefers_values_and_handles_unhashable_values():
+    q = {
+        "type": "multi-select",
+        "answer_option_dict_list": [
+            {"value": "b", "label": "A"},
+            {"value": "a", "label": "Alpha"},
+            {"value": ["x", "y"], "label": "Both"},
+        ],
+    }
+
+    assert GatherAgent._validate_and_parse_answer(None, q, "A, both") == (True, ["a", ["x", "y"]], "")
+    assert GatherAgent._validate_and_parse_answer(None, q, "gamma")[0] is False
+
+
+@pytest.mark.asyncio
+async def test_batch_extraction_uses_one_llm_call():
+    fake_llm = FakeLLM(['{"answers": ["sms", null]}'])
+    agent = GatherAgent.create_advanced(
+        agent_id="gather_nl_batch",
+        memory_manager=LocalMemory(),
+        llm_service=fake_llm,
+        config={"gather": {"enable_natural_language_parsing": True}},
+    )
+    question = {
+        "question_id": "q1",
+        "text": "Preferred contact?",
+        "type": "single-select",
+        "answer_option_dict_list": [{"value": "email"}, {"value": "sms"}],
+    }
+
+    answers = await agent.extract_answers_batch(
+        question, ["email is best", "the second one", "whatever works"]
+    )
+
+    assert answers == ["email", "sms", None]
+    assert fake_llm.outputs == []
+    assert await agent._extract_answer_with_llm(question, "The second one!") == (True, "sms", "")
+
+
+@pytest.mark.asyncio
+async def test_failed_nl_extraction_is_not_retried_immediately(monkeypatch):
+    calls = []
+
+    class UnhelpfulLLM(FakeLLM):
+        async def generate_response(self, prompt, context=None, system_message=None):
+            calls.append(prompt)
+            return '{"answer": "fax"}'
+
+    agent = GatherAgent.create_advanced(
+        agent_id="gather_nl_negative",
+        memory_manager=LocalMemory(),
+        llm_service=UnhelpfulLLM([]),
+        config={"gather": {"enable_natural_language_parsing": True}},
+    )
+    question = {
+        "question_id": "q1",
+        "text": "Preferred contact?",
+        "type": "single-select",
+        "answer_option_dict_list": [{"value": "email"}, {"value": "sms"}],
+    }
+
+    assert await agent._extract_answer_with_llm(question, "carrier pigeon") == (False, None, None)
+    assert await agent._extract_answer_with_llm(question, "Carrier pigeon!") == (False, None, None)
+    assert len(calls) == 1
+
+    # Once the entry expires the LLM gets another chance
+    monkeypatch.setattr(agent, "NL_FAILURE_TTL_SECONDS", 0)
+    await agent._extract_answer_with_llm(question, "carrier pigeon")
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_llm_errors_are_not_negatively_cached():
+    calls = []
+
+    class FlakyLLM(FakeLLM):
+        async def generate_response(self, prompt, context=None, system_message=None):
+            calls.append(prompt)
+            if len(calls) == 1:
+                raise TimeoutError("LLM timed out")
+            return '{"answer": "sms"}'
+
+    agent = GatherAgent.create_advanced(
+        agent_id="gather_nl_flaky",
+        memory_manager=LocalMemory(),
+        llm_service=FlakyLLM([]),
+        config={"gather": {"enable_natural_language_parsing": True}},
+    )
+    question = {
+        "question_id": "q1",
+        "text": "Preferred contact?",
+        "type": "single-select",
+        "answer_option_dict_list": [{"value": "email"}, {"value": "sms"}],
+    }
+
+    assert await agent._extract_answer_with_llm(question, "texting works") == (False, None, None)
+    assert await agent._extract_answer_with_llm(question, "texting works") == (True, "sms", "")
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_background_submission_is_flushed_on_cleanup(monkeypatch):
+    submitted = []
+
+    async def fake_submit(self, payload):
+        submitted.append(payload["answers"])
+        return {"success": True, "status": 200, "response": "ok"}
+
+    monkeypatch.setattr(GatherAgent, "_submit", fake_submit, raising=True)
+
+    agent = GatherAgent.create_advanced(
+        agent_id="gather_background_submit",
+        memory_manager=LocalMemory(),
+        llm_service=None,
+        config={"gather": {"background_submission": True}},
+    )
+    questionnaire = {"questions": [{"question_id": "q1", "text": "Name?", "type": "free-text"}]}
+
+    await agent.chat(json.dumps(questionnaire))
+    reply = await agent.chat("Ada")
+    assert "Submission: queued" in reply
+
+    await agent.cleanup_session()
+    assert submitted == [{"q1": "Ada"}]
+
+
+async def test_http_session_is_reused_and_closed_on_cleanup():
+    pytest.importorskip("aiohttp")
+
+    agent = GatherAgent.create_advanced(
+        agent_id="gather_http_session",
+        memory_manager=LocalMemory(),
+        llm_service=None,
+        config={"gather": {}},
+    )
+
+    session = await agent._get_http_session()
+    assert await agent._get_http_session() is session
+
+    await agent.cleanup_session()
+    assert session.closed
+
+
+def test_http_session_closed_when_its_loop_shuts_down():
+    pytest.importorskip("aiohttp")
+
+    agent = GatherAgent.create_advanced(
+        agent_id="gather_http_session_loops",
+        memory_manager=LocalMemory(),
+        llm_service=None,
+        config={"gather": {}},
+    )
+
+    first = asyncio.run(agent._get_http_session())
+    second = asyncio.run(agent._get_http_session())
+
+    assert first is not second
+    assert first.closed and second.closed
+
+
+async def test_load_questionnaire_skips_json_message():
+    agent = GatherAgent.create_advanced(
+        agent_id="gather_load_questionnaire",
+        memory_manager=LocalMemory(),
+        llm_service=None,
+        config={"gather": {}},
+    )
+
+    normalized = await agent.load_questionnaire(
+        [{"question_id": "q1", "text": "Name?", "type": "free-text"}]
+    )
+    assert normalized["questions"][0]["question_id"] == "q1"
+
+    first = await agent.chat("start")
+    assert "Name?" in first
+
+
+@pytest.mark.asyncio
+async def test_nl_answers_persist_across_agents(tmp_path):
+    calls = []
+
+    class CountingLLM(FakeLLM):
+        async def generate_response(self, prompt, context=None, system_message=None):
+            calls.append(prompt)
+            return '{"answer": ["aws", "gcp"]}'
+
+    question = {
+        "question_id": "q1",
+        "text": "Which clouds?",
+        "type": "multi-select",
+        "answer_option_dict_list": [{"value": "aws"}, {"value": "azure"}, {"value": "gcp"}],
+    }
+    config = {
+        "gather": {
+            "enable_natural_language_parsing": True,
+            "nl_answer_cache_path": str(tmp_path / "cache" / "answers.sqlite"),
+        }
+    }
+
+    first = GatherAgent.create_advanced(
+        agent_id="gather_persist_a", memory_manager=LocalMemory(), llm_service=CountingLLM([]),
+        config=config,
+    )
+    assert await first._extract_answer_with_llm(question, "the big two") == (True, ["aws", "gcp"], "")
+    await first.cleanup_session()
+
+    second = GatherAgent.create_advanced(
+        agent_id="gather_persist_b", memory_manager=LocalMemory(), llm_service=CountingLLM([]),
+        config=config,
+    )
+    assert await second._extract_answer_with_llm(question, "The big two!") == (True, ["aws", "gcp"], "")
+    assert len(calls) == 1
+    await second.cleanup_session()
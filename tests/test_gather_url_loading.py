@@ -85,8 +85,16 @@ async def test_gather_loads_questionnaire_from_url(monkeypatch):
         def ok(self):
             return 200 <= self.status_code < 300
 
+        def iter_content(self, chunk_size=1):
+            data = self.text.encode(self.encoding)
+            for i in range(0, len(data), chunk_size):
+                yield data[i : i + chunk_size]
+
+        def close(self):
+            pass
+
     # Monkeypatch requests.get to return our fake JSON
-    def fake_requests_get(url, timeout=15):
+    def fake_requests_get(url, timeout=15, stream=False):
         return FakeResp(json.dumps(questionnaire))
 
     # Patch in the requests module in base module scope
@@ -110,3 +110,22 @@ class TestCreateMemoryManager:
         """When Redis is unavailable, should fall back to InMemory"""
         mm = create_memory_manager("test_agent", redis_config={"host": "nonexistent", "port": 9999})
         assert isinstance(mm, InMemoryMemoryManager)
+
+
+class TestCountMessages:
+    def test_count_matches_stored_messages(self):
+        mm = InMemoryMemoryManager("test_agent")
+        assert mm.count_messages(conversation_id="conv1") == 0
+
+        for i in range(15):
+            mm.store_message(MockMessage(f"msg {i}", conversation_id="conv1"))
+        mm.store_message(MockMessage("other", conversation_id="conv2"))
+
+        assert mm.count_messages(conversation_id="conv1") == 15
+        assert mm.count_messages(conversation_id="conv2") == 1
+
+    def test_count_after_clear(self):
+        mm = InMemoryMemoryManager("test_agent")
+        mm.store_message(MockMessage("Hello", conversation_id="conv1"))
+        mm.clear_memory(conversation_id="conv1")
+        assert mm.count_messages(conversation_id="conv1") == 0
@@ -0,0 +1,59 @@
+"""Tests for the exact-match response cache in MultiProviderLLMService"""
+
+import pytest
+
+from ambivo_agents.core.llm import LLMResponse, MultiProviderLLMService
+
+
+class _CountingLLM:
+    model = "fake-model"
+
+    def __init__(self):
+        self.calls = 0
+
+    def invoke(self, prompt: str) -> LLMResponse:
+        self.calls += 1
+        return LLMResponse(f"answer {self.calls}")
+
+
+def _service(temperature, cache_size=8):
+    service = MultiProviderLLMService(
+        config_data={
+            "openai_api_key": "sk-test",
+            "temperature": temperature,
+            "response_cache_size": cache_size,
+        },
+        preferred_provider="openai",
+    )
+    service.current_llm = _CountingLLM()
+    return service
+
+
+class TestResponseCache:
+    async def test_deterministic_prompts_are_cached(self):
+        service = _service(temperature=0)
+
+        first = await service.generate_response("hello", system_message="be brief")
+        second = await service.generate_response("hello", system_message="be brief")
+        other = await service.generate_response("hello", system_message="be verbose")
+
+        assert first == second == "answer 1"
+        assert other == "answer 2"
+        assert service.current_llm.calls == 2
+
+    async def test_sampled_prompts_are_not_cached(self):
+        service = _service(temperature=0.7)
+
+        await service.generate_response("hello")
+        await service.generate_response("hello")
+
+        assert service.current_llm.calls == 2
+
+    async def test_cache_evicts_least_recently_used(self):
+        service = _service(temperature=0, cache_size=1)
+
+        await service.generate_response("a")
+        await service.generate_response("b")
+        await service.generate_response("a")
+
+        assert service.current_llm.calls == 3
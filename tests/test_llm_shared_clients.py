@@ -0,0 +1,99 @@
+"""Tests for DirectOpenAILLM / DirectAnthropicLLM client sharing and system blocks"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from ambivo_agents.core import llm
+from ambivo_agents.core.llm import DirectAnthropicLLM, DirectOpenAILLM
+
+
+@pytest.fixture(autouse=True)
+def _clean_shared_clients():
+    llm._SHARED_SYNC_CLIENTS.clear()
+    llm._SHARED_ASYNC_CLIENTS.clear()
+    yield
+    llm._SHARED_SYNC_CLIENTS.clear()
+    llm._SHARED_ASYNC_CLIENTS.clear()
+
+
+class TestSharedClients:
+    def test_sync_client_shared_per_api_key(self):
+        a = DirectOpenAILLM(model="gpt-4o", temperature=0.5, api_key="sk-one")
+        b = DirectOpenAILLM(model="gpt-4o", temperature=0.1, api_key="sk-one")
+        c = DirectOpenAILLM(model="gpt-4o", temperature=0.5, api_key="sk-two")
+
+        assert a.client is b.client
+        assert a.client is not c.client
+
+    async def test_async_client_shared_within_loop(self):
+        a = DirectAnthropicLLM(model="claude", temperature=0.5, api_key="ak-one")
+        b = DirectAnthropicLLM(model="claude", temperature=0.5, api_key="ak-one")
+
+        assert a.async_client is b.async_client
+
+    def test_async_client_not_reused_across_loops(self):
+        agent_llm = DirectOpenAILLM(model="gpt-4o", temperature=0.5, api_key="sk-one")
+
+        async def grab():
+            return agent_llm.async_client
+
+        first = asyncio.run(grab())
+        second = asyncio.run(grab())
+
+        assert first is not second
+
+    def test_async_client_closed_when_loop_shuts_down(self):
+        closed = []
+
+        class FakeAsyncClient:
+            async def close(self):
+                closed.append(self)
+
+        async def grab():
+            return llm._get_shared_async_client(("fake", "key"), FakeAsyncClient)
+
+        client = asyncio.run(grab())
+
+        assert closed == [client]
+
+
+class _RecordingCreate:
+    def __init__(self, response):
+        self.kwargs = None
+        self._response = response
+
+    def __call__(self, **kwargs):
+        self.kwargs = kwargs
+        return self._response
+
+
+class TestSystemBlock:
+    def test_anthropic_system_sent_as_cached_block(self):
+        agent_llm = DirectAnthropicLLM(model="claude", temperature=0.5, api_key="ak-one")
+        create = _RecordingCreate(SimpleNamespace(content=[SimpleNamespace(text="ok")]))
+        agent_llm.client = SimpleNamespace(messages=SimpleNamespace(create=create))
+
+        assert agent_llm.invoke("hi", system="be brief").content == "ok"
+        assert create.kwargs["system"] == [
+            {"type": "text", "text": "be brief", "cache_control": {"type": "ephemeral"}}
+        ]
+        assert create.kwargs["messages"] == [{"role": "user", "content": "hi"}]
+
+    def test_openai_system_message_comes_first(self):
+        agent_llm = DirectOpenAILLM(model="gpt-4o", temperature=0.5, api_key="sk-one")
+        message = SimpleNamespace(content="ok")
+        create = _RecordingCreate(SimpleNamespace(choices=[SimpleNamespace(message=message)]))
+        agent_llm.client = SimpleNamespace(
+            chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+        )
+
+        agent_llm.invoke("hi", system="be brief")
+        assert create.kwargs["messages"] == [
+            {"role": "system", "content": "be brief"},
+            {"role": "user", "content": "hi"},
+        ]
+
+        agent_llm.invoke("hi")
+        assert create.kwargs["messages"] == [{"role": "user", "content": "hi"}]
@@ -131,3 +131,31 @@ def test_slash_synthesis_prefix_strong_signal_fires():
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+# ---------------------------------------------------------------------------
+# Keyword analysis with precompiled routing patterns
+# ---------------------------------------------------------------------------
+
+def _bare_moderator(specialized_agents):
+    """A ModeratorAgent with only routing state set up (no __init__)."""
+    m = ModeratorAgent.__new__(ModeratorAgent)
+    m.specialized_agents = {name: object() for name in specialized_agents}
+    m._setup_routing_patterns()
+    return m
+
+
+def test_keyword_analysis_uses_compiled_patterns():
+    m = _bare_moderator(["web_scraper", "assistant"])
+    result = m._keyword_based_analysis("please scrape website data for me")
+    assert result["primary_agent"] == "web_scraper"
+    assert set(m._compiled_routing_patterns) == set(m.agent_routing_patterns)
+
+
+def test_replaced_routing_patterns_are_recompiled():
+    m = _bare_moderator(["web_scraper", "assistant"])
+    compiled = m._routing_regexes("web_scraper")
+    assert m._routing_regexes("web_scraper") is compiled
+
+    m.agent_routing_patterns["web_scraper"]["patterns"] = [r"harvest\s+pages"]
+    assert [r.pattern for r in m._routing_regexes("web_scraper")] == [r"harvest\s+pages"]
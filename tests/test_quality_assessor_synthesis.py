@@ -248,6 +248,53 @@ async def test_synthesize_strips_surrounding_whitespace_from_llm_output():
     assert result == "Answer with surrounding whitespace."
 
 
+# ---------------------------------------------------------------------------
+# Streaming synthesis
+# ---------------------------------------------------------------------------
+
+async def test_synthesize_streams_tokens_to_callback():
+    mock = _make_assessor(llm_return="not used when streaming")
+
+    async def stream(prompt, system_message=None):
+        for part in ["Streamed ", "answer."]:
+            yield part
+
+    mock.llm_service.generate_response_stream = stream
+    responses = [
+        SourceResponse(source=ResponseSource.WEB_SEARCH, content="x", confidence=0.5, metadata={})
+    ]
+    tokens = []
+
+    result = await ResponseQualityAssessor._synthesize_response(
+        mock, "Q?", responses, {}, on_token=tokens.append
+    )
+
+    assert tokens == ["Streamed ", "answer."]
+    assert result == "Streamed answer."
+    assert not mock.llm_service.generate_response.called
+
+
+async def test_synthesize_stream_failure_sends_fallback_to_callback():
+    mock = _make_assessor()
+
+    async def stream(prompt, system_message=None):
+        raise RuntimeError("stream dropped")
+        yield  # pragma: no cover
+
+    mock.llm_service.generate_response_stream = stream
+    responses = [
+        SourceResponse(source=ResponseSource.KNOWLEDGE_BASE, content="raw", confidence=0.9, metadata={})
+    ]
+    tokens = []
+
+    result = await ResponseQualityAssessor._synthesize_response(
+        mock, "Q?", responses, {}, on_token=tokens.append
+    )
+
+    assert result == "raw"
+    assert tokens == ["raw"]
+
+
 # ---------------------------------------------------------------------------
 # assess_response integration — ensures LOW-quality responses still go through
 # the LLM synthesis path (the second short-circuit fix shipped in v2.0.7)
@@ -125,5 +125,26 @@ async def test_stream_synthesis_exception_propagates():
         await _consume_stream(gen)
 
 
+async def test_stream_forwards_synthesis_tokens_as_content():
+    """Tokens reported through on_token are streamed as they arrive instead of
+    re-chunking the finished response."""
+    mock = MagicMock(spec=KnowledgeSynthesisAgent)
+    mock.agent_id = "test_agent"
+
+    async def streaming_synthesis(query, prefs, on_token=None):
+        for part in ["Hello ", "world"]:
+            on_token(part)
+            await asyncio.sleep(0)
+        return {'response': 'Hello world', 'quality_assessment': {},
+                'query_analysis': {}, 'metadata': {}}
+
+    mock.process_with_quality_assessment = AsyncMock(side_effect=streaming_synthesis)
+
+    chunks = await _consume_stream(KnowledgeSynthesisAgent.process_message_stream(mock, "query"))
+
+    content = [c.text for c in chunks if c.sub_type == StreamSubType.CONTENT]
+    assert content == ["Hello ", "world"]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,25 @@
+"""Tests for inline source-preference detection in KnowledgeSynthesisAgent"""
+
+import pytest
+
+from ambivo_agents.agents.knowledge_synthesis import _detect_source_preference
+
+
+@pytest.mark.parametrize(
+    "message, expected",
+    [
+        ("Please prioritize web search for this", "web_search"),
+        ("Can you Search The Web for Rust news?", "web_search"),
+        ("check knowledge base first: pricing?", "knowledge_base"),
+        ("Do a comprehensive search on fusion", "all"),
+        ("What is machine learning?", None),
+    ],
+)
+def test_detects_preference(message, expected):
+    assert _detect_source_preference(message) == expected
+
+
+def test_web_search_takes_precedence():
+    # Overlapping phrases: "comprehensive search" and "search the web"
+    assert _detect_source_preference("comprehensive search the web please") == "web_search"
+    assert _detect_source_preference("check knowledge base and check all sources") == "knowledge_base"
@@ -389,5 +389,30 @@ def test_format_search_results_snippet_preview_length_is_400():
     assert x_count == 400, f"expected 400 x chars, got {x_count} (old cap was 150)"
 
 
+# ---------------------------------------------------------------------------
+# Connection reuse across searches
+# ---------------------------------------------------------------------------
+
+
+async def test_provider_searches_share_one_http_session(monkeypatch):
+    from ambivo_agents.agents import web_search
+
+    monkeypatch.setattr(web_search, "_HTTP_SESSION", None)
+    assert web_search._http_session() is web_search._http_session()
+
+    response = MagicMock(status_code=200, headers={})
+    response.json.return_value = {"web": {"results": [{"title": "T", "url": "https://a"}]}}
+    session = MagicMock()
+    session.get.return_value = response
+    monkeypatch.setattr(web_search, "_HTTP_SESSION", session)
+
+    adapter = _adapter_stub()
+    adapter.providers = {"brave": {"api_key": "x", "base_url": "https://brave"}}
+    await adapter._search_brave("first", max_results=5, country="US")
+    await adapter._search_brave("second", max_results=5, country="US")
+
+    assert session.get.call_count == 2
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])